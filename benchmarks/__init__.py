@@ -0,0 +1 @@
+"""Benchmarks for Synthetic Home integration."""
@@ -0,0 +1,154 @@
+"""Fixtures for Synthetic Home benchmarks.
+
+Benchmarks are not collected with the tests and are run explicitly with
+`pytest benchmarks`. Results are written as json so they can be compared
+across runs to track regressions.
+"""
+
+import json
+import pathlib
+import platform
+import time
+import tracemalloc
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.synthetic_home.cache import ParsedHomeCache
+
+from script.benchmark.generate import generate_inventory
+
+SIZES = [100, 1000, 10000, 50000]
+"""Number of entities in the generated homes."""
+
+DEFAULT_OUTPUT = "benchmark-results.json"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add benchmark command line options."""
+    parser.addoption(
+        "--benchmark-output",
+        default=DEFAULT_OUTPUT,
+        help="The json file where benchmark results are written.",
+    )
+    parser.addoption(
+        "--benchmark-max-entities",
+        type=int,
+        default=max(SIZES),
+        help="Skip generated homes larger than this number of entities.",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize benchmarks over the generated home sizes.
+
+    Benchmarks that parametrize `num_entities` themselves are left alone.
+    """
+    for marker in metafunc.definition.iter_markers("parametrize"):
+        argnames = marker.args[0] if marker.args else marker.kwargs.get("argnames")
+        if isinstance(argnames, str):
+            argnames = [name.strip() for name in argnames.split(",")]
+        if "num_entities" in argnames:
+            return
+    if "num_entities" in metafunc.fixturenames:
+        max_entities = metafunc.config.getoption("--benchmark-max-entities")
+        metafunc.parametrize(
+            "num_entities", [size for size in SIZES if size <= max_entities]
+        )
+
+
+class BenchmarkResults:
+    """Collects the results of benchmarks in a session."""
+
+    def __init__(self) -> None:
+        """Initialize BenchmarkResults."""
+        self.results: list[dict[str, Any]] = []
+
+    @contextmanager
+    def measure(self, benchmark: str, **params: Any) -> Generator[None, None, None]:
+        """Record the elapsed time and peak traced memory of a block.
+
+        Memory tracing slows down the measured code, so times are only
+        comparable with other runs of the benchmarks.
+        """
+        tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        self.results.append(
+            {
+                "benchmark": benchmark,
+                **params,
+                "seconds": elapsed,
+                "peak_bytes": peak,
+            }
+        )
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(
+    request: pytest.FixtureRequest,
+) -> Generator[BenchmarkResults, None, None]:
+    """Fixture that writes the benchmark results at the end of the session."""
+    results = BenchmarkResults()
+    yield results
+    output = pathlib.Path(request.config.getoption("--benchmark-output"))
+    output.write_text(
+        json.dumps(
+            {
+                "python": platform.python_version(),
+                "timestamp": time.time(),
+                "results": results.results,
+            },
+            indent=2,
+        )
+    )
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    enable_custom_integrations: None,
+) -> Generator[None, None, None]:
+    """Enable custom integration."""
+    _ = enable_custom_integrations  # unused
+    yield
+
+
+@pytest.fixture(name="platforms")
+def mock_platforms() -> list[str] | None:
+    """Fixture for the platforms in the generated home, or None for all."""
+    return None
+
+
+@pytest.fixture(name="config_yaml")
+def mock_config_yaml(num_entities: int, platforms: list[str] | None) -> str:
+    """Fixture for the yaml content of a generated home."""
+    return generate_inventory(num_entities, platforms=platforms).yaml()
+
+
+@pytest.fixture(autouse=True)
+def mock_config_content(config_yaml: str) -> Generator[None, None, None]:
+    """Mock out the yaml config file contents."""
+    with patch(
+        "synthetic_home.inventory.read_config_content",
+        return_value=config_yaml,
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def mock_home_cache(tmp_path: pathlib.Path) -> Generator[ParsedHomeCache, None, None]:
+    """Store the parsed home cache in a temporary directory."""
+    home_cache = ParsedHomeCache(tmp_path / "cache")
+    with patch(
+        "custom_components.synthetic_home.get_home_cache",
+        return_value=home_cache,
+    ):
+        yield home_cache
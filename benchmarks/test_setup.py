@@ -0,0 +1,79 @@
+"""Benchmarks for setting up, reloading and unloading a synthetic home."""
+
+import pathlib
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.synthetic_home import PLATFORMS, async_reload_entry
+from custom_components.synthetic_home.const import CONF_FILENAME, DOMAIN
+from custom_components.synthetic_home.model import parse_home_config
+
+from .conftest import BenchmarkResults
+
+PLATFORM_ENTITIES = 1000
+"""Number of entities used when benchmarking a single platform."""
+
+
+async def test_parse_home_config(
+    num_entities: int, benchmark_results: BenchmarkResults
+) -> None:
+    """Benchmark parsing a home config."""
+    with benchmark_results.measure("parse_home_config", entities=num_entities):
+        synthetic_home = parse_home_config(pathlib.Path("example.yaml"))
+    assert len(synthetic_home.entities) == num_entities
+
+
+async def test_setup_reload_unload(
+    hass: HomeAssistant, num_entities: int, benchmark_results: BenchmarkResults
+) -> None:
+    """Benchmark setting up, reloading and unloading a config entry."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data={CONF_FILENAME: "example.yaml"})
+    config_entry.add_to_hass(hass)
+    assert await async_setup_component(hass, "homeassistant", {})
+
+    with benchmark_results.measure("async_setup_entry", entities=num_entities):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert len(hass.states.async_entity_ids()) >= num_entities
+
+    with benchmark_results.measure("incremental_reload", entities=num_entities):
+        await async_reload_entry(hass, config_entry)
+        await hass.async_block_till_done()
+
+    with benchmark_results.measure("reload", entities=num_entities):
+        assert await hass.config_entries.async_reload(config_entry.entry_id)
+        await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.LOADED
+
+    with benchmark_results.measure("unload", entities=num_entities):
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.NOT_LOADED
+
+
+@pytest.mark.parametrize("num_entities", [PLATFORM_ENTITIES])
+@pytest.mark.parametrize("platforms", [[platform] for platform in PLATFORMS])
+async def test_platform_setup(
+    hass: HomeAssistant,
+    num_entities: int,
+    platforms: list[str],
+    benchmark_results: BenchmarkResults,
+) -> None:
+    """Benchmark setting up a home that only contains a single platform."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data={CONF_FILENAME: "example.yaml"})
+    config_entry.add_to_hass(hass)
+    assert await async_setup_component(hass, "homeassistant", {})
+
+    with benchmark_results.measure(
+        "platform_setup", platform=platforms[0], entities=num_entities
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.LOADED
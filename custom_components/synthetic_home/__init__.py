@@ -5,29 +5,134 @@ https://github.com/allenporter/synthetic-home
 """
 
 import logging
-from datetime import timedelta
 import pathlib
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import Any
 
+import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryError
+from homeassistant.components.conversation import DOMAIN as CONVERSATION_DOMAIN
+from homeassistant.components.homeassistant.exposed_entities import async_expose_entity
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID, SERVICE_RELOAD, Platform
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import (
+    ConfigEntryError,
+    HomeAssistantError,
+    Unauthorized,
+    UnknownUser,
+)
 from homeassistant.helpers import (
     area_registry as ar,
+    config_validation as cv,
     device_registry as dr,
+    entity_platform,
+    entity_registry as er,
     floor_registry as fr,
+    service,
 )
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, CONF_FILENAME
-from .model import parse_home_config
+from .cache import get_home_cache
+from .checkpoint import (
+    async_get_checkpoints,
+    async_get_or_create_checkpoints,
+    async_remove_checkpoints,
+)
+from .clock import async_get_clock, async_remove_clock
+from .coalesce import async_set_coalescer
+from .const import (
+    ATTR_DEVICE,
+    ATTR_DEVICE_STATE,
+    ATTR_DEVICE_TYPE,
+    ATTR_DURATION,
+    ATTR_NAME,
+    ATTR_SPEED,
+    CONF_COALESCE_WINDOW,
+    CONF_COALESCE_WRITES,
+    DEFAULT_COALESCE_WINDOW,
+    DOMAIN,
+    CONF_FILENAME,
+    DEFAULT_CHECKPOINT,
+    SERVICE_ADVANCE_CLOCK,
+    SERVICE_LOAD_SCENARIO,
+    SERVICE_RESTORE_CHECKPOINT,
+    SERVICE_SAVE_CHECKPOINT,
+    SERVICE_SET_CLOCK_SPEED,
+    SERVICE_SET_DEVICE_STATE,
+)
+from .model import (
+    ParsedEntity,
+    ParsedHome,
+    async_parse_home_config,
+    config_file_path,
+    diff_homes,
+)
+from .scenario import (
+    async_apply_entities,
+    async_config_entry_entities,
+    parse_device_state,
+)
 
+from synthetic_home import device_types
 from synthetic_home.exceptions import SyntheticHomeError
 
 SCAN_INTERVAL = timedelta(seconds=30)
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+RELOAD_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+ADVANCE_CLOCK_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_DURATION): cv.positive_time_period,
+    }
+)
+
+SET_CLOCK_SPEED_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_SPEED): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+SET_DEVICE_STATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_DEVICE): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_DEVICE_TYPE): cv.string,
+        vol.Required(ATTR_DEVICE_STATE): cv.string,
+    }
+)
+
+LOAD_SCENARIO_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(CONF_FILENAME): cv.string,
+    }
+)
+
+CHECKPOINT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_NAME, default=DEFAULT_CHECKPOINT): cv.string,
+    }
+)
+
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -47,58 +152,315 @@ PLATFORMS: list[Platform] = [
 ]
 
 
-# https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up this integration using UI."""
-    hass.data.setdefault(DOMAIN, {})
+def _home_platforms(synthetic_home: ParsedHome) -> list[Platform]:
+    """Return the platforms that have at least one entity in the home."""
+    return [
+        platform
+        for platform in PLATFORMS
+        if synthetic_home.entities_for_platform(platform)
+    ]
 
-    filename = entry.data[CONF_FILENAME]
-    if filename.startswith("/"):
-        config_file = pathlib.Path(filename)
-    else:
-        config_file = pathlib.Path(hass.config.path(filename))
-    try:
-        synthetic_home = parse_home_config(config_file)
-    except SyntheticHomeError as err:
-        raise ConfigEntryError from err
 
-    hass.data[DOMAIN][entry.entry_id] = synthetic_home
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the synthetic home services."""
+    # Warm up the device type registry used by platforms and services
+    hass.async_create_background_task(
+        hass.async_add_executor_job(device_types.load_device_type_registry),
+        f"{DOMAIN} load device types",
+    )
+
+    async def async_reload_service(call: ServiceCall) -> None:
+        """Apply changes in the config file of loaded synthetic homes."""
+        entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            if entry_id is not None and entry.entry_id != entry_id:
+                continue
+            if entry.state is ConfigEntryState.LOADED:
+                await async_reload_entry(hass, entry)
+
+    service.async_register_admin_service(
+        hass, DOMAIN, SERVICE_RELOAD, async_reload_service, schema=RELOAD_SCHEMA
+    )
+
+    @callback
+    def async_loaded_entry(call: ServiceCall) -> ConfigEntry:
+        """Return the loaded config entry targeted by a service call."""
+        entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry is None or entry.domain != DOMAIN:
+            raise HomeAssistantError(f"Synthetic home '{entry_id}' does not exist")
+        if entry.state is not ConfigEntryState.LOADED:
+            raise HomeAssistantError(f"Synthetic home '{entry_id}' is not loaded")
+        return entry
+
+    @callback
+    def async_advance_clock_service(call: ServiceCall) -> None:
+        """Step the virtual clock of a synthetic home forward."""
+        entry = async_loaded_entry(call)
+        async_get_clock(hass, entry.entry_id).async_advance(call.data[ATTR_DURATION])
+
+    @callback
+    def async_set_clock_speed_service(call: ServiceCall) -> None:
+        """Change the rate of the virtual clock of a synthetic home."""
+        entry = async_loaded_entry(call)
+        async_get_clock(hass, entry.entry_id).async_set_speed(call.data[ATTR_SPEED])
+
+    async def async_set_device_state_service(call: ServiceCall) -> ServiceResponse:
+        """Apply a named device state to devices in a synthetic home."""
+        await _async_check_admin(hass, call)
+        entry = async_loaded_entry(call)
+        synthetic_home: ParsedHome = hass.data[DOMAIN][entry.entry_id]
+        devices = {device.unique_id: device for device in synthetic_home.devices}
+        if unknown := [
+            device_id
+            for device_id in call.data[ATTR_DEVICE]
+            if device_id not in devices
+        ]:
+            raise HomeAssistantError(f"Synthetic home has no devices {unknown}")
+
+        def parse_entities() -> list[ParsedEntity]:
+            return [
+                entity
+                for device_id in call.data[ATTR_DEVICE]
+                for entity in parse_device_state(
+                    devices[device_id],
+                    call.data[ATTR_DEVICE_TYPE],
+                    call.data[ATTR_DEVICE_STATE],
+                )
+            ]
+
+        try:
+            entities = await hass.async_add_executor_job(parse_entities)
+        except (SyntheticHomeError, ValueError) as err:
+            raise HomeAssistantError(f"Unable to apply device state: {err}") from err
+        changed = async_apply_entities(hass, entry, entities)
+        return {"changed_entities": changed}
+
+    async def async_load_scenario_service(call: ServiceCall) -> ServiceResponse:
+        """Apply the entity states in an inventory file to a synthetic home."""
+        await _async_check_admin(hass, call)
+        entry = async_loaded_entry(call)
+        config_file = config_file_path(hass, call.data[CONF_FILENAME])
+        config_dir = pathlib.Path(hass.config.config_dir).resolve()
+        in_config_dir = config_file.resolve().is_relative_to(config_dir)
+        if not in_config_dir and not hass.config.is_allowed_path(str(config_file)):
+            raise HomeAssistantError(
+                f"Scenario file '{config_file}' is not in the config directory"
+            )
+        try:
+            scenario = await async_parse_home_config(hass, config_file)
+        except (SyntheticHomeError, ValueError) as err:
+            raise HomeAssistantError(f"Unable to load scenario: {err}") from err
+        changed = async_apply_entities(hass, entry, scenario.entities)
+        return {"changed_entities": changed}
+
+    async def async_save_checkpoint_service(call: ServiceCall) -> None:
+        """Save the state of all entities in a synthetic home."""
+        await _async_check_admin(hass, call)
+        entry = async_loaded_entry(call)
+        async_get_or_create_checkpoints(hass, entry.entry_id).async_save(
+            call.data[ATTR_NAME], async_config_entry_entities(hass, entry)
+        )
+
+    async def async_restore_checkpoint_service(call: ServiceCall) -> ServiceResponse:
+        """Restore the entities in a synthetic home that changed since a checkpoint."""
+        await _async_check_admin(hass, call)
+        entry = async_loaded_entry(call)
+        name = call.data[ATTR_NAME]
+        checkpoints = async_get_checkpoints(hass, entry.entry_id)
+        if checkpoints is None or name not in checkpoints:
+            raise HomeAssistantError(f"Synthetic home has no checkpoint '{name}'")
+        changed = checkpoints.async_restore(
+            name, async_config_entry_entities(hass, entry)
+        )
+        return {"changed_entities": changed}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SAVE_CHECKPOINT,
+        async_save_checkpoint_service,
+        schema=CHECKPOINT_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE_CHECKPOINT,
+        async_restore_checkpoint_service,
+        schema=CHECKPOINT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_DEVICE_STATE,
+        async_set_device_state_service,
+        schema=SET_DEVICE_STATE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LOAD_SCENARIO,
+        async_load_scenario_service,
+        schema=LOAD_SCENARIO_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    service.async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_ADVANCE_CLOCK,
+        async_advance_clock_service,
+        schema=ADVANCE_CLOCK_SCHEMA,
+    )
+    service.async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_SET_CLOCK_SPEED,
+        async_set_clock_speed_service,
+        schema=SET_CLOCK_SPEED_SCHEMA,
+    )
+    return True
+
+
+async def _async_check_admin(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Raise if a service call was not made by an admin user.
+
+    This is the check done by `service.async_register_admin_service`, for
+    services that return a response which that helper does not support.
+    """
+    if call.context.user_id:
+        user = await hass.auth.async_get_user(call.context.user_id)
+        if user is None:
+            raise UnknownUser(context=call.context)
+        if not user.is_admin:
+            raise Unauthorized(context=call.context)
+
+
+async def _async_load_home(hass: HomeAssistant, entry: ConfigEntry) -> ParsedHome:
+    """Load the synthetic home for the config entry from disk."""
+    config_file = config_file_path(hass, entry.data[CONF_FILENAME])
+    return await async_parse_home_config(hass, config_file, get_home_cache(hass))
+
+
+@callback
+def _async_update_registries(
+    hass: HomeAssistant, entry: ConfigEntry, synthetic_home: ParsedHome
+) -> None:
+    """Create the floors, areas and devices in the home if they do not exist.
+
+    Entries that are already up to date are skipped without a registry
+    mutation. New areas are created on their floor and existing devices are
+    indexed up front so a device is only updated when it changed.
+    """
 
     # Create all floors
     floor_registry = fr.async_get(hass)
     floor_ids = {}
     for floor_name in synthetic_home.floors:
-        floor_entry = floor_registry.async_create(floor_name)
+        if (floor_entry := floor_registry.async_get_floor_by_name(floor_name)) is None:
+            floor_entry = floor_registry.async_create(floor_name)
+            _LOGGER.debug("Created floor %s (id=%s)", floor_name, floor_entry.floor_id)
         floor_ids[floor_name] = floor_entry.floor_id
-        _LOGGER.debug("Created floor %s (id=%s)", floor_name, floor_entry.floor_id)
 
-    # Create all areas in the home and assign devices to them
+    # Create all areas in the home and assign them to floors
     area_registry = ar.async_get(hass)
     area_ids = {}
     for area in synthetic_home.areas:
-        area_entry = area_registry.async_get_or_create(area.name)
-        if area.floor_name and (floor_id := floor_ids.get(area.floor_name)) is not None:
+        floor_id = floor_ids.get(area.floor_name) if area.floor_name else None
+        if (area_entry := area_registry.async_get_area_by_name(area.name)) is None:
+            area_entry = area_registry.async_create(area.name, floor_id=floor_id)
+            _LOGGER.debug("Created area %s (id=%s)", area.name, area_entry.id)
+        elif floor_id is not None and area_entry.floor_id != floor_id:
             area_registry.async_update(area_entry.id, floor_id=floor_id)
         area_ids[area.name] = area_entry.id
-        _LOGGER.debug("Created area %s (id=%s)", area.name, area_entry.id)
 
+    # Create all devices and assign them to areas
     device_registry = dr.async_get(hass)
-    for device in synthetic_home.devices:
-        _LOGGER.debug(
-            "Creating device %s with unique_id %s",
-            device.name,
-            device.unique_id,
-        )
-        device_entry = device_registry.async_get_or_create(
-            config_entry_id=entry.entry_id,
-            name=device.name,
-            identifiers={(DOMAIN, device.unique_id)},
+    device_entries = {
+        identifier: device_entry
+        for device_entry in dr.async_entries_for_config_entry(
+            device_registry, entry.entry_id
         )
-        if device.area_name:
-            area_id = area_ids[device.area_name]
-            device_registry.async_update_device(device_entry.id, area_id=area_id)
+        for identifier in device_entry.identifiers
+    }
+    for device in synthetic_home.devices:
+        identifier = (DOMAIN, device.unique_id)
+        area_id = area_ids[device.area_name] if device.area_name else None
+        changes: dict[str, Any] = {}
+        if (device_entry := device_entries.get(identifier)) is None:
+            _LOGGER.debug(
+                "Creating device %s with unique_id %s",
+                device.name,
+                device.unique_id,
+            )
+            device_entry = device_registry.async_get_or_create(
+                config_entry_id=entry.entry_id,
+                name=device.name,
+                identifiers={identifier},
+            )
+        elif device_entry.name != device.name:
+            changes["name"] = device.name
+        if area_id is not None and device_entry.area_id != area_id:
+            changes["area_id"] = area_id
+        if changes:
+            device_registry.async_update_device(device_entry.id, **changes)
+
+
+@callback
+def _async_update_coalescer(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Enable or disable coalesced state writes from the config entry options."""
+    window: float | None = None
+    if entry.options.get(CONF_COALESCE_WRITES):
+        window = entry.options.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW)
+    async_set_coalescer(hass, entry.entry_id, window)
+
+
+@callback
+def _async_update_entities(
+    hass: HomeAssistant, entities: Iterable[ParsedEntity]
+) -> None:
+    """Expose entities to conversation and assign areas to entities without a device.
+
+    This runs once for all entities after the platforms have added them so
+    that entities already exposed or already in their area are skipped.
+    """
+    area_registry = ar.async_get(hass)
+    entity_registry = er.async_get(hass)
+    area_ids: dict[str, str] = {}
+    for entity in entities:
+        if (registry_entry := entity_registry.async_get(entity.entity_id)) is None:
+            continue
+        # Expose all synthetic home entities by default
+        if not registry_entry.options.get(CONVERSATION_DOMAIN, {}).get("should_expose"):
+            async_expose_entity(hass, CONVERSATION_DOMAIN, entity.entity_id, True)
+        # Add areas for entities that specify an area without a device
+        if entity.device_info is not None or not entity.area_name:
+            continue
+        if (area_id := area_ids.get(entity.area_name)) is None:
+            area_id = area_registry.async_get_or_create(entity.area_name).id
+            area_ids[entity.area_name] = area_id
+        if registry_entry.area_id != area_id:
+            entity_registry.async_update_entity(entity.entity_id, area_id=area_id)
+
+
+# https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up this integration using UI."""
+    hass.data.setdefault(DOMAIN, {})
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    try:
+        synthetic_home = await _async_load_home(hass, entry)
+    except SyntheticHomeError as err:
+        raise ConfigEntryError from err
+
+    hass.data[DOMAIN][entry.entry_id] = synthetic_home
+
+    _async_update_registries(hass, entry, synthetic_home)
+    _async_update_coalescer(hass, entry)
+
+    platforms = _home_platforms(synthetic_home)
+    if skipped := [platform for platform in PLATFORMS if platform not in platforms]:
+        _LOGGER.debug("Skipping platforms with no entities: %s", skipped)
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
+    _async_update_entities(hass, synthetic_home.entities)
+    synthetic_home.compact()
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
@@ -106,11 +468,80 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
-    if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+    synthetic_home: ParsedHome = hass.data[DOMAIN][entry.entry_id]
+    platforms = _home_platforms(synthetic_home)
+    async_set_coalescer(hass, entry.entry_id, None)
+    if unloaded := await hass.config_entries.async_unload_platforms(entry, platforms):
         hass.data[DOMAIN].pop(entry.entry_id)
+        async_remove_clock(hass, entry.entry_id)
+        async_remove_checkpoints(hass, entry.entry_id)
     return unloaded
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Reload config entry.
+
+    The updated home is compared with the loaded home and only the entities
+    and devices that changed are added, removed or replaced. Entities that did
+    not change keep their current state. A full reload is performed when the
+    set of platforms used by the home changes.
+    """
+    loaded_home: ParsedHome = hass.data[DOMAIN][entry.entry_id]
+    _async_update_coalescer(hass, entry)
+    try:
+        synthetic_home = await _async_load_home(hass, entry)
+    except SyntheticHomeError as err:
+        raise HomeAssistantError(f"Unable to reload synthetic home: {err}") from err
+
+    if _home_platforms(synthetic_home) != _home_platforms(loaded_home):
+        _LOGGER.debug("Platforms in the home changed, reloading config entry")
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    diff = diff_homes(loaded_home, synthetic_home)
+    hass.data[DOMAIN][entry.entry_id] = synthetic_home
+    _async_update_registries(hass, entry, synthetic_home)
+
+    device_registry = dr.async_get(hass)
+    for device in diff.removed_devices:
+        if device_entry := device_registry.async_get_device(
+            identifiers={(DOMAIN, device.unique_id)}
+        ):
+            device_registry.async_update_device(
+                device_entry.id, remove_config_entry_id=entry.entry_id
+            )
+
+    entity_registry = er.async_get(hass)
+    for entity in diff.removed_entities:
+        if entity_registry.async_get(entity.entity_id):
+            entity_registry.async_remove(entity.entity_id)
+
+    for platform in entity_platform.async_get_platforms(hass, DOMAIN):
+        if platform.config_entry is not entry:
+            continue
+        changed = [
+            entity
+            for entity in diff.changed_entities
+            if entity.platform == platform.domain
+        ]
+        added = [
+            entity
+            for entity in diff.added_entities
+            if entity.platform == platform.domain
+        ]
+        if not changed and not added:
+            continue
+        for entity in changed:
+            await platform.async_remove_entity(entity.entity_id)
+        create_entity = getattr(platform.platform, "create_entity")
+        await platform.async_add_entities(
+            [create_entity(entity) for entity in changed + added]
+        )
+    _async_update_entities(hass, diff.changed_entities + diff.added_entities)
+    synthetic_home.compact()
+    _LOGGER.debug(
+        "Reloaded home with %d added, %d changed and %d removed entities",
+        len(diff.added_entities),
+        len(diff.changed_entities),
+        len(diff.removed_entities),
+    )
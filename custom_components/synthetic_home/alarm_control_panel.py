@@ -34,13 +34,17 @@ async def async_setup_entry(
     synthetic_home = hass.data[DOMAIN][entry.entry_id]
 
     async_add_devices(
-        SyntheticHomeAlarmControlPanel(
-            entity,
-            state=entity.state,
-            **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
-        )
-        for entity in synthetic_home.entities
-        if entity.platform == ALARM_CONTROL_PANEL_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(ALARM_CONTROL_PANEL_DOMAIN)
+    )
+
+
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a alarm control panel entity from a parsed entity."""
+    return SyntheticHomeAlarmControlPanel(
+        entity,
+        state=entity.state,
+        **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
     )
 
 
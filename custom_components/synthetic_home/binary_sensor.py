@@ -30,13 +30,17 @@ async def async_setup_entry(
     synthetic_home = hass.data[DOMAIN][entry.entry_id]
 
     async_add_devices(
-        SyntheticHomeBinarySensor(
-            entity,
-            state=entity.state,
-            **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
-        )
-        for entity in synthetic_home.entities
-        if entity.platform == BINARY_SENSOR_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(BINARY_SENSOR_DOMAIN)
+    )
+
+
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a binary sensor entity from a parsed entity."""
+    return SyntheticHomeBinarySensor(
+        entity,
+        state=entity.state,
+        **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
     )
 
 
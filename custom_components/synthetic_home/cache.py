@@ -0,0 +1,108 @@
+"""On-disk cache of parsed synthetic homes.
+
+Parsing a home decodes the inventory yaml and resolves every supported
+feature enum, which is wasted work when the same unchanged home is set up
+or reloaded repeatedly. The fully parsed home is pickled to disk keyed by a
+hash of the config file content and the synthetic-home library version so
+that unchanged homes can skip parsing entirely.
+"""
+
+import hashlib
+import importlib.metadata
+import logging
+import pathlib
+import pickle
+from functools import cache
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 3
+"""Version of the cached format, bumped when the parsed model changes."""
+
+LIBRARY_NAME = "synthetic-home"
+
+_LOAD_ERRORS = (
+    OSError,
+    EOFError,
+    pickle.UnpicklingError,
+    AttributeError,
+    ImportError,
+    TypeError,
+    ValueError,
+)
+
+
+@cache
+def _library_version() -> str:
+    """Return the installed synthetic-home library version."""
+    try:
+        return importlib.metadata.version(LIBRARY_NAME)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def cache_key(content: str) -> str:
+    """Return the cache key for the specified config file content."""
+    hash = hashlib.sha256()
+    hash.update(f"{CACHE_VERSION}:{_library_version()}:".encode())
+    hash.update(content.encode())
+    return hash.hexdigest()
+
+
+class ParsedHomeCache:
+    """A cache of parsed homes stored in a directory on disk.
+
+    Each config file has a single cache file, so the cache stays bounded
+    as a home is edited. The stored key is compared on load and a stale
+    entry is treated as a miss and overwritten on the next save.
+
+    These methods perform blocking I/O and must be run in the executor.
+    """
+
+    def __init__(self, cache_dir: pathlib.Path) -> None:
+        """Initialize ParsedHomeCache."""
+        self._cache_dir = cache_dir
+
+    def _cache_file(self, config_file: pathlib.Path) -> pathlib.Path:
+        """Return the cache file used for the specified config file."""
+        name = hashlib.sha256(str(config_file).encode()).hexdigest()
+        return self._cache_dir / f"{name}.pickle"
+
+    def load(self, config_file: pathlib.Path, key: str) -> Any | None:
+        """Return the cached value for the config file or None on a miss."""
+        cache_file = self._cache_file(config_file)
+        try:
+            with cache_file.open("rb") as f:
+                cached_key, value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except _LOAD_ERRORS as err:
+            _LOGGER.debug("Ignoring unreadable cache file %s: %s", cache_file, err)
+            return None
+        if cached_key != key:
+            _LOGGER.debug("Cache file %s is stale for %s", cache_file, config_file)
+            return None
+        return value
+
+    def save(self, config_file: pathlib.Path, key: str, value: Any) -> None:
+        """Store the value for the config file in the cache."""
+        cache_file = self._cache_file(config_file)
+        tmp_file = cache_file.with_suffix(".tmp")
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with tmp_file.open("wb") as f:
+                pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_file.replace(cache_file)
+        except (OSError, pickle.PicklingError) as err:
+            _LOGGER.warning("Unable to write cache file %s: %s", cache_file, err)
+
+
+def get_home_cache(hass: HomeAssistant) -> ParsedHomeCache:
+    """Return the parsed home cache stored in the Home Assistant storage dir."""
+    return ParsedHomeCache(pathlib.Path(hass.config.path(STORAGE_DIR, DOMAIN)))
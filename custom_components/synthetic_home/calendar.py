@@ -3,9 +3,11 @@
 import datetime
 import logging
 from typing import Any
+import uuid
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.components.calendar import (
     CalendarEntity,
     CalendarEntityFeature,
@@ -13,10 +15,10 @@ from homeassistant.components.calendar import (
     DOMAIN as CALENDAR_DOMAIN,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .entity import SyntheticEntity
+from .event_store import EventStore
 from .model import ParsedEntity, filter_attributes
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,11 +38,15 @@ async def async_setup_entry(
     synthetic_home = hass.data[DOMAIN][entry.entry_id]
 
     async_add_devices(
-        SyntheticCalendarEntity(
-            entity, **filter_attributes(entity, SUPPORTED_ATTRIBUTES)
-        )
-        for entity in synthetic_home.entities
-        if entity.platform == CALENDAR_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(CALENDAR_DOMAIN)
+    )
+
+
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a calendar entity from a parsed entity."""
+    return SyntheticCalendarEntity(
+        entity, **filter_attributes(entity, SUPPORTED_ATTRIBUTES)
     )
 
 
@@ -59,10 +65,14 @@ DATETIME_FIELDS = {
 }
 
 
-def create_event(attributes: dict[str, Any]) -> CalendarEvent:
-    """Create a calendar event from the specified attributes."""
-    fields = {}
-    for attribute in ("summary", "description", "location"):
+def create_event(attributes: dict[str, Any], uid: str | None = None) -> CalendarEvent:
+    """Create a calendar event from the specified attributes.
+
+    The uid is taken from the attributes, then the uid argument, and a new
+    random uid is generated when neither is set.
+    """
+    fields = {"uid": attributes.get("uid") or uid or str(uuid.uuid4())}
+    for attribute in ("summary", "description", "location", "rrule"):
         if value := attributes.get(attribute):
             fields[attribute] = value
     for from_field, to_field in DATETIME_FIELDS.items():
@@ -79,6 +89,7 @@ def create_event(attributes: dict[str, Any]) -> CalendarEvent:
 class SyntheticCalendarEntity(SyntheticEntity, CalendarEntity):
     """synthetic_home calendar class."""
 
+    _state_attributes = ("_events",)
     _attr_reports_position = False
 
     def __init__(
@@ -94,16 +105,21 @@ class SyntheticCalendarEntity(SyntheticEntity, CalendarEntity):
             self._attr_supported_features = (
                 CalendarEntityFeature(0) | supported_features
             )
-        self._events = [create_event(event) for event in events or []]
+        # Events from the config get stable uids so the state can be compared
+        self._events = EventStore(
+            create_event(event, uid=str(index))
+            for index, event in enumerate(events or [])
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Update the current event when virtual time changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.clock.async_add_listener(self.async_write_ha_state))
 
     @property
     def event(self) -> CalendarEvent | None:
-        """Get the nextactive or upcoming calendar event."""
-        now = dt_util.now()
-        for event in self._events:
-            if event.end_datetime_local < now:
-                return event
-        return None
+        """Get the active or next upcoming calendar event."""
+        return self._events.active_or_next(self.clock.now())
 
     async def async_get_events(
         self,
@@ -112,15 +128,43 @@ class SyntheticCalendarEntity(SyntheticEntity, CalendarEntity):
         end_date: datetime.datetime,
     ) -> list[CalendarEvent]:
         """Return calendar events within a datetime range."""
-        result = []
-        for event in self._events:
-            if event.end_datetime_local < start_date:
-                continue
-            if end_date < event.start_datetime_local:
-                continue
-            result.append(event)
-        return result
+        return self._events.range(start_date, end_date)
 
     async def async_create_event(self, **kwargs: Any) -> None:
         """Add a new event to calendar."""
-        self._events.append(create_event(kwargs))
+        self._events.add(create_event(kwargs))
+        self.async_write_ha_state()
+
+    async def async_delete_event(
+        self,
+        uid: str,
+        recurrence_id: str | None = None,
+        recurrence_range: str | None = None,
+    ) -> None:
+        """Delete an event or a single occurrence of a recurring event."""
+        if recurrence_id is not None and recurrence_range:
+            raise HomeAssistantError(
+                "Deleting future occurrences of a recurring event is not supported"
+            )
+        try:
+            self._events.delete(uid, recurrence_id)
+        except KeyError as err:
+            raise HomeAssistantError(f"Calendar event '{uid}' does not exist") from err
+        self.async_write_ha_state()
+
+    async def async_update_event(
+        self,
+        uid: str,
+        event: dict[str, Any],
+        recurrence_id: str | None = None,
+        recurrence_range: str | None = None,
+    ) -> None:
+        """Update an existing event on the calendar."""
+        if self._events.get(uid) is None:
+            raise HomeAssistantError(f"Calendar event '{uid}' does not exist")
+        if recurrence_id is not None:
+            raise HomeAssistantError(
+                "Updating a single occurrence of a recurring event is not supported"
+            )
+        self._events.update(uid, create_event(event, uid=uid))
+        self.async_write_ha_state()
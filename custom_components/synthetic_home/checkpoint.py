@@ -0,0 +1,116 @@
+"""In-memory checkpoints of entity state for Synthetic Home."""
+
+import copy
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .entity import SyntheticEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CHECKPOINTS = f"{DOMAIN}_checkpoints"
+
+
+@dataclass
+class Checkpoint:
+    """The state of all entities in a synthetic home at a point in time."""
+
+    values: dict[str, dict[str, Any]]
+    """State values of each entity by entity id."""
+
+    dirty: set[str] = field(default_factory=set)
+    """Entities that wrote their state since the checkpoint was saved or restored."""
+
+
+class CheckpointStore:
+    """Named checkpoints of the entities of a config entry.
+
+    Entities report every state write so each checkpoint knows which entities
+    may have changed, and restoring a checkpoint only visits those entities.
+    """
+
+    def __init__(self) -> None:
+        """Initialize CheckpointStore."""
+        self._checkpoints: dict[str, Checkpoint] = {}
+
+    @callback
+    def async_mark_dirty(self, entity_id: str) -> None:
+        """Record that the entity wrote its state."""
+        for checkpoint in self._checkpoints.values():
+            checkpoint.dirty.add(entity_id)
+
+    @callback
+    def async_save(self, name: str, entities: dict[str, "SyntheticEntity"]) -> None:
+        """Save the state of all entities as a named checkpoint."""
+        self._checkpoints[name] = Checkpoint(
+            values={
+                entity_id: copy.deepcopy(entity.state_values())
+                for entity_id, entity in entities.items()
+            }
+        )
+        _LOGGER.debug("Saved checkpoint %s of %d entities", name, len(entities))
+
+    @callback
+    def async_restore(
+        self, name: str, entities: dict[str, "SyntheticEntity"]
+    ) -> list[str]:
+        """Restore the entities that changed since the checkpoint.
+
+        Returns the ids of entities whose state was restored.
+        """
+        checkpoint = self._checkpoints[name]
+        dirty, checkpoint.dirty = checkpoint.dirty, set()
+        changed: list[SyntheticEntity] = []
+        for entity_id in dirty:
+            if (values := checkpoint.values.get(entity_id)) is None or (
+                entity := entities.get(entity_id)
+            ) is None:
+                continue
+            if entity.async_apply_state(copy.deepcopy(values)):
+                changed.append(entity)
+        for entity in changed:
+            entity.async_write_ha_state()
+        # Restored entities now match the checkpoint
+        checkpoint.dirty.difference_update(entity.entity_id for entity in changed)
+        _LOGGER.debug(
+            "Restored %d of %d dirty entities from checkpoint %s",
+            len(changed),
+            len(dirty),
+            name,
+        )
+        return [entity.entity_id for entity in changed]
+
+    def __contains__(self, name: str) -> bool:
+        """Return True if a checkpoint with the name exists."""
+        return name in self._checkpoints
+
+
+@callback
+def async_get_checkpoints(hass: HomeAssistant, entry_id: str) -> CheckpointStore | None:
+    """Return the checkpoints of a config entry, if any were saved."""
+    stores: dict[str, CheckpointStore] = hass.data.get(DATA_CHECKPOINTS, {})
+    return stores.get(entry_id)
+
+
+@callback
+def async_get_or_create_checkpoints(
+    hass: HomeAssistant, entry_id: str
+) -> CheckpointStore:
+    """Return the checkpoints of a config entry, creating the store if needed."""
+    stores: dict[str, CheckpointStore] = hass.data.setdefault(DATA_CHECKPOINTS, {})
+    if (store := stores.get(entry_id)) is None:
+        store = CheckpointStore()
+        stores[entry_id] = store
+    return store
+
+
+@callback
+def async_remove_checkpoints(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove all checkpoints of a config entry."""
+    hass.data.get(DATA_CHECKPOINTS, {}).pop(entry_id, None)
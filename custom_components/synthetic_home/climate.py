@@ -46,8 +46,7 @@ def map_attributes(entity: ParsedEntity) -> dict[str, Any]:
         if k == "temperature":
             k = "current_temperature"
         result[k] = v
-    entity.attributes = result
-    return filter_attributes(entity, SUPPORTED_ATTRIBUTES)
+    return filter_attributes(entity, SUPPORTED_ATTRIBUTES, result)
 
 
 async def async_setup_entry(
@@ -58,13 +57,17 @@ async def async_setup_entry(
     synthetic_home = hass.data[DOMAIN][entry.entry_id]
 
     async_add_devices(
-        SyntheticHomeClimate(
-            entity,
-            state=entity.state,
-            **map_attributes(entity),
-        )
-        for entity in synthetic_home.entities
-        if entity.platform == CLIMATE_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(CLIMATE_DOMAIN)
+    )
+
+
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a climate entity from a parsed entity."""
+    return SyntheticHomeClimate(
+        entity,
+        state=entity.state,
+        **map_attributes(entity),
     )
 
 
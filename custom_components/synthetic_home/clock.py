@@ -0,0 +1,130 @@
+"""Virtual clock for time based simulations in Synthetic Home."""
+
+import datetime
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .scheduler import TickScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CLOCKS = f"{DOMAIN}_clocks"
+
+
+class VirtualClock:
+    """Simulated time for a synthetic home.
+
+    The clock follows wall clock time by default. It can run at a multiple of
+    real time, be paused with a speed of zero, or be stepped forward. Time
+    dependent entities read `now` and subscribe to the tick schedulers of the
+    clock so they follow virtual time.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize VirtualClock."""
+        self._hass = hass
+        self._speed = 1.0
+        self._anchor_real = dt_util.utcnow()
+        self._anchor_virtual = self._anchor_real
+        self._schedulers: dict[datetime.timedelta, TickScheduler] = {}
+        self._listeners: dict[object, CALLBACK_TYPE] = {}
+
+    @property
+    def speed(self) -> float:
+        """Return the rate of virtual time relative to real time."""
+        return self._speed
+
+    def now(self) -> datetime.datetime:
+        """Return the current virtual time in the local time zone."""
+        elapsed = dt_util.utcnow() - self._anchor_real
+        return dt_util.as_local(self._anchor_virtual + elapsed * self._speed)
+
+    @callback
+    def async_get_tick_scheduler(self, interval: datetime.timedelta) -> TickScheduler:
+        """Return the scheduler shared by all entities that tick at the interval."""
+        if (scheduler := self._schedulers.get(interval)) is None:
+            scheduler = TickScheduler(self._hass, self, interval)
+            self._schedulers[interval] = scheduler
+        return scheduler
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for virtual time jumping forward or changing speed."""
+        token = object()
+        self._listeners[token] = update_callback
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.pop(token, None)
+
+        return remove_listener
+
+    @callback
+    def async_set_speed(self, speed: float) -> None:
+        """Run virtual time at a multiple of real time, or pause it with zero."""
+        if speed < 0:
+            raise ValueError(f"Clock speed must not be negative, got {speed}")
+        self._reanchor()
+        self._speed = speed
+        for scheduler in self._schedulers.values():
+            scheduler.async_restart()
+        self._async_notify()
+
+    @callback
+    def async_advance(self, duration: datetime.timedelta) -> None:
+        """Step virtual time forward, running all ticks that elapse."""
+        self._reanchor()
+        self._anchor_virtual += duration
+        for scheduler in list(self._schedulers.values()):
+            scheduler.async_advance(duration)
+        self._async_notify()
+
+    @callback
+    def async_set_time(self, value: datetime.datetime) -> None:
+        """Jump virtual time to a new value without running ticks in between."""
+        self._reanchor()
+        self._anchor_virtual = dt_util.as_utc(value)
+        for scheduler in self._schedulers.values():
+            scheduler.async_restart()
+        self._async_notify()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop all timers used by the clock."""
+        for scheduler in self._schedulers.values():
+            scheduler.async_shutdown()
+        self._schedulers.clear()
+        self._listeners.clear()
+
+    def _reanchor(self) -> None:
+        """Record the current virtual time before changing the clock."""
+        now = dt_util.utcnow()
+        self._anchor_virtual += (now - self._anchor_real) * self._speed
+        self._anchor_real = now
+
+    @callback
+    def _async_notify(self) -> None:
+        """Notify listeners that virtual time changed."""
+        _LOGGER.debug("Virtual time is %s (speed=%s)", self.now(), self._speed)
+        for update_callback in list(self._listeners.values()):
+            update_callback()
+
+
+@callback
+def async_get_clock(hass: HomeAssistant, entry_id: str) -> VirtualClock:
+    """Return the virtual clock for a config entry."""
+    clocks: dict[str, VirtualClock] = hass.data.setdefault(DATA_CLOCKS, {})
+    if (clock := clocks.get(entry_id)) is None:
+        clock = VirtualClock(hass)
+        clocks[entry_id] = clock
+    return clock
+
+
+@callback
+def async_remove_clock(hass: HomeAssistant, entry_id: str) -> None:
+    """Stop and remove the virtual clock for a config entry."""
+    if clock := hass.data.get(DATA_CLOCKS, {}).pop(entry_id, None):
+        clock.async_shutdown()
@@ -0,0 +1,98 @@
+"""Coalescing of entity state writes for Synthetic Home."""
+
+import asyncio
+import datetime
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .entity import SyntheticEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_COALESCERS = f"{DOMAIN}_coalescers"
+
+
+class StateWriteCoalescer:
+    """Merges state writes of entities into a single deferred flush.
+
+    Writes requested while a flush is pending are collected and each entity
+    writes its state once when the flush runs, either at the next iteration
+    of the event loop or after a window of time.
+    """
+
+    def __init__(self, hass: HomeAssistant, window: float) -> None:
+        """Initialize StateWriteCoalescer."""
+        self._hass = hass
+        self._window = window
+        self._pending: dict[str, SyntheticEntity] = {}
+        self._handle: asyncio.Handle | None = None
+        self._timer_unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_schedule_write(self, entity: "SyntheticEntity") -> None:
+        """Write the state of the entity in the next flush."""
+        self._pending[entity.entity_id] = entity
+        if self._handle is not None or self._timer_unsub is not None:
+            return
+        if self._window > 0:
+            self._timer_unsub = async_call_later(
+                self._hass, self._window, self._async_flush_later
+            )
+        else:
+            self._handle = self._hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def async_flush(self) -> None:
+        """Write all pending states now."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._timer_unsub is not None:
+            self._timer_unsub()
+            self._timer_unsub = None
+        self._async_flush()
+
+    @callback
+    def _async_flush_later(self, now: datetime.datetime) -> None:
+        """Write all pending states when the window ends."""
+        self._timer_unsub = None
+        self._async_flush()
+
+    @callback
+    def _async_flush(self) -> None:
+        """Write the state of all pending entities."""
+        self._handle = None
+        pending, self._pending = self._pending, {}
+        _LOGGER.debug("Flushing %d coalesced state writes", len(pending))
+        for entity in pending.values():
+            if entity.hass is not None:
+                entity.async_write_ha_state_now()
+
+
+@callback
+def async_get_coalescer(
+    hass: HomeAssistant, entry_id: str
+) -> StateWriteCoalescer | None:
+    """Return the state write coalescer of a config entry, if enabled."""
+    coalescers: dict[str, StateWriteCoalescer] = hass.data.get(DATA_COALESCERS, {})
+    return coalescers.get(entry_id)
+
+
+@callback
+def async_set_coalescer(
+    hass: HomeAssistant, entry_id: str, window: float | None
+) -> None:
+    """Enable state write coalescing with the window, or disable it with None."""
+    coalescers: dict[str, StateWriteCoalescer] = hass.data.setdefault(
+        DATA_COALESCERS, {}
+    )
+    if coalescer := coalescers.pop(entry_id, None):
+        coalescer.async_flush()
+    if window is not None:
+        coalescers[entry_id] = StateWriteCoalescer(hass, window)
@@ -6,8 +6,26 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.core import callback
+from homeassistant.helpers import selector
 
-from .const import DOMAIN, CONF_FILENAME
+from .const import (
+    CONF_COALESCE_WINDOW,
+    CONF_COALESCE_WRITES,
+    CONF_COVER_MOTION,
+    CONF_COVER_STEP,
+    CONF_COVER_STEP_TIME,
+    CONF_COVER_TRAVEL_TIME,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_COALESCE_WRITES,
+    DEFAULT_COVER_MOTION,
+    DEFAULT_COVER_STEP,
+    DEFAULT_COVER_STEP_TIME,
+    DEFAULT_COVER_TRAVEL_TIME,
+    DOMAIN,
+    CONF_FILENAME,
+    MOTION_PROFILES,
+)
 
 
 GITHUB_URL = "https://github.com/allenporter/home-assistant-synthetic-home"
@@ -18,6 +36,49 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_COVER_MOTION, default=DEFAULT_COVER_MOTION
+        ): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=MOTION_PROFILES,
+                translation_key=CONF_COVER_MOTION,
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            )
+        ),
+        vol.Required(
+            CONF_COVER_STEP, default=DEFAULT_COVER_STEP
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(min=1, max=100, unit_of_measurement="%")
+        ),
+        vol.Required(
+            CONF_COVER_STEP_TIME, default=DEFAULT_COVER_STEP_TIME
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0.1, max=60, step=0.1, unit_of_measurement="s"
+            )
+        ),
+        vol.Required(
+            CONF_COVER_TRAVEL_TIME, default=DEFAULT_COVER_TRAVEL_TIME
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0.1, max=600, step=0.1, unit_of_measurement="s"
+            )
+        ),
+        vol.Required(
+            CONF_COALESCE_WRITES, default=DEFAULT_COALESCE_WRITES
+        ): selector.BooleanSelector(),
+        vol.Required(
+            CONF_COALESCE_WINDOW, default=DEFAULT_COALESCE_WINDOW
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0, max=10, step=0.1, unit_of_measurement="s"
+            )
+        ),
+    }
+)
+
 
 def read_config(config_file: pathlib.Path) -> str:
     """Read config filename from disk."""
@@ -31,6 +92,14 @@ class SyntheticHomeFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Create the options flow."""
+        return SyntheticHomeOptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
@@ -55,3 +124,21 @@ class SyntheticHomeFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 "url": GITHUB_URL,
             },
         )
+
+
+class SyntheticHomeOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for synthetic_home."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage how time based simulations behave."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
@@ -3,3 +3,35 @@
 DOMAIN = "synthetic_home"
 DEFAULT_NAME = "Synthetic Home"
 CONF_FILENAME = "config_filename"
+
+SERVICE_ADVANCE_CLOCK = "advance_clock"
+SERVICE_SET_CLOCK_SPEED = "set_clock_speed"
+ATTR_DURATION = "duration"
+ATTR_SPEED = "speed"
+SERVICE_SET_DEVICE_STATE = "set_device_state"
+SERVICE_LOAD_SCENARIO = "load_scenario"
+ATTR_DEVICE = "device"
+ATTR_DEVICE_TYPE = "device_type"
+ATTR_DEVICE_STATE = "device_state"
+SERVICE_SAVE_CHECKPOINT = "save_checkpoint"
+SERVICE_RESTORE_CHECKPOINT = "restore_checkpoint"
+ATTR_NAME = "name"
+DEFAULT_CHECKPOINT = "default"
+
+CONF_COVER_MOTION = "cover_motion"
+CONF_COVER_STEP = "cover_step"
+CONF_COVER_STEP_TIME = "cover_step_time"
+CONF_COVER_TRAVEL_TIME = "cover_travel_time"
+MOTION_INSTANT = "instant"
+MOTION_STEPPED = "stepped"
+MOTION_TIMED = "timed"
+MOTION_PROFILES = [MOTION_INSTANT, MOTION_STEPPED, MOTION_TIMED]
+DEFAULT_COVER_MOTION = MOTION_STEPPED
+DEFAULT_COVER_STEP = 10
+DEFAULT_COVER_STEP_TIME = 1.0
+DEFAULT_COVER_TRAVEL_TIME = 10.0
+
+CONF_COALESCE_WRITES = "coalesce_writes"
+CONF_COALESCE_WINDOW = "coalesce_window"
+DEFAULT_COALESCE_WRITES = False
+DEFAULT_COALESCE_WINDOW = 0.0
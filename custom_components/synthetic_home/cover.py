@@ -1,11 +1,13 @@
 """Cover platform for Synthetic Home."""
 
+from collections.abc import Mapping
+from dataclasses import dataclass
 import datetime
 from typing import Any
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, CALLBACK_TYPE
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE, callback
 from homeassistant.components.cover import (
     CoverEntity,
     CoverDeviceClass,
@@ -14,18 +16,25 @@ from homeassistant.components.cover import (
     DOMAIN as COVER_DOMAIN,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
 
-from .const import DOMAIN
+from .const import (
+    CONF_COVER_MOTION,
+    CONF_COVER_STEP,
+    CONF_COVER_STEP_TIME,
+    CONF_COVER_TRAVEL_TIME,
+    DEFAULT_COVER_MOTION,
+    DEFAULT_COVER_STEP,
+    DEFAULT_COVER_STEP_TIME,
+    DEFAULT_COVER_TRAVEL_TIME,
+    DOMAIN,
+    MOTION_INSTANT,
+    MOTION_TIMED,
+)
 from .entity import SyntheticEntity
 from .model import ParsedEntity, filter_attributes
 
 _LOGGER = logging.getLogger(__name__)
 
-# Used for eval to override behavior
-COVER_INSTANT = False
-COVER_STEP = 10
-COVER_STEP_TIME = datetime.timedelta(seconds=1)
 SUPPORTED_ATTRIBUTES = {"supported_features", "device_class", "current_position"}
 
 
@@ -36,13 +45,48 @@ async def async_setup_entry(
     synthetic_home = hass.data[DOMAIN][entry.entry_id]
 
     async_add_devices(
-        SyntheticCover(
-            entity,
-            state=entity.state,
-            **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(COVER_DOMAIN)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class MotionProfile:
+    """How covers move towards their target position.
+
+    An instant cover jumps to the target, a stepped cover moves by a fixed
+    step on every tick, and a timed cover derives its position from the time
+    elapsed since it started moving and the time to travel the full range.
+    """
+
+    motion: str = DEFAULT_COVER_MOTION
+    step: int = DEFAULT_COVER_STEP
+    step_time: datetime.timedelta = datetime.timedelta(seconds=DEFAULT_COVER_STEP_TIME)
+    travel_time: datetime.timedelta = datetime.timedelta(
+        seconds=DEFAULT_COVER_TRAVEL_TIME
+    )
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> "MotionProfile":
+        """Create a motion profile from the config entry options."""
+        return cls(
+            motion=options.get(CONF_COVER_MOTION, DEFAULT_COVER_MOTION),
+            step=int(options.get(CONF_COVER_STEP, DEFAULT_COVER_STEP)),
+            step_time=datetime.timedelta(
+                seconds=options.get(CONF_COVER_STEP_TIME, DEFAULT_COVER_STEP_TIME)
+            ),
+            travel_time=datetime.timedelta(
+                seconds=options.get(CONF_COVER_TRAVEL_TIME, DEFAULT_COVER_TRAVEL_TIME)
+            ),
         )
-        for entity in synthetic_home.entities
-        if entity.platform == COVER_DOMAIN
+
+
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a cover entity from a parsed entity."""
+    return SyntheticCover(
+        entity,
+        state=entity.state,
+        **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
     )
 
 
@@ -58,6 +102,9 @@ class SyntheticCover(SyntheticEntity, CoverEntity):
 
     _target_cover_position: int | None = None
     _timer_unsub: CALLBACK_TYPE | None = None
+    _motion: MotionProfile = MotionProfile()
+    # Virtual time and position when the cover started moving to the target
+    _move_start: tuple[datetime.datetime, int] | None = None
 
     def __init__(
         self,
@@ -82,9 +129,13 @@ class SyntheticCover(SyntheticEntity, CoverEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """When entity will be removed from Home Assistant."""
-        if self._timer_unsub is not None:
-            self._timer_unsub()
-            self._timer_unsub = None
+        self._stop_moving()
+
+    @callback
+    def async_apply_state(self, values: dict[str, Any]) -> bool:
+        """Stop moving before replacing the state of the cover."""
+        self._stop_moving()
+        return super().async_apply_state(values)
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
@@ -94,7 +145,7 @@ class SyntheticCover(SyntheticEntity, CoverEntity):
         self._attr_is_closing = True
         self._attr_is_opening = False
         self._target_cover_position = 0
-        await self._start_moving()
+        self._start_moving()
         self.async_write_ha_state()
 
     async def async_open_cover(self, **kwargs: Any) -> None:
@@ -108,7 +159,7 @@ class SyntheticCover(SyntheticEntity, CoverEntity):
         self._attr_is_closing = False
         self._attr_is_opening = True
         self._target_cover_position = 100
-        await self._start_moving()
+        self._start_moving()
         self.async_write_ha_state()
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
@@ -124,57 +175,71 @@ class SyntheticCover(SyntheticEntity, CoverEntity):
         self._attr_is_opening = (
             self._target_cover_position > self._attr_current_cover_position
         )
-        await self._start_moving()
+        self._start_moving()
         self.async_write_ha_state()
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
         self._is_closing = False
         self._is_opening = False
+        self._stop_moving()
+
+    @property
+    def motion_profile(self) -> MotionProfile:
+        """Return the motion profile configured for the synthetic home."""
+        assert self.platform.config_entry
+        return MotionProfile.from_options(self.platform.config_entry.options)
+
+    @callback
+    def _start_moving(self) -> None:
+        """Start moving the cover on the shared tick scheduler."""
+        now = self.clock.now()
+        self._motion = self.motion_profile
+        self._move_start = (now, self._attr_current_cover_position)
+        if self._motion.motion == MOTION_INSTANT:
+            self._move_cover(now)
+        elif self._timer_unsub is None:
+            scheduler = self.clock.async_get_tick_scheduler(self._motion.step_time)
+            self._timer_unsub = scheduler.async_subscribe(self._move_cover)
+
+    @callback
+    def _stop_moving(self) -> None:
+        """Unsubscribe from the tick scheduler."""
         if self._timer_unsub is not None:
             self._timer_unsub()
             self._timer_unsub = None
             self._target_cover_position = None
 
-    async def _start_moving(self) -> None:
-        """Start moving the cover."""
-        if COVER_INSTANT:
-            await self._move_cover(datetime.datetime.now())
-        elif self._timer_unsub is None:
-            self._timer_unsub = async_track_time_interval(
-                self.hass,
-                action=self._move_cover,
-                interval=COVER_STEP_TIME,
-            )
-
-    async def _move_cover(self, now: datetime.datetime) -> None:
+    @callback
+    def _move_cover(self, now: datetime.datetime) -> None:
         """Track time changes."""
-        if COVER_INSTANT and self._target_cover_position is not None:
+        target = self._target_cover_position
+        if self._motion.motion == MOTION_INSTANT and target is not None:
             # Jump to destination
-            self._attr_current_cover_position = self._target_cover_position
-        if (
-            self._target_cover_position is not None
-            and self._attr_current_cover_position > self._target_cover_position
-        ):
-            _LOGGER.debug("Cover moving down")
-            self._attr_current_cover_position -= COVER_STEP
-            self._attr_current_cover_position = max(
-                self._attr_current_cover_position, self._target_cover_position
-            )
-        elif (
-            self._target_cover_position is not None
-            and self._attr_current_cover_position < self._target_cover_position
-        ):
-            _LOGGER.debug("Cover moving up")
-            self._attr_current_cover_position += COVER_STEP
-            self._attr_current_cover_position = min(
-                self._attr_current_cover_position, self._target_cover_position
+            self._attr_current_cover_position = target
+        if target is not None and self._attr_current_cover_position != target:
+            _LOGGER.debug(
+                "Cover moving %s",
+                "up" if self._attr_current_cover_position < target else "down",
             )
+            self._attr_current_cover_position = self._next_position(now, target)
         else:
             # Reached target
             _LOGGER.debug("Cover reached target")
             self._attr_is_closing = False
             self._attr_is_opening = False
             self._attr_is_closed = self._attr_current_cover_position == 0
-            await self.async_stop_cover()
+            self._stop_moving()
         self.async_write_ha_state()
+
+    def _next_position(self, now: datetime.datetime, target: int) -> int:
+        """Return the position of the cover after moving towards the target."""
+        if self._motion.motion == MOTION_TIMED and self._move_start is not None:
+            start_time, position = self._move_start
+            distance = round(100 * (now - start_time) / self._motion.travel_time)
+        else:
+            position = self._attr_current_cover_position
+            distance = self._motion.step
+        if position < target:
+            return min(position + distance, target)
+        return max(position - distance, target)
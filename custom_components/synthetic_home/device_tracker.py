@@ -33,13 +33,17 @@ async def async_setup_entry(
     synthetic_home = hass.data[DOMAIN][entry.entry_id]
 
     async_add_devices(
-        SyntheticHomeTrackerEntity(
-            entity,
-            state=entity.state,
-            **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
-        )
-        for entity in synthetic_home.entities
-        if entity.platform == DEVICE_TRACKER_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(DEVICE_TRACKER_DOMAIN)
+    )
+
+
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a device tracker entity from a parsed entity."""
+    return SyntheticHomeTrackerEntity(
+        entity,
+        state=entity.state,
+        **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
     )
 
 
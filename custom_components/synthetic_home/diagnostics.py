@@ -0,0 +1,31 @@
+"""Diagnostics support for Synthetic Home."""
+
+from typing import Any
+
+from synthetic_home import inventory
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_FILENAME
+from .model import ParsedHome, config_file_path
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    The inventory is released once the platforms are set up, so it is
+    loaded from the config file again on demand.
+    """
+    synthetic_home: ParsedHome = hass.data[DOMAIN][entry.entry_id]
+    config_file = config_file_path(hass, entry.data[CONF_FILENAME])
+    inv = await hass.async_add_executor_job(inventory.load_inventory, config_file)
+    return {
+        "inventory": inv.to_dict(omit_none=True),
+        "platform_entities": {
+            platform: len(entities)
+            for platform, entities in synthetic_home.platform_entities.items()
+        },
+    }
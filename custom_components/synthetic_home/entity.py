@@ -1,21 +1,32 @@
 """Base entity class for Synthetic Home."""
 
 import logging
+from typing import Any
 
-from homeassistant.helpers import entity_registry as er, area_registry as ar
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
-from homeassistant.components.conversation import DOMAIN as CONVERATION_DOMAIN
-from homeassistant.components.homeassistant.exposed_entities import async_expose_entity
 
+from .checkpoint import async_get_checkpoints
+from .clock import VirtualClock, async_get_clock
+from .coalesce import async_get_coalescer
 from .model import ParsedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Attributes set by SyntheticEntity that identify the entity rather than its state
+_IDENTITY_ATTRIBUTES = frozenset(
+    {"_attr_unique_id", "_attr_name", "_attr_device_info", "_attr_should_poll"}
+)
+# Cached entity properties store their _attr_ value with this prefix
+_CACHED_ATTRIBUTE_PREFIX = "__attr_"
+
 
 class SyntheticEntity(Entity):
     """synthetic_home entity class."""
 
     _attr_has_entity_name = False
+    _state_attributes: tuple[str, ...] = ()
+    """Private attributes that hold entity state in addition to _attr_ values."""
 
     def __init__(self, entity: ParsedEntity) -> None:
         """Initialize InventoryEntity."""
@@ -27,14 +38,59 @@ class SyntheticEntity(Entity):
         # Allow state changes to "stick"
         self._attr_should_poll = False
 
-    async def async_added_to_hass(self) -> None:
-        """When entity is added to Home Assistant."""
-        await super().async_added_to_hass()
-        # Expose all synthetic home entities by default
-        async_expose_entity(self.hass, CONVERATION_DOMAIN, self.entity_id, True)
-        # Add areas for entities that specify an area without a device
-        if self._attr_device_info is None and self._entity.area_name:
-            area_registry = ar.async_get(self.hass)
-            area_entry = area_registry.async_get_or_create(self._entity.area_name)
-            entity_registry = er.async_get(self.hass)
-            entity_registry.async_update_entity(self.entity_id, area_id=area_entry.id)
+    @property
+    def clock(self) -> VirtualClock:
+        """Return the virtual clock of the synthetic home the entity belongs to."""
+        assert self.platform.config_entry
+        return async_get_clock(self.hass, self.platform.config_entry.entry_id)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, deferred to a coalesced flush when enabled."""
+        if self.platform is None or self.platform.config_entry is None:
+            super().async_write_ha_state()
+            return
+        entry_id = self.platform.config_entry.entry_id
+        if checkpoints := async_get_checkpoints(self.hass, entry_id):
+            checkpoints.async_mark_dirty(self.entity_id)
+        if (
+            coalescer := async_get_coalescer(self.hass, entry_id)
+        ) and self.hass.states.get(self.entity_id) is not None:
+            coalescer.async_schedule_write(self)
+            return
+        super().async_write_ha_state()
+
+    @callback
+    def async_write_ha_state_now(self) -> None:
+        """Write the state to the state machine without coalescing."""
+        super().async_write_ha_state()
+
+    def state_values(self) -> dict[str, Any]:
+        """Return the attribute values that make up the state of the entity."""
+        values = {}
+        for key in vars(self):
+            if key.startswith(_CACHED_ATTRIBUTE_PREFIX):
+                name = key[1:]
+            elif key.startswith("_attr_") or key in self._state_attributes:
+                name = key
+            else:
+                continue
+            if name not in _IDENTITY_ATTRIBUTES:
+                values[name] = getattr(self, name)
+        return values
+
+    @callback
+    def async_apply_state(self, values: dict[str, Any]) -> bool:
+        """Replace the state of the entity without writing it.
+
+        Returns True if the state changed and needs to be written.
+        """
+        current = self.state_values()
+        if current == values:
+            return False
+        for name in current.keys() - values.keys():
+            # Revert to the class default
+            delattr(self, name)
+        for name, value in values.items():
+            setattr(self, name, value)
+        return True
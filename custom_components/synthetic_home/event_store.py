@@ -0,0 +1,138 @@
+"""Interval index of calendar events for Synthetic Home."""
+
+import bisect
+import datetime
+from collections.abc import Iterable, Iterator
+
+from homeassistant.components.calendar import CalendarEvent
+
+from .recurrence import RecurringEvent
+
+
+def _index_key(event: CalendarEvent) -> tuple[datetime.datetime, str]:
+    """Return the key that orders events in the index."""
+    if event.uid is None:
+        raise ValueError(f"Calendar event '{event.summary}' has no uid")
+    return (event.start_datetime_local, event.uid)
+
+
+class EventStore:
+    """Calendar events indexed by start time.
+
+    Events are kept sorted by start time along with the longest event duration.
+    A range query then only visits events that start inside the range, or up to
+    the longest duration before it, instead of every event on the calendar.
+    Recurring events are kept as a single record and only expanded for the
+    range that is queried.
+    """
+
+    def __init__(self, events: Iterable[CalendarEvent] = ()) -> None:
+        """Initialize EventStore."""
+        self._events: dict[str, CalendarEvent] = {}
+        self._recurring: dict[str, RecurringEvent] = {}
+        self._max_duration = datetime.timedelta(0)
+        for event in events:
+            self._add(event)
+        self._index = sorted(_index_key(event) for event in self._events.values())
+
+    def __len__(self) -> int:
+        """Return the number of events, counting a recurring series once."""
+        return len(self._events) + len(self._recurring)
+
+    def __iter__(self) -> Iterator[CalendarEvent]:
+        """Iterate over single events in order of start time, then each series."""
+        yield from (self._events[uid] for _, uid in self._index)
+        yield from (recurring.event for recurring in self._recurring.values())
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both stores contain the same events."""
+        if not isinstance(other, EventStore):
+            return NotImplemented
+        return self._events == other._events and self._recurring == other._recurring
+
+    def get(self, uid: str) -> CalendarEvent | None:
+        """Return the event with the uid, or the first event of a series."""
+        if (recurring := self._recurring.get(uid)) is not None:
+            return recurring.event
+        return self._events.get(uid)
+
+    def add(self, event: CalendarEvent) -> None:
+        """Add a new event."""
+        if event.rrule:
+            self._add(event)
+            return
+        key = _index_key(event)
+        self._add(event)
+        bisect.insort(self._index, key)
+
+    def delete(self, uid: str, recurrence_id: str | None = None) -> CalendarEvent:
+        """Remove the event with the uid and return it.
+
+        A single occurrence of a recurring event is removed when the
+        recurrence id is set, otherwise the whole series is removed.
+        """
+        if (recurring := self._recurring.get(uid)) is not None:
+            if recurrence_id is not None:
+                recurring.exclude(recurrence_id)
+            else:
+                del self._recurring[uid]
+            return recurring.event
+        if (event := self._events.pop(uid, None)) is None:
+            raise KeyError(uid)
+        index = bisect.bisect_left(self._index, _index_key(event))
+        del self._index[index]
+        return event
+
+    def update(self, uid: str, event: CalendarEvent) -> None:
+        """Replace the event with the uid, keeping the uid."""
+        self.delete(uid)
+        event.uid = uid
+        self.add(event)
+
+    def range(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> list[CalendarEvent]:
+        """Return the events that overlap the range in order of start time and uid."""
+        result = []
+        lower = bisect.bisect_left(self._index, (start - self._max_duration,))
+        for position in range(lower, len(self._index)):
+            event_start, uid = self._index[position]
+            if end < event_start:
+                break
+            event = self._events[uid]
+            if start <= event.end_datetime_local:
+                result.append(event)
+        if self._recurring:
+            for recurring in self._recurring.values():
+                result.extend(recurring.range(start, end))
+            result.sort(key=_index_key)
+        return result
+
+    def active_or_next(self, now: datetime.datetime) -> CalendarEvent | None:
+        """Return the earliest event in progress, or else the next upcoming event."""
+        candidates = [
+            event
+            for recurring in self._recurring.values()
+            if (event := recurring.active_or_next(now)) is not None
+        ]
+        lower = bisect.bisect_left(self._index, (now - self._max_duration,))
+        for position in range(lower, len(self._index)):
+            event = self._events[self._index[position][1]]
+            if now < event.end_datetime_local:
+                candidates.append(event)
+                break
+        return min(candidates, key=_index_key, default=None)
+
+    def _add(self, event: CalendarEvent) -> None:
+        """Add the event without updating the index."""
+        if event.uid is None:
+            raise ValueError(f"Calendar event '{event.summary}' has no uid")
+        if event.uid in self._events or event.uid in self._recurring:
+            raise ValueError(f"Calendar event with uid '{event.uid}' already exists")
+        if event.rrule:
+            self._recurring[event.uid] = RecurringEvent(event)
+            return
+        self._events[event.uid] = event
+        self._max_duration = max(
+            self._max_duration, event.end_datetime_local - event.start_datetime_local
+        )
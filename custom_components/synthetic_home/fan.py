@@ -41,19 +41,24 @@ async def async_setup_entry(
     synthetic_home = hass.data[DOMAIN][entry.entry_id]
 
     async_add_devices(
-        SyntheticFan(
-            entity,
-            state=entity.state,
-            **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
-        )
-        for entity in synthetic_home.entities
-        if entity.platform == FAN_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(FAN_DOMAIN)
+    )
+
+
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a fan entity from a parsed entity."""
+    return SyntheticFan(
+        entity,
+        state=entity.state,
+        **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
     )
 
 
 class SyntheticFan(SyntheticEntity, FanEntity):
     """synthetic_home fan class."""
 
+    _state_attributes = ("_preset_modes",)
     _attr_reports_position = False
 
     def __init__(
@@ -39,13 +39,17 @@ async def async_setup_entry(
     synthetic_home = hass.data[DOMAIN][entry.entry_id]
 
     async_add_devices(
-        SyntheticHomeLight(
-            entity,
-            state=entity.state,
-            **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
-        )
-        for entity in synthetic_home.entities
-        if entity.platform == LIGHT_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(LIGHT_DOMAIN)
+    )
+
+
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a light entity from a parsed entity."""
+    return SyntheticHomeLight(
+        entity,
+        state=entity.state,
+        **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
     )
 
 
@@ -38,19 +38,24 @@ async def async_setup_entry(
     synthetic_home = hass.data[DOMAIN][entry.entry_id]
 
     async_add_devices(
-        SyntheticHomeLock(
-            entity,
-            state=entity.state,
-            **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
-        )
-        for entity in synthetic_home.entities
-        if entity.platform == LOCK_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(LOCK_DOMAIN)
+    )
+
+
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a lock entity from a parsed entity."""
+    return SyntheticHomeLock(
+        entity,
+        state=entity.state,
+        **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
     )
 
 
 class SyntheticHomeLock(SyntheticEntity, LockEntity):
     """synthetic_home lock class."""
 
+    _state_attributes = ("_code",)
     _code: str | None = None
 
     def __init__(
@@ -42,19 +42,25 @@ async def async_setup_entry(
     synthetic_home = hass.data[DOMAIN][entry.entry_id]
 
     async_add_devices(
-        SyntheticMediaPlayer(
-            entity,
-            state=entity.state,
-            **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
-        )
-        for entity in synthetic_home.entities
-        if entity.platform == MEDIA_PLAYER_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(MEDIA_PLAYER_DOMAIN)
+    )
+
+
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a media player entity from a parsed entity."""
+    return SyntheticMediaPlayer(
+        entity,
+        state=entity.state,
+        **filter_attributes(entity, SUPPORTED_ATTRIBUTES),
     )
 
 
 class SyntheticMediaPlayer(SyntheticEntity, MediaPlayerEntity):
     """synthetic_home media player class."""
 
+    _state_attributes = ("_track",)
+
     def __init__(
         self,
         entity: ParsedEntity,
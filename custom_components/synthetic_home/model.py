@@ -3,21 +3,27 @@
 from dataclasses import dataclass, field, asdict
 import pathlib
 import logging
+import hashlib
 import importlib
+import sys
+import time
 from typing import Any, cast
 from functools import cache
 
 from synthetic_home import inventory
 from synthetic_home.common import StateValue, NamedAttributes
+from synthetic_home.exceptions import SyntheticHomeError
 
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 
+from .cache import ParsedHomeCache, cache_key
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedDevice:
     """Data about a device as used in the integration."""
 
@@ -40,7 +46,7 @@ def parse_device_info(
     return device_info
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedEntity:
     """Data about an entity used in the integration."""
 
@@ -50,7 +56,20 @@ class ParsedEntity:
     device_info: DeviceInfo | None
     area_name: str | None
     state: StateValue | None
-    attributes: NamedAttributes
+    attributes: NamedAttributes = field(compare=False)
+    attributes_digest: bytes | None = field(default=None, compare=False)
+    """Digest of the attributes, kept after the attributes are released."""
+
+    def digest(self) -> bytes:
+        """Return a digest of the entity attributes used to detect changes."""
+        if self.attributes_digest is not None:
+            return self.attributes_digest
+        return hashlib.blake2b(repr(self.attributes).encode(), digest_size=16).digest()
+
+    def compact(self) -> None:
+        """Release the attributes once they have been used to create the entity."""
+        self.attributes_digest = self.digest()
+        self.attributes = {}
 
 
 def parse_entity(
@@ -65,7 +84,7 @@ def parse_entity(
         raise ValueError(f"Inventory entity '{inv_entity.id}' was missing a name")
     platform, entity_slug = inv_entity.id.split(".", maxsplit=1)
     return ParsedEntity(
-        platform=platform,
+        platform=sys.intern(platform),
         entity_id=inv_entity.id,
         name=inv_entity.name,
         area_name=area_name,
@@ -75,7 +94,7 @@ def parse_entity(
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedArea:
     """Data about an area."""
 
@@ -92,6 +111,55 @@ class ParsedHome:
     devices: list[ParsedDevice] = field(default_factory=list)
     parsed_inventory: inventory.Inventory | None = None
     entities: list[ParsedEntity] = field(default_factory=list)
+    platform_entities: dict[str, list[ParsedEntity]] = field(default_factory=dict)
+    """Index of entities by platform, built once when the home is parsed."""
+
+    def entities_for_platform(self, platform: str) -> list[ParsedEntity]:
+        """Return the entities that belong to the specified platform."""
+        return self.platform_entities.get(platform, [])
+
+    def compact(self) -> None:
+        """Release data that is no longer needed once platforms are set up.
+
+        The inventory and the raw entity attributes are only needed to create
+        entities. Both can be loaded again from the config file on demand.
+        """
+        self.parsed_inventory = None
+        for entity in self.entities:
+            entity.compact()
+
+
+@dataclass
+class HomeDiff:
+    """Differences between a loaded synthetic home and an updated version."""
+
+    added_entities: list[ParsedEntity] = field(default_factory=list)
+    removed_entities: list[ParsedEntity] = field(default_factory=list)
+    changed_entities: list[ParsedEntity] = field(default_factory=list)
+    """The updated version of entities whose definition changed."""
+
+    removed_devices: list[ParsedDevice] = field(default_factory=list)
+
+
+def diff_homes(old: ParsedHome, new: ParsedHome) -> HomeDiff:
+    """Compare two parsed homes and return the entities and devices that changed."""
+    diff = HomeDiff()
+    old_entities = {entity.entity_id: entity for entity in old.entities}
+    new_entity_ids = set()
+    for entity in new.entities:
+        new_entity_ids.add(entity.entity_id)
+        if (old_entity := old_entities.get(entity.entity_id)) is None:
+            diff.added_entities.append(entity)
+        elif old_entity != entity or old_entity.digest() != entity.digest():
+            diff.changed_entities.append(entity)
+    diff.removed_entities = [
+        entity for entity in old.entities if entity.entity_id not in new_entity_ids
+    ]
+    new_device_ids = {device.unique_id for device in new.devices}
+    diff.removed_devices = [
+        device for device in old.devices if device.unique_id not in new_device_ids
+    ]
+    return diff
 
 
 @cache
@@ -153,10 +221,47 @@ def parse_attributes(values: NamedAttributes) -> NamedAttributes:
     return result
 
 
+def config_file_path(hass: HomeAssistant, filename: str) -> pathlib.Path:
+    """Return the path to a config file relative to the config directory."""
+    if filename.startswith("/"):
+        return pathlib.Path(filename)
+    return pathlib.Path(hass.config.path(filename))
+
+
 def parse_home_config(config_file: pathlib.Path) -> ParsedHome:
     """Load synthetic home configuration from disk."""
+    return parse_inventory(inventory.load_inventory(config_file))
+
+
+def load_home_config(
+    config_file: pathlib.Path, home_cache: ParsedHomeCache
+) -> ParsedHome:
+    """Load synthetic home configuration, reusing a cached parse when unchanged."""
+    try:
+        content = inventory.read_config_content(config_file)
+    except FileNotFoundError as err:
+        raise SyntheticHomeError(
+            f"Configuration file '{config_file}' does not exist"
+        ) from err
+
+    key = cache_key(content)
+    if (synthetic_home := home_cache.load(config_file, key)) is not None:
+        _LOGGER.debug("Loaded synthetic home %s from cache", config_file)
+        return cast(ParsedHome, synthetic_home)
+
+    try:
+        inv = inventory.decode_inventory(content)
+    except ValueError as err:
+        raise SyntheticHomeError(
+            f"Could not parse config file '{config_file}': {err}"
+        ) from err
+    synthetic_home = parse_inventory(inv)
+    home_cache.save(config_file, key, synthetic_home)
+    return synthetic_home
 
-    inv = inventory.load_inventory(config_file)
+
+def parse_inventory(inv: inventory.Inventory) -> ParsedHome:
+    """Convert an inventory into the synthetic home model."""
 
     inv_area_dict = inv.area_dict()
     inv_device_dict = inv.device_dict()
@@ -166,7 +271,7 @@ def parse_home_config(config_file: pathlib.Path) -> ParsedHome:
         if inv_device.id is None:
             raise ValueError(f"Expected inventory device to have an id: {inv_device}")
         if inv_device.area:
-            device_area_name = inv_area_dict[inv_device.area].name
+            device_area_name = sys.intern(inv_area_dict[inv_device.area].name)
         else:
             device_area_name = None
         parsed_device = ParsedDevice(
@@ -176,35 +281,76 @@ def parse_home_config(config_file: pathlib.Path) -> ParsedHome:
         )
         parsed_devices.append(parsed_device)
 
+    # Entities on the same device share a single device info
+    device_infos: dict[str, DeviceInfo] = {}
     parsed_entities = []
+    platform_entities: dict[str, list[ParsedEntity]] = {}
     for inv_entity in inv.entities:
         device_info: DeviceInfo | None = None
         if inv_entity.device is not None:
-            inv_device = inv_device_dict[inv_entity.device]
-            device_info = parse_device_info(
-                inv_device, inv_area_dict.get(inv_device.area or "")
-            )
+            if (device_info := device_infos.get(inv_entity.device)) is None:
+                inv_device = inv_device_dict[inv_entity.device]
+                device_info = parse_device_info(
+                    inv_device, inv_area_dict.get(inv_device.area or "")
+                )
+                device_infos[inv_entity.device] = device_info
         entity_area_name: str | None = None
         if inv_entity.area is not None:
-            entity_area_name = inv_area_dict[inv_entity.area].name
+            entity_area_name = sys.intern(inv_area_dict[inv_entity.area].name)
         parsed_entity = parse_entity(inv_entity, device_info, entity_area_name)
         parsed_entities.append(parsed_entity)
+        platform_entities.setdefault(parsed_entity.platform, []).append(parsed_entity)
 
     return ParsedHome(
         floors=list(inv.floors),
-        areas=[ParsedArea(area.name, area.floor) for area in inv.areas],
+        areas=[ParsedArea(sys.intern(area.name), area.floor) for area in inv.areas],
         devices=parsed_devices,
         parsed_inventory=inv,
         entities=parsed_entities,
+        platform_entities=platform_entities,
     )
 
 
+async def async_parse_home_config(
+    hass: HomeAssistant,
+    config_file: pathlib.Path,
+    home_cache: ParsedHomeCache | None = None,
+) -> ParsedHome:
+    """Load synthetic home configuration from disk without blocking the event loop.
+
+    Reading the file, decoding the yaml and resolving entity feature enums
+    (which imports modules) are all blocking so they are run in the executor.
+    When a cache is provided an unchanged home is loaded from the cache.
+    """
+    start = time.perf_counter()
+    if home_cache is not None:
+        synthetic_home = await hass.async_add_executor_job(
+            load_home_config, config_file, home_cache
+        )
+    else:
+        synthetic_home = await hass.async_add_executor_job(
+            parse_home_config, config_file
+        )
+    _LOGGER.debug(
+        "Parsed synthetic home %s with %d entities in %.3fs",
+        config_file,
+        len(synthetic_home.entities),
+        time.perf_counter() - start,
+    )
+    return synthetic_home
+
+
 def filter_attributes(
     entity: ParsedEntity,
     supported: set[str],
+    attributes: NamedAttributes | None = None,
 ) -> dict[str, Any]:
-    """Filter attributes to just the supported list."""
-    attributes = entity.attributes
+    """Filter attributes to just the supported list.
+
+    The entity attributes are used unless mapped attributes are provided.
+    """
+    if attributes is None:
+        attributes = entity.attributes
     supported_attributes = {k: v for k, v in attributes.items() if k in supported}
     unsupported_attributes = {k: v for k, v in attributes.items() if k not in supported}
     if unsupported_attributes:
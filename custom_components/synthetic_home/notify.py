@@ -26,12 +26,16 @@ async def async_setup_entry(
     synthetic_home = hass.data[DOMAIN][entry.entry_id]
 
     async_add_devices(
-        SyntheticHomeNotifyEntity(entity)
-        for entity in synthetic_home.entities
-        if entity.platform == NOTIFY_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(NOTIFY_DOMAIN)
     )
 
 
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a notify entity from a parsed entity."""
+    return SyntheticHomeNotifyEntity(entity)
+
+
 class SyntheticHomeNotifyEntity(SyntheticEntity, NotifyEntity):
     """synthetic_home notify entity class."""
 
@@ -0,0 +1,268 @@
+"""Lazy expansion of recurring calendar events for Synthetic Home.
+
+A subset of RFC 5545 recurrence rules is supported: FREQ of DAILY, WEEKLY,
+MONTHLY or YEARLY with INTERVAL, COUNT, UNTIL and BYDAY for weekly rules.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterator
+import dataclasses
+import datetime
+from dataclasses import dataclass
+
+from homeassistant.components.calendar import CalendarEvent
+from homeassistant.util import dt as dt_util
+
+FREQUENCIES = {"DAILY", "WEEKLY", "MONTHLY", "YEARLY"}
+WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+
+CACHE_SIZE = 32
+"""Number of expanded ranges cached for each recurring event."""
+
+MAX_SKIPPED_PERIODS = 1000
+"""Stop expanding a rule whose periods never produce a valid date."""
+
+
+def as_local(value: datetime.date) -> datetime.datetime:
+    """Return a date or datetime as a datetime in the local time zone."""
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            return value.replace(tzinfo=dt_util.get_default_time_zone())
+        return dt_util.as_local(value)
+    return datetime.datetime.combine(
+        value, datetime.time.min, tzinfo=dt_util.get_default_time_zone()
+    )
+
+
+def recurrence_id(start: datetime.date) -> str:
+    """Return the recurrence id that identifies the occurrence at start."""
+    if isinstance(start, datetime.datetime):
+        return start.strftime("%Y%m%dT%H%M%S")
+    return start.strftime("%Y%m%d")
+
+
+def _parse_until(value: str) -> datetime.date:
+    """Parse the UNTIL value of a recurrence rule."""
+    if "T" not in value:
+        return datetime.datetime.strptime(value, "%Y%m%d").date()
+    until = datetime.datetime.strptime(value.removesuffix("Z"), "%Y%m%dT%H%M%S")
+    if value.endswith("Z"):
+        return until.replace(tzinfo=datetime.UTC)
+    return until
+
+
+def _add_months(value: datetime.date, months: int) -> datetime.date | None:
+    """Add months to a date, or return None when the day does not exist."""
+    years, month = divmod(value.month - 1 + months, 12)
+    try:
+        return value.replace(year=value.year + years, month=month + 1)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """A parsed recurrence rule."""
+
+    freq: str
+    interval: int = 1
+    count: int | None = None
+    until: datetime.date | None = None
+    by_weekday: tuple[int, ...] = ()
+
+    @classmethod
+    def parse(cls, value: str) -> "RecurrenceRule":
+        """Parse a recurrence rule such as `FREQ=WEEKLY;BYDAY=MO,WE`."""
+        try:
+            parts = dict(
+                part.split("=", maxsplit=1)
+                for part in value.removeprefix("RRULE:").split(";")
+                if part
+            )
+        except ValueError as err:
+            raise ValueError(f"Invalid recurrence rule '{value}'") from err
+        if (freq := parts.pop("FREQ", None)) not in FREQUENCIES:
+            raise ValueError(f"Unsupported recurrence frequency in '{value}'")
+        rule = cls(freq=freq)
+        if interval := parts.pop("INTERVAL", None):
+            rule = dataclasses.replace(rule, interval=int(interval))
+        if count := parts.pop("COUNT", None):
+            rule = dataclasses.replace(rule, count=int(count))
+        if until := parts.pop("UNTIL", None):
+            rule = dataclasses.replace(rule, until=_parse_until(until))
+        if by_day := parts.pop("BYDAY", None):
+            if freq != "WEEKLY":
+                raise ValueError(f"BYDAY is only supported for weekly rules: '{value}'")
+            try:
+                weekdays = sorted({WEEKDAYS[day] for day in by_day.split(",")})
+            except KeyError as err:
+                raise ValueError(f"Invalid weekday {err} in '{value}'") from err
+            rule = dataclasses.replace(rule, by_weekday=tuple(weekdays))
+        if parts:
+            raise ValueError(f"Unsupported recurrence rule parts {list(parts)}")
+        if rule.interval < 1:
+            raise ValueError(f"Invalid recurrence interval in '{value}'")
+        return rule
+
+
+class RecurringEvent:
+    """A recurring event that is only expanded for the ranges that are queried.
+
+    A single record is kept for the whole series. Occurrences are generated on
+    demand starting at the period closest to the requested range, and the
+    occurrences of recently queried ranges are cached.
+    """
+
+    def __init__(self, event: CalendarEvent) -> None:
+        """Initialize RecurringEvent."""
+        if not event.rrule:
+            raise ValueError(f"Calendar event '{event.summary}' does not recur")
+        self.event = event
+        self.rule = RecurrenceRule.parse(event.rrule)
+        self.excluded: set[str] = set()
+        self._duration = event.end - event.start
+        self._start_local = as_local(event.start)
+        self._cache: OrderedDict[
+            tuple[datetime.datetime, datetime.datetime], list[CalendarEvent]
+        ] = OrderedDict()
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both describe the same series."""
+        if not isinstance(other, RecurringEvent):
+            return NotImplemented
+        return self.event == other.event and self.excluded == other.excluded
+
+    def exclude(self, occurrence_id: str) -> None:
+        """Remove a single occurrence from the series."""
+        self.excluded.add(occurrence_id)
+        self._cache.clear()
+
+    def range(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> list[CalendarEvent]:
+        """Return the occurrences that overlap the range."""
+        key = (start, end)
+        if (cached := self._cache.get(key)) is not None:
+            self._cache.move_to_end(key)
+            return cached
+        result = []
+        for occurrence in self._occurrences(start):
+            if end < occurrence.start_datetime_local:
+                break
+            if start <= occurrence.end_datetime_local:
+                result.append(occurrence)
+        self._cache[key] = result
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+
+    def active_or_next(self, now: datetime.datetime) -> CalendarEvent | None:
+        """Return the occurrence in progress, or else the next occurrence."""
+        for occurrence in self._occurrences(now):
+            if now < occurrence.end_datetime_local:
+                return occurrence
+        return None
+
+    def _first_period(self, target: datetime.datetime) -> int:
+        """Return a period index at or before the first occurrence near target."""
+        base = self._start_local
+        rule = self.rule
+        if rule.freq == "DAILY":
+            periods = (target - base).days // rule.interval
+        elif rule.freq == "WEEKLY":
+            periods = (target - base).days // (7 * rule.interval)
+        elif rule.freq == "MONTHLY":
+            months = (target.year - base.year) * 12 + target.month - base.month
+            periods = months // rule.interval
+        else:
+            periods = (target.year - base.year) // rule.interval
+        # Step back a period to include occurrences that overlap the target
+        return max(0, periods - 1)
+
+    def _period_starts(self, period: int) -> Iterator[datetime.date]:
+        """Generate candidate occurrence starts from the period onwards."""
+        base = self.event.start
+        rule = self.rule
+        skipped = 0
+        while skipped < MAX_SKIPPED_PERIODS:
+            step = period * rule.interval
+            period += 1
+            if rule.freq == "DAILY":
+                yield base + datetime.timedelta(days=step)
+            elif rule.freq == "WEEKLY" and rule.by_weekday:
+                week = base - datetime.timedelta(days=base.weekday())
+                week += datetime.timedelta(weeks=step)
+                for weekday in rule.by_weekday:
+                    yield week + datetime.timedelta(days=weekday)
+            elif rule.freq == "WEEKLY":
+                yield base + datetime.timedelta(weeks=step)
+            elif (
+                value := _add_months(
+                    base, step if rule.freq == "MONTHLY" else 12 * step
+                )
+            ) is not None:
+                skipped = 0
+                yield value
+            else:
+                skipped += 1
+
+    def _count_before(self, period: int) -> int:
+        """Return the number of occurrences in the periods before the period.
+
+        This is computed without generating the occurrences, except for
+        monthly and yearly rules on days that some periods skip, where only
+        the dates are checked.
+        """
+        if period <= 0:
+            return 0
+        base = self.event.start
+        rule = self.rule
+        if rule.freq == "WEEKLY" and rule.by_weekday:
+            # Weekdays in the first week before the event start do not occur
+            before_start = sum(1 for day in rule.by_weekday if day < base.weekday())
+            return period * len(rule.by_weekday) - before_start
+        if rule.freq in ("DAILY", "WEEKLY") or base.day <= 28:
+            return period
+        if rule.freq == "YEARLY" and (base.month, base.day) != (2, 29):
+            return period
+        months = rule.interval * (1 if rule.freq == "MONTHLY" else 12)
+        return sum(1 for index in range(period) if _add_months(base, index * months))
+
+    def _occurrences(self, target: datetime.datetime) -> Iterator[CalendarEvent]:
+        """Generate occurrences in order, starting near the target time.
+
+        Occurrences in earlier periods are not generated, and are only
+        counted for rules with a COUNT.
+        """
+        rule = self.rule
+        period = self._first_period(target - self._duration)
+        emitted = 0
+        if rule.count is not None:
+            emitted = self._count_before(period)
+        until: datetime.datetime | None = None
+        if isinstance(rule.until, datetime.datetime):
+            until = as_local(rule.until)
+        elif rule.until is not None:
+            # A date UNTIL includes the occurrences on that day
+            until = as_local(datetime.datetime.combine(rule.until, datetime.time.max))
+        for start in self._period_starts(period):
+            start_local = as_local(start)
+            if start_local < self._start_local:
+                continue
+            if until is not None and until < start_local:
+                return
+            emitted += 1
+            if rule.count is not None and emitted > rule.count:
+                return
+            if (occurrence_id := recurrence_id(start)) in self.excluded:
+                continue
+            yield CalendarEvent(
+                start=start,
+                end=start + self._duration,
+                summary=self.event.summary,
+                description=self.event.description,
+                location=self.event.location,
+                uid=self.event.uid,
+                recurrence_id=occurrence_id,
+                rrule=self.event.rrule,
+            )
@@ -0,0 +1,77 @@
+"""Apply device states and scenarios to a running synthetic home."""
+
+import logging
+from collections.abc import Iterable
+
+from synthetic_home import device_types
+from synthetic_home.synthetic_home import Device, build_device_state, build_entities
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_platform
+
+from .const import DOMAIN
+from .entity import SyntheticEntity
+from .model import ParsedDevice, ParsedEntity, parse_entity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_device_state(
+    device: ParsedDevice, device_type: str, device_state: str
+) -> list[ParsedEntity]:
+    """Return the entities of a device in a named state of its device type.
+
+    The entities are built the same way the synthetic home library builds an
+    inventory, so they have the entity ids of the entities of the device.
+    """
+    registry = device_types.load_device_type_registry()
+    device_entry = build_device_state(
+        Device(name=device.name, device_type=device_type, device_state=device_state),
+        registry,
+    )
+    return [
+        parse_entity(inv_entity, device_info=None)
+        for inv_entity in build_entities(None, device_entry)
+    ]
+
+
+@callback
+def async_config_entry_entities(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, SyntheticEntity]:
+    """Return the entities of the config entry by entity id."""
+    entities: dict[str, SyntheticEntity] = {}
+    for platform in entity_platform.async_get_platforms(hass, DOMAIN):
+        if platform.config_entry is entry:
+            entities.update(platform.entities)  # type: ignore[arg-type]
+    return entities
+
+
+@callback
+def async_apply_entities(
+    hass: HomeAssistant, entry: ConfigEntry, parsed_entities: Iterable[ParsedEntity]
+) -> list[str]:
+    """Apply the state of parsed entities to the matching entities in the home.
+
+    All entities are updated before any state is written, and each entity
+    that changed writes its state once. Returns the ids of changed entities.
+    """
+    entities = async_config_entry_entities(hass, entry)
+    create_entities = {
+        platform.domain: getattr(platform.platform, "create_entity")
+        for platform in entity_platform.async_get_platforms(hass, DOMAIN)
+        if platform.config_entry is entry
+    }
+    changed: list[SyntheticEntity] = []
+    for parsed_entity in parsed_entities:
+        if (entity := entities.get(parsed_entity.entity_id)) is None:
+            _LOGGER.debug("Skipping unknown entity %s", parsed_entity.entity_id)
+            continue
+        new_entity = create_entities[parsed_entity.platform](parsed_entity)
+        if entity.async_apply_state(new_entity.state_values()):
+            changed.append(entity)
+    for entity in changed:
+        entity.async_write_ha_state()
+    _LOGGER.debug("Applied state to %d changed entities", len(changed))
+    return [entity.entity_id for entity in changed]
@@ -0,0 +1,115 @@
+"""Shared tick scheduler for time based simulations in Synthetic Home."""
+
+import datetime
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+if TYPE_CHECKING:
+    from .clock import VirtualClock
+
+_LOGGER = logging.getLogger(__name__)
+
+TickAction = Callable[[datetime.datetime], None]
+
+
+class TickScheduler:
+    """Runs all subscribed actions together from a single interval timer.
+
+    The interval is measured in virtual time of the clock, so the timer fires
+    more often when the clock runs faster than real time and not at all when
+    the clock is paused. The timer only runs while there are subscribers, so
+    the cost of a tick does not depend on how many entities are idle.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        clock: "VirtualClock",
+        interval: datetime.timedelta,
+    ) -> None:
+        """Initialize TickScheduler."""
+        self._hass = hass
+        self._clock = clock
+        self._interval = interval
+        self._actions: dict[object, TickAction] = {}
+        self._timer_unsub: CALLBACK_TYPE | None = None
+        self._elapsed = datetime.timedelta(0)
+
+    @property
+    def active(self) -> bool:
+        """Return True if any actions are subscribed to the scheduler."""
+        return bool(self._actions)
+
+    @callback
+    def async_subscribe(self, action: TickAction) -> CALLBACK_TYPE:
+        """Run the action on every tick until the returned callback is invoked."""
+        token = object()
+        self._actions[token] = action
+        if self._timer_unsub is None:
+            self._async_start_timer()
+
+        @callback
+        def unsubscribe() -> None:
+            self._actions.pop(token, None)
+            if not self._actions:
+                self._async_stop_timer()
+
+        return unsubscribe
+
+    @callback
+    def async_restart(self) -> None:
+        """Restart the timer after the speed of the clock changed."""
+        self._async_stop_timer()
+        if self._actions:
+            self._async_start_timer()
+
+    @callback
+    def async_advance(self, duration: datetime.timedelta) -> None:
+        """Run the ticks that elapse when virtual time jumps forward."""
+        self._elapsed += duration
+        while self._actions and self._elapsed >= self._interval:
+            self._elapsed -= self._interval
+            self._async_tick(self._clock.now())
+        if not self._actions:
+            self._elapsed = datetime.timedelta(0)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the timer and remove all actions."""
+        self._actions.clear()
+        self._async_stop_timer()
+
+    @callback
+    def _async_start_timer(self) -> None:
+        """Start the timer unless the clock is paused."""
+        if self._clock.speed == 0:
+            return
+        self._timer_unsub = async_track_time_interval(
+            self._hass,
+            self._async_timer_fired,
+            self._interval / self._clock.speed,
+        )
+
+    @callback
+    def _async_stop_timer(self) -> None:
+        """Stop the timer if it is running."""
+        if self._timer_unsub is not None:
+            self._timer_unsub()
+            self._timer_unsub = None
+
+    @callback
+    def _async_timer_fired(self, now: datetime.datetime) -> None:
+        """Advance all subscribed actions from the real time timer."""
+        self._async_tick(self._clock.now())
+
+    @callback
+    def _async_tick(self, now: datetime.datetime) -> None:
+        """Advance all subscribed actions."""
+        _LOGGER.debug("Tick for %d subscribers", len(self._actions))
+        # Actions may unsubscribe while the tick is running
+        for action in list(self._actions.values()):
+            action(now)
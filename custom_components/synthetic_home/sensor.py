@@ -12,12 +12,13 @@ from homeassistant.components.sensor import (
     DOMAIN as SENSOR_DOMAIN,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .model import ParsedHome, ParsedEntity, filter_attributes
 from .entity import SyntheticEntity
+from .timeseries import PROFILE_ATTRIBUTE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,9 +41,11 @@ def map_attributes(entity: ParsedEntity) -> dict[str, Any]:
             k = "native_unit_of_measurement"
         elif k == "native_value":
             k = "native_value"
+        elif k == PROFILE_ATTRIBUTE:
+            # Profiles describe generated series rather than the entity state
+            continue
         result[k] = v
-    entity.attributes = result
-    return filter_attributes(entity, SUPPORTED_ATTRIBUTES)
+    return filter_attributes(entity, SUPPORTED_ATTRIBUTES, result)
 
 
 async def async_setup_entry(
@@ -52,12 +55,16 @@ async def async_setup_entry(
 
     synthetic_home: ParsedHome = hass.data[DOMAIN][entry.entry_id]
     async_add_devices(
-        SyntheticHomeSensor(entity, state=entity.state, **map_attributes(entity))
-        for entity in synthetic_home.entities
-        if entity.platform == SENSOR_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(SENSOR_DOMAIN)
     )
 
 
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a sensor entity from a parsed entity."""
+    return SyntheticHomeSensor(entity, state=entity.state, **map_attributes(entity))
+
+
 class SyntheticHomeSensor(SyntheticEntity, SensorEntity):
     """synthetic_home Sensor class."""
 
@@ -85,3 +92,9 @@ class SyntheticHomeSensor(SyntheticEntity, SensorEntity):
             self._attr_native_value = state
         if native_unit_of_measurement:
             self._attr_native_unit_of_measurement = native_unit_of_measurement
+
+    @callback
+    def async_set_native_value(self, value: StateType) -> None:
+        """Update the value of the sensor, such as from a generated series."""
+        self._attr_native_value = value
+        self.async_write_ha_state()
@@ -0,0 +1,160 @@
+"""Vectorized generation of sensor time series for Synthetic Home.
+
+Sensors may declare a `profile` attribute in the inventory that describes
+how their value changes over a day, for example:
+
+```yaml
+attributes:
+  profile:
+    preset: temperature
+    mean: 21
+```
+
+A profile is either the name of a preset or a dict of profile fields, with
+an optional preset to start from. The series for many sensors over a long
+window are generated at once as a NumPy array. NumPy is an optional
+dependency that is only needed to generate series.
+"""
+
+from collections.abc import Mapping, Sequence
+import dataclasses
+from dataclasses import dataclass
+import datetime
+from typing import Any
+
+from .model import ParsedHome
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+PROFILE_ATTRIBUTE = "profile"
+
+
+@dataclass(frozen=True)
+class SensorProfile:
+    """How the value of a sensor changes over a day.
+
+    The value follows a daily cosine cycle around the mean that peaks at the
+    peak hour, with normally distributed noise. A cumulative profile
+    describes a rate per hour, and the series is the running total of that
+    rate starting at the initial value, as for `total_increasing` sensors.
+    """
+
+    mean: float = 0.0
+    amplitude: float = 0.0
+    peak_hour: float = 12.0
+    noise: float = 0.0
+    minimum: float | None = None
+    maximum: float | None = None
+    cumulative: bool = False
+    initial: float = 0.0
+
+    @classmethod
+    def parse(cls, value: str | Mapping[str, Any]) -> "SensorProfile":
+        """Parse a profile from the name of a preset or a dict of fields."""
+        if isinstance(value, str):
+            value = {"preset": value}
+        fields = dict(value)
+        profile = cls()
+        if (preset := fields.pop("preset", None)) is not None:
+            if (profile := PRESETS.get(preset)) is None:
+                raise ValueError(f"Unknown sensor profile preset '{preset}'")
+        try:
+            return dataclasses.replace(profile, **fields)
+        except TypeError as err:
+            raise ValueError(f"Invalid sensor profile {value}: {err}") from err
+
+
+PRESETS = {
+    "temperature": SensorProfile(mean=21.0, amplitude=2.0, peak_hour=16, noise=0.2),
+    "humidity": SensorProfile(
+        mean=45.0, amplitude=8.0, peak_hour=6, noise=1.0, minimum=0, maximum=100
+    ),
+    "power": SensorProfile(
+        mean=300.0, amplitude=200.0, peak_hour=19, noise=50.0, minimum=0
+    ),
+    "energy": SensorProfile(
+        mean=0.3, amplitude=0.2, peak_hour=19, noise=0.05, minimum=0, cumulative=True
+    ),
+}
+
+
+@dataclass(frozen=True)
+class SensorSeries:
+    """Generated values for sensors at evenly spaced times."""
+
+    timestamps: "np.ndarray"
+    """The unix timestamp of each step."""
+
+    values: "np.ndarray"
+    """The values with one row per sensor and one column per step."""
+
+
+def sensor_profiles(home: ParsedHome) -> dict[str, SensorProfile]:
+    """Return the profiles declared by the sensors of a parsed home."""
+    return {
+        entity.entity_id: SensorProfile.parse(profile)
+        for entity in home.entities_for_platform("sensor")
+        if (profile := entity.attributes.get(PROFILE_ATTRIBUTE)) is not None
+    }
+
+
+def generate_series(
+    profiles: Sequence[SensorProfile],
+    start: datetime.datetime,
+    end: datetime.datetime,
+    step: datetime.timedelta,
+    seed: int | None = None,
+) -> SensorSeries:
+    """Generate the series for all profiles from start until end.
+
+    The daily cycle follows the time of day in the time zone of start, so
+    pass a local time to follow the days of the home. Raises ImportError if
+    NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("NumPy is required to generate sensor series")
+
+    step_seconds = step.total_seconds()
+    num_steps = max(0, int(np.ceil((end - start).total_seconds() / step_seconds)))
+    timestamps = start.timestamp() + np.arange(num_steps) * step_seconds
+
+    # Angle of the time of day of each step
+    start_hour = start.hour + start.minute / 60 + start.second / 3600
+    hours = start_hour + np.arange(num_steps) * (step_seconds / 3600)
+    angle = (2 * np.pi / 24) * hours
+
+    def column(name: str, default: float = 0.0) -> "np.ndarray":
+        values = [getattr(profile, name) for profile in profiles]
+        return np.array(
+            [default if value is None else value for value in values], dtype=float
+        )[:, np.newaxis]
+
+    # The daily cycle mean + amplitude * cos(angle - peak) is expanded into a
+    # single matrix product, so trig functions are evaluated once per step
+    # and per sensor rather than once for every value
+    amplitude = column("amplitude")
+    peak = (2 * np.pi / 24) * column("peak_hour")
+    coefficients = np.hstack(
+        [amplitude * np.cos(peak), amplitude * np.sin(peak), column("mean")]
+    )
+    basis = np.vstack([np.cos(angle), np.sin(angle), np.ones(num_steps)])
+    values = coefficients @ basis
+    if any(profile.noise for profile in profiles):
+        # Single precision is plenty for noise and is faster to generate
+        rng = np.random.default_rng(seed)
+        noise = rng.standard_normal(values.shape, dtype=np.float32)
+        noise *= column("noise").astype(np.float32)
+        values += noise
+        del noise
+    np.clip(values, column("minimum", -np.inf), column("maximum", np.inf), out=values)
+
+    cumulative = column("cumulative").astype(bool)[:, 0]
+    if cumulative.any():
+        # Rates are per hour and a counter never decreases
+        rates = np.maximum(values[cumulative], 0) * (step_seconds / 3600)
+        values[cumulative] = column("initial")[cumulative] + np.cumsum(rates, axis=1)
+
+    return SensorSeries(timestamps=timestamps, values=values)
@@ -5,6 +5,7 @@ from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.components.todo import (
     TodoListEntity,
     TodoListEntityFeature,
@@ -18,6 +19,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN
 from .entity import SyntheticEntity
 from .model import ParsedEntity, filter_attributes
+from .todo_store import TodoStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,23 +38,36 @@ async def async_setup_entry(
     synthetic_home = hass.data[DOMAIN][entry.entry_id]
 
     async_add_devices(
-        SyntheticTodoEntity(entity, **filter_attributes(entity, SUPPORTED_ATTRIBUTES))
-        for entity in synthetic_home.entities
-        if entity.platform == TODO_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(TODO_DOMAIN)
     )
 
 
-def create_todo_item(attributes: str | dict[str, Any]) -> TodoItem:
-    """Create a todo item from the specified attributes."""
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a todo entity from a parsed entity."""
+    return SyntheticTodoEntity(
+        entity, **filter_attributes(entity, SUPPORTED_ATTRIBUTES)
+    )
+
+
+def create_todo_item(
+    attributes: str | dict[str, Any], uid: str | None = None
+) -> TodoItem:
+    """Create a todo item from the specified attributes.
+
+    The uid is taken from the attributes, or else the uid argument.
+    """
     if isinstance(attributes, str):
         attributes = {"summary": attributes}
+    # The parsed attributes are compared on reload so they must not change
+    attributes = dict(attributes)
     if (status_str := attributes.get("status")) and status_str == "completed":
         status = TodoItemStatus.COMPLETED
     else:
         status = TodoItemStatus.NEEDS_ACTION
     attributes.pop("status", None)
     return TodoItem(
-        **attributes,
+        **{"uid": uid, **attributes},
         status=status,
     )
 
@@ -60,6 +75,7 @@ def create_todo_item(attributes: str | dict[str, Any]) -> TodoItem:
 class SyntheticTodoEntity(SyntheticEntity, TodoListEntity):
     """synthetic_home todo class."""
 
+    _state_attributes = ("_todos",)
     _attr_reports_position = False
 
     def __init__(
@@ -75,12 +91,44 @@ class SyntheticTodoEntity(SyntheticEntity, TodoListEntity):
             self._attr_supported_features = (
                 TodoListEntityFeature(0) | supported_features
             )
-        if todo_items is not None:
-            self._attr_todo_items = [create_todo_item(item) for item in todo_items]
+        # Items from the config get stable uids so the state can be compared
+        self._todos = TodoStore(
+            create_todo_item(item, uid=str(index))
+            for index, item in enumerate(todo_items or [])
+        )
+
+    @property
+    def todo_items(self) -> list[TodoItem]:
+        """Return the items in the To-do list."""
+        return self._todos.items()
 
     async def async_create_todo_item(self, item: TodoItem) -> None:
         """Add an item to the To-do list."""
-        if self._attr_todo_items is None:
-            self._attr_todo_items = []
-        self._attr_todo_items.append(item)
+        self._todos.add(item)
+        self.async_write_ha_state()
+
+    async def async_update_todo_item(self, item: TodoItem) -> None:
+        """Update an item in the To-do list."""
+        try:
+            self._todos.update(item)
+        except KeyError as err:
+            raise HomeAssistantError(f"To-do item '{item.uid}' does not exist") from err
+        self.async_write_ha_state()
+
+    async def async_delete_todo_items(self, uids: list[str]) -> None:
+        """Delete items from the To-do list."""
+        try:
+            self._todos.delete(uids)
+        except KeyError as err:
+            raise HomeAssistantError(f"To-do item {err} does not exist") from err
+        self.async_write_ha_state()
+
+    async def async_move_todo_item(
+        self, uid: str, previous_uid: str | None = None
+    ) -> None:
+        """Move an item in the To-do list after the previous item."""
+        try:
+            self._todos.move(uid, previous_uid)
+        except KeyError as err:
+            raise HomeAssistantError(f"To-do item {err} does not exist") from err
         self.async_write_ha_state()
@@ -0,0 +1,124 @@
+"""Ordered index of to-do items for Synthetic Home."""
+
+from collections.abc import Iterable, Iterator
+import uuid
+
+from homeassistant.components.todo import TodoItem
+
+
+class TodoStore:
+    """To-do items indexed by uid in list order.
+
+    Items are kept in a doubly linked list keyed by uid, so updating, deleting
+    and moving an item does not scan the list. The ordered list of items is
+    built when it is read and reused until the next change, so a batch of
+    changes followed by a single state write only builds it once.
+    """
+
+    def __init__(self, items: Iterable[TodoItem] = ()) -> None:
+        """Initialize TodoStore."""
+        self._items: dict[str, TodoItem] = {}
+        self._prev: dict[str, str | None] = {}
+        self._next: dict[str, str | None] = {}
+        self._head: str | None = None
+        self._tail: str | None = None
+        self._list: list[TodoItem] | None = None
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[TodoItem]:
+        """Iterate over the items in list order."""
+        return iter(self.items())
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both stores contain the same items in the same order."""
+        if not isinstance(other, TodoStore):
+            return NotImplemented
+        return self.items() == other.items()
+
+    def get(self, uid: str) -> TodoItem | None:
+        """Return the item with the uid."""
+        return self._items.get(uid)
+
+    def items(self) -> list[TodoItem]:
+        """Return the items in list order."""
+        if self._list is None:
+            result = []
+            uid = self._head
+            while uid is not None:
+                result.append(self._items[uid])
+                uid = self._next[uid]
+            self._list = result
+        return self._list
+
+    def add(self, item: TodoItem) -> None:
+        """Add an item to the end of the list, assigning a uid if it has none."""
+        if item.uid is None:
+            item.uid = str(uuid.uuid4())
+        elif item.uid in self._items:
+            raise ValueError(f"To-do item with uid '{item.uid}' already exists")
+        self._items[item.uid] = item
+        self._link(item.uid, self._tail)
+
+    def update(self, item: TodoItem) -> None:
+        """Replace the item with the same uid, keeping its position."""
+        if item.uid is None or item.uid not in self._items:
+            raise KeyError(item.uid)
+        self._items[item.uid] = item
+        self._list = None
+
+    def delete(self, uids: Iterable[str]) -> None:
+        """Remove the items with the uids.
+
+        Raises KeyError without removing any item if a uid does not exist.
+        """
+        uids = list(uids)
+        if missing := [uid for uid in uids if uid not in self._items]:
+            raise KeyError(missing[0])
+        for uid in uids:
+            self._unlink(uid)
+            del self._items[uid]
+
+    def move(self, uid: str, previous_uid: str | None = None) -> None:
+        """Move the item after the previous item, or to the start of the list."""
+        if uid not in self._items:
+            raise KeyError(uid)
+        if previous_uid is not None and previous_uid not in self._items:
+            raise KeyError(previous_uid)
+        if uid == previous_uid:
+            return
+        self._unlink(uid)
+        self._link(uid, previous_uid)
+
+    def _link(self, uid: str, previous_uid: str | None) -> None:
+        """Insert the uid after the previous uid, or at the start of the list."""
+        next_uid = self._head if previous_uid is None else self._next[previous_uid]
+        self._prev[uid] = previous_uid
+        self._next[uid] = next_uid
+        if previous_uid is None:
+            self._head = uid
+        else:
+            self._next[previous_uid] = uid
+        if next_uid is None:
+            self._tail = uid
+        else:
+            self._prev[next_uid] = uid
+        self._list = None
+
+    def _unlink(self, uid: str) -> None:
+        """Remove the uid from the list order."""
+        previous_uid = self._prev.pop(uid)
+        next_uid = self._next.pop(uid)
+        if previous_uid is None:
+            self._head = next_uid
+        else:
+            self._next[previous_uid] = next_uid
+        if next_uid is None:
+            self._tail = previous_uid
+        else:
+            self._prev[next_uid] = previous_uid
+        self._list = None
@@ -2,6 +2,7 @@
 
 import datetime
 from dataclasses import dataclass
+from functools import cache
 import logging
 from typing import Any
 
@@ -9,14 +10,13 @@ from synthetic_home import device_types
 
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.components.weather import (
     WeatherEntity,
     WeatherEntityFeature,
     DOMAIN as WEATHER_DOMAIN,
     Forecast,
 )
-from homeassistant.util import dt as dt_util
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
@@ -110,8 +110,7 @@ def map_attributes(
                     )
                 conditions.append(WeatherCondition(**entity_state))
             result[forecast_key] = conditions
-    entity.attributes = result
-    return filter_attributes(entity, SUPPORTED_ATTRIBUTES)
+    return filter_attributes(entity, SUPPORTED_ATTRIBUTES, result)
 
 
 async def async_setup_entry(
@@ -119,23 +118,39 @@ async def async_setup_entry(
 ) -> None:
     """Set up weather platform."""
     synthetic_home: ParsedHome = hass.data[DOMAIN][entry.entry_id]
-
-    registry = device_types.load_device_type_registry()
-    weather_service: device_types.DeviceType = registry.device_types["weather-service"]
+    # Entities are created with the registry that is loaded here
+    await hass.async_add_executor_job(device_types.load_device_type_registry)
 
     async_add_devices(
-        SyntheticHomeWeather(
-            entity,
-            **map_attributes(entity, weather_service.device_states_dict),
-        )
-        for entity in synthetic_home.entities
-        if entity.platform == WEATHER_DOMAIN
+        create_entity(entity)
+        for entity in synthetic_home.entities_for_platform(WEATHER_DOMAIN)
     )
 
 
+def create_entity(entity: ParsedEntity) -> SyntheticEntity:
+    """Create a weather entity from a parsed entity."""
+    return SyntheticHomeWeather(
+        entity,
+        **map_attributes(entity, _weather_conditions()),
+    )
+
+
+@cache
+def _weather_conditions() -> dict[str, device_types.DeviceState]:
+    """Return the weather conditions defined by the weather service device type."""
+    registry = device_types.load_device_type_registry()
+    weather_service: device_types.DeviceType = registry.device_types["weather-service"]
+    return weather_service.device_states_dict
+
+
 class SyntheticHomeWeather(SyntheticEntity, WeatherEntity):
     """synthetic_home Weather class."""
 
+    _state_attributes = (
+        "_daily_forecast",
+        "_hourly_forecast",
+        "_twice_daily_forecast",
+    )
     _attr_supported_features = 0
 
     def __init__(
@@ -160,6 +175,10 @@ class SyntheticHomeWeather(SyntheticEntity, WeatherEntity):
         self._attr_humidity = humidity
         self._attr_native_wind_speed = native_wind_speed
         self._attr_native_wind_speed_unit = native_wind_speed_unit
+        # Generated forecasts with the reference time and conditions they used
+        self._forecast_cache: dict[
+            str, tuple[datetime.datetime, list[WeatherCondition], list[Forecast]]
+        ] = {}
 
         if daily_forecast:
             self._daily_forecast = daily_forecast
@@ -171,39 +190,60 @@ class SyntheticHomeWeather(SyntheticEntity, WeatherEntity):
             self._twice_daily_forecast = twice_daily_forecast
             self._attr_supported_features |= WeatherEntityFeature.FORECAST_TWICE_DAILY
 
-    async def async_forecast_daily(self) -> list[Forecast]:
-        """Return the daily forecast."""
-        reftime = dt_util.now().replace(hour=16, minute=00)
+    async def async_added_to_hass(self) -> None:
+        """Update forecasts when virtual time changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.clock.async_add_listener(self._async_clock_changed))
 
-        forecast_data = []
-        for condition in self._daily_forecast:
-            data_dict = condition.as_forecast(reftime)
-            reftime = reftime + datetime.timedelta(hours=24)
-            forecast_data.append(data_dict)
+    @callback
+    def _async_clock_changed(self) -> None:
+        """Refresh forecast subscribers with the new reference times."""
+        if self._attr_supported_features:
+            self.hass.async_create_task(self.async_update_listeners(None))
 
-        return forecast_data
+    async def async_forecast_daily(self) -> list[Forecast]:
+        """Return the daily forecast."""
+        return self._forecast(
+            "daily", self._daily_forecast, 16, datetime.timedelta(hours=24)
+        )
 
     async def async_forecast_hourly(self) -> list[Forecast]:
         """Return the hourly forecast."""
-        reftime = dt_util.now().replace(hour=16, minute=00)
-
-        forecast_data = []
-        for condition in self._hourly_forecast:
-            data_dict = condition.as_forecast(reftime)
-            reftime = reftime + datetime.timedelta(hours=1)
-            forecast_data.append(data_dict)
-
-        return forecast_data
+        return self._forecast(
+            "hourly", self._hourly_forecast, 16, datetime.timedelta(hours=1)
+        )
 
     async def async_forecast_twice_daily(self) -> list[Forecast]:
         """Return the twice daily forecast."""
-        reftime = dt_util.now().replace(hour=11, minute=00)
+        return self._forecast(
+            "twice_daily", self._twice_daily_forecast, 11, datetime.timedelta(hours=12)
+        )
+
+    def _forecast(
+        self,
+        forecast_type: str,
+        conditions: list[WeatherCondition],
+        hour: int,
+        interval: datetime.timedelta,
+    ) -> list[Forecast]:
+        """Return the forecast starting at the reference hour of the current day.
+
+        The forecast is reused until the clock moves to another day or the
+        conditions are replaced.
+        """
+        start = self.clock.now().replace(hour=hour, minute=0, second=0, microsecond=0)
+        cached = self._forecast_cache.get(forecast_type)
+        if cached is not None and cached[0] == start and cached[1] is conditions:
+            return cached[2]
 
         forecast_data = []
-        for condition in self._twice_daily_forecast:
+        reftime = start
+        for condition in conditions:
             data_dict = condition.as_forecast(reftime)
-            data_dict["is_daytime"] = 6 <= reftime.hour <= 20
-            reftime = reftime + datetime.timedelta(hours=12)
+            if forecast_type == "twice_daily":
+                data_dict["is_daytime"] = 6 <= reftime.hour <= 20
+            reftime = reftime + interval
             forecast_data.append(data_dict)
 
+        self._forecast_cache[forecast_type] = (start, conditions, forecast_data)
         return forecast_data
@@ -0,0 +1 @@
+"""Tool for benchmarking the synthetic home integration."""
@@ -0,0 +1,73 @@
+"""A command line tool for benchmarking the synthetic home integration."""
+
+# ruff: noqa: T201
+
+import argparse
+import gc
+import json
+import logging
+import sys
+import tracemalloc
+from typing import Any
+
+from custom_components.synthetic_home.model import parse_inventory
+
+from .generate import generate_inventory
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_arguments() -> argparse.Namespace:
+    """Get parsed passed in arguments."""
+    parser = argparse.ArgumentParser(description="Synthetic Home Benchmark")
+    parser.add_argument(
+        "--command",
+        choices=["memory"],
+        help="The benchmark to run",
+        required=True,
+    )
+    parser.add_argument(
+        "--entities",
+        type=int,
+        default=50000,
+        help="The number of entities in the generated home.",
+    )
+    arguments = parser.parse_args()
+    return arguments
+
+
+def measure_memory(num_entities: int) -> dict[str, Any]:
+    """Measure the memory retained by a parsed home of the specified size."""
+    inv = generate_inventory(num_entities)
+    # Warm up caches such as supported feature enum lookups
+    parse_inventory(inv)
+    gc.collect()
+
+    tracemalloc.start()
+    synthetic_home = parse_inventory(inv)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "benchmark": "memory",
+        "entities": len(synthetic_home.entities),
+        "bytes": current,
+        "peak_bytes": peak,
+        "bytes_per_entity": current / num_entities,
+    }
+
+
+def main():
+    """Run a benchmark and print the results as json."""
+    logging.basicConfig(level=logging.INFO)
+
+    args = get_arguments()
+    if args.command == "memory":
+        print(json.dumps(measure_memory(args.entities)))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""Generate large synthetic home inventories for benchmarks."""
+
+from typing import Any
+
+from synthetic_home import inventory
+
+ENTITY_TEMPLATES: dict[str, tuple[str | None, dict[str, Any]]] = {
+    "binary_sensor": (
+        "off",
+        {"device_class": "binary_sensor.BinarySensorDeviceClass.MOTION"},
+    ),
+    "calendar": (
+        None,
+        {
+            "supported_features": ["calendar.CalendarEntityFeature.CREATE_EVENT"],
+            "events": [
+                {
+                    "summary": "Bastille Day",
+                    "start": "1997-07-14T17:00:00Z",
+                    "end": "1997-07-15T04:00:00Z",
+                },
+            ],
+        },
+    ),
+    "climate": (
+        "heat",
+        {
+            "unit_of_measurement": "°C",
+            "supported_features": [
+                "climate.ClimateEntityFeature.TARGET_TEMPERATURE",
+                "climate.ClimateEntityFeature.TURN_ON",
+                "climate.ClimateEntityFeature.TURN_OFF",
+            ],
+            "hvac_modes": ["off", "heat"],
+            "current_temperature": 20,
+            "target_temperature": 21,
+        },
+    ),
+    "cover": (
+        "closed",
+        {
+            "device_class": "cover.CoverDeviceClass.BLIND",
+            "supported_features": [
+                "cover.CoverEntityFeature.OPEN",
+                "cover.CoverEntityFeature.CLOSE",
+                "cover.CoverEntityFeature.SET_POSITION",
+            ],
+        },
+    ),
+    "fan": (
+        "off",
+        {"supported_features": ["fan.FanEntityFeature.OSCILLATE"]},
+    ),
+    "light": (
+        "off",
+        {"supported_color_modes": ["brightness"], "color_mode": "brightness"},
+    ),
+    "lock": ("locked", {}),
+    "media_player": (
+        "idle",
+        {
+            "device_class": "media_player.MediaPlayerDeviceClass.SPEAKER",
+            "supported_features": [
+                "media_player.MediaPlayerEntityFeature.PLAY",
+                "media_player.MediaPlayerEntityFeature.PAUSE",
+            ],
+        },
+    ),
+    "sensor": (
+        "21",
+        {
+            "device_class": "sensor.SensorDeviceClass.TEMPERATURE",
+            "state_class": "sensor.SensorStateClass.MEASUREMENT",
+            "native_unit_of_measurement": "°C",
+        },
+    ),
+    "switch": (
+        "off",
+        {"device_class": "switch.SwitchDeviceClass.OUTLET"},
+    ),
+    "todo": (
+        None,
+        {
+            "supported_features": ["todo.TodoListEntityFeature.CREATE_TODO_ITEM"],
+            "todo_items": [{"summary": "Buy milk"}],
+        },
+    ),
+    "vacuum": (
+        "docked",
+        {
+            "supported_features": [
+                "vacuum.VacuumEntityFeature.START",
+                "vacuum.VacuumEntityFeature.STATE",
+            ],
+        },
+    ),
+    "valve": (
+        "closed",
+        {
+            "supported_features": [
+                "valve.ValveEntityFeature.OPEN",
+                "valve.ValveEntityFeature.CLOSE",
+            ],
+        },
+    ),
+    "weather": (
+        "sunny",
+        {
+            "native_temperature_unit": "°F",
+            "native_temperature": 72,
+            "daily_forecast": ["cloudy", "rainy"],
+        },
+    ),
+}
+"""Entity state and attributes used for each platform in a generated home."""
+
+
+def generate_inventory(
+    num_entities: int,
+    *,
+    platforms: list[str] | None = None,
+    entities_per_device: int = 4,
+    devices_per_area: int = 10,
+    areas_per_floor: int = 10,
+) -> inventory.Inventory:
+    """Generate an inventory with entities spread evenly across platforms.
+
+    Consecutive entities are grouped into devices and devices are grouped
+    into areas, which are grouped into floors.
+    """
+    if platforms is None:
+        platforms = list(ENTITY_TEMPLATES)
+    inv = inventory.Inventory()
+    for index in range(num_entities):
+        platform = platforms[index % len(platforms)]
+        state, attributes = ENTITY_TEMPLATES[platform]
+        device_index = index // entities_per_device
+        area_index = device_index // devices_per_area
+        area_id = f"area_{area_index}"
+        device_id = f"device_{device_index}"
+        if index % entities_per_device == 0:
+            if device_index % devices_per_area == 0:
+                inv.areas.append(
+                    inventory.Area(
+                        name=f"Area {area_index}",
+                        id=area_id,
+                        floor=f"Floor {area_index // areas_per_floor}",
+                    )
+                )
+            inv.devices.append(
+                inventory.Device(
+                    name=f"Device {device_index}",
+                    id=device_id,
+                    area=area_id,
+                )
+            )
+        inv.entities.append(
+            inventory.Entity(
+                name=f"Entity {index}",
+                id=f"{platform}.entity_{index}",
+                area=area_id,
+                device=device_id,
+                state=state,
+                attributes=dict(attributes),
+            )
+        )
+    return inv
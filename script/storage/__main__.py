@@ -1,12 +1,25 @@
-"""A command line tool that will generate a storage directory given a configuration."""
+"""A command line tool that will generate a storage directory given a configuration.
+
+The configuration may be a single home, a directory of homes, or a glob
+pattern. When there are multiple homes each one is written to a directory
+named after the config file inside the output directory, and homes are
+generated in parallel by a pool of worker processes. Each worker starts Home
+Assistant once and generates its share of the homes in a batch.
+
+With `--history_days` the recorder history of each home is simulated over
+that many days. The recorder database belongs to a single storage
+directory, so these homes each start their own Home Assistant instance.
+"""
 
 import argparse
+import datetime
+import os
 import pathlib
 import sys
 import logging
 
-
-from . import driver
+from .batch import find_home_configs, generate_all, generate_storage
+from .simulation import Simulation
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,7 +30,10 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--config",
         type=str,
-        help="The yaml configuration file used to generate synthetic data.",
+        help=(
+            "The yaml configuration file used to generate synthetic data, or a "
+            "directory or glob pattern of configuration files."
+        ),
         required=True,
     )
     parser.add_argument(
@@ -26,6 +42,30 @@ def get_arguments() -> argparse.Namespace:
         help="The output directory to overwrite with configuration data.",
         required=True,
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="The number of worker processes used when generating multiple homes.",
+    )
+    parser.add_argument(
+        "--history_days",
+        type=float,
+        default=0,
+        help="The number of days of recorder history to simulate up to now.",
+    )
+    parser.add_argument(
+        "--history_step_minutes",
+        type=float,
+        default=5,
+        help="The step of the virtual clock when simulating history.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="The seed for the random activity of entities in simulated history.",
+    )
     arguments = parser.parse_args()
     return arguments
 
@@ -39,15 +79,28 @@ def main():
     output_dir = pathlib.Path(args.output_dir)
     output_dir.mkdir(exist_ok=True)
 
-    home_config_path = pathlib.Path(args.config)
-    with home_config_path.open() as fd:
-        content = fd.read()
-        with (output_dir / home_config_path.name).open("w") as out:
-            out.write(content)
+    home_configs = find_home_configs(args.config)
+    if not home_configs:
+        _LOGGER.error("No home configuration files found for '%s'", args.config)
+        return 1
+
+    simulation: Simulation | None = None
+    if args.history_days > 0:
+        simulation = Simulation(
+            window=datetime.timedelta(days=args.history_days),
+            step=datetime.timedelta(minutes=args.history_step_minutes),
+            seed=args.seed,
+        )
 
-    driver.Driver(home_config_path, output_dir).run_until_complete()
+    if len(home_configs) == 1 and pathlib.Path(args.config).is_file():
+        generate_storage(home_configs[0], output_dir, simulation)
+        return 0
 
-    return 0
+    failures = generate_all(home_configs, output_dir, args.workers, simulation)
+    _LOGGER.info(
+        "Generated %d of %d homes", len(home_configs) - failures, len(home_configs)
+    )
+    return 1 if failures else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,147 @@
+"""Generate storage directories for many homes with a pool of worker processes.
+
+Workers are spawned rather than forked, so the functions they run live in
+this importable module instead of the package `__main__`. Each worker starts
+Home Assistant once and generates its share of the homes in a batch. Homes
+whose storage would differ in a batch are generated again on their own.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import glob
+import logging
+import multiprocessing
+import pathlib
+import shutil
+
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from synthetic_home import device_types
+
+from . import driver, runner
+from .simulation import Simulation
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def find_home_configs(config: str) -> list[pathlib.Path]:
+    """Return the home config files for a file, directory or glob pattern."""
+    path = pathlib.Path(config)
+    if path.is_dir():
+        return sorted(path.glob("*.yaml"))
+    if path.exists():
+        return [path]
+    return sorted(pathlib.Path(match) for match in glob.glob(config))
+
+
+def prepare_output_dir(
+    home_config_path: pathlib.Path,
+    output_dir: pathlib.Path,
+    simulation: Simulation | None = None,
+) -> driver.Driver:
+    """Copy the home config to the output directory and return its driver."""
+    output_dir.mkdir(exist_ok=True)
+    with home_config_path.open() as fd:
+        content = fd.read()
+        with (output_dir / home_config_path.name).open("w") as out:
+            out.write(content)
+
+    # The config file is resolved relative to the copy in the output directory
+    return driver.Driver(pathlib.Path(home_config_path.name), output_dir, simulation)
+
+
+def generate_storage(
+    home_config_path: pathlib.Path,
+    output_dir: pathlib.Path,
+    simulation: Simulation | None = None,
+) -> None:
+    """Generate the storage directory for a single home."""
+    prepare_output_dir(home_config_path, output_dir, simulation).run_until_complete()
+
+
+def generate_storage_batch(
+    homes: list[tuple[pathlib.Path, pathlib.Path]],
+    simulation: Simulation | None = None,
+) -> list[pathlib.Path]:
+    """Generate storage directories for homes in one Home Assistant instance.
+
+    Homes with simulated history, and homes whose storage would differ when
+    generated in a batch, each use their own instance. Returns the config
+    files of the homes that failed.
+    """
+    if simulation is not None:
+        failures = []
+        for home_config_path, output_dir in homes:
+            try:
+                generate_storage(home_config_path, output_dir, simulation)
+            except Exception:
+                _LOGGER.exception("Failed to generate home %s", home_config_path)
+                failures.append(home_config_path)
+        return failures
+
+    drivers: dict[runner.Runner, pathlib.Path] = {
+        prepare_output_dir(home_config_path, output_dir): home_config_path
+        for home_config_path, output_dir in homes
+    }
+    batch = runner.BatchRunner(list(drivers))
+    batch.run_until_complete()
+    failures = [drivers[failure] for failure in batch.failures]
+    for unbatched in batch.unbatched:
+        # Start again from an empty storage directory
+        shutil.rmtree(unbatched.storage_dir / STORAGE_DIR, ignore_errors=True)
+        try:
+            unbatched.run_until_complete()
+        except Exception:
+            _LOGGER.exception("Failed to generate home %s", drivers[unbatched])
+            failures.append(drivers[unbatched])
+    return failures
+
+
+def _init_worker(level: int) -> None:
+    """Prepare a worker process to generate homes.
+
+    Modules are imported and the device types are loaded once here rather
+    than while generating the first home.
+    """
+    logging.basicConfig(level=level)
+    device_types.load_device_type_registry()
+
+
+def generate_all(
+    home_configs: list[pathlib.Path],
+    output_dir: pathlib.Path,
+    workers: int,
+    simulation: Simulation | None = None,
+) -> int:
+    """Generate storage directories for homes in parallel and return the failures."""
+    homes = [
+        (home_config_path, output_dir / home_config_path.stem)
+        for home_config_path in home_configs
+    ]
+    workers = min(workers, len(homes))
+    failures = 0
+    # Home Assistant starts threads so workers must not be forked
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(logging.getLogger().level,),
+    ) as executor:
+        futures = {
+            executor.submit(
+                generate_storage_batch, homes[index::workers], simulation
+            ): index
+            for index in range(workers)
+        }
+        for future in as_completed(futures):
+            batch = homes[futures[future] :: workers]
+            try:
+                failed = future.result()
+            except Exception:
+                _LOGGER.exception("Failed to generate %d homes", len(batch))
+                failures += len(batch)
+                continue
+            for home_config_path in failed:
+                _LOGGER.error("Failed to generate home %s", home_config_path)
+            failures += len(failed)
+    return failures
@@ -1,4 +1,4 @@
-"""Driver that invokes home assistnat and pushes time forward."""
+"""Driver that invokes home assistant and pushes time forward."""
 
 import pathlib
 import logging
@@ -9,6 +9,7 @@ from homeassistant import config_entries
 from homeassistant import config
 
 from . import runner
+from .simulation import Simulation, async_run_simulation, async_setup_recorder
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,19 +18,32 @@ class Driver(runner.Runner):
     """Driver that performs data generation."""
 
     def __init__(
-        self, synthetic_home_config: pathlib.Path, storage_dir: pathlib.Path
+        self,
+        synthetic_home_config: pathlib.Path,
+        storage_dir: pathlib.Path,
+        simulation: Simulation | None = None,
     ) -> None:
-        """Initialize the driver."""
+        """Initialize the driver.
+
+        When a simulation is set the home is set up at the start of the
+        simulated window and the recorder writes its history up to now.
+        """
         super().__init__(storage_dir)
         self._synthetic_home_config = synthetic_home_config
+        self._simulation = simulation
+
+    async def _async_start(self, hass: HomeAssistant) -> None:
+        _LOGGER.debug("Starting Home Assistant")
+        await hass.async_start()
+        if self._simulation is not None:
+            await async_setup_recorder(hass)
 
     async def _async_run_in_loop(self, hass: HomeAssistant) -> None:
         _LOGGER.debug("Running driver")
         await config.async_create_default_config(hass)
-        await hass.async_start()
 
         hash = hashlib.sha256()
-        hash.update(self._synthetic_home_config.encode())
+        hash.update(str(self._synthetic_home_config).encode())
         unique_id = hash.hexdigest()
 
         _LOGGER.debug("Creating configuration entry")
@@ -42,7 +56,11 @@ class Driver(runner.Runner):
             title="Synthetic Home",
             data={"config_filename": str(self._synthetic_home_config)},
         )
-        _LOGGER.debug("Setting up configuration entry")
-        await hass.config_entries.async_add(entry)
+        if self._simulation is not None:
+            _LOGGER.debug("Simulating history")
+            await async_run_simulation(hass, entry, self._simulation)
+        else:
+            _LOGGER.debug("Setting up configuration entry")
+            await hass.config_entries.async_add(entry)
 
         _LOGGER.debug("Done; Shutting down")
@@ -3,6 +3,11 @@
 You can subclass a home assistant runner and add additional methods that should
 be run after the event loop is started, which can be used to do things like
 install custom components or configure the instance.
+
+A `BatchRunner` runs many runners in a single Home Assistant instance. Each
+runner gets its own storage directory and empty registries, without paying
+for starting Home Assistant again. Runners whose storage would differ from
+running on their own are left for the caller to run separately.
 """
 
 import asyncio
@@ -14,6 +19,7 @@ from unittest import mock
 from collections.abc import Generator, AsyncGenerator
 from contextlib import asynccontextmanager, contextmanager
 
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant, CoreState, EVENT_HOMEASSISTANT_STOP
 from homeassistant import config_entries, loader
 from homeassistant import auth
@@ -23,14 +29,87 @@ from homeassistant.helpers import (
     entity,
     device_registry as dr,
     entity_registry as er,
+    floor_registry as fr,
     issue_registry as ir,
     restore_state as rs,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.util import dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
 _LOGGER = logging.getLogger(__name__)
 
+REGISTRIES = (ar, dr, er, fr, ir)
+"""Registries that are loaded for each storage directory."""
+
+PER_DIRECTORY_STORAGE_KEYS = {
+    config_entries.STORAGE_KEY,
+    rs.STORAGE_KEY,
+    *(registry.STORAGE_KEY for registry in REGISTRIES),
+}
+"""Stores that are recreated for each storage directory."""
+
+
+def _create_config_entries(hass: HomeAssistant) -> config_entries.ConfigEntries:
+    """Return an empty set of config entries."""
+    return config_entries.ConfigEntries(
+        hass,
+        {
+            "_": (
+                "Not empty or else some bad checks for hass config in discovery.py"
+                " breaks"
+            )
+        },
+    )
+
+
+async def async_load_registries(hass: HomeAssistant) -> None:
+    """Load the registries from the storage directory."""
+    for registry in REGISTRIES:
+        await registry.async_load(hass)
+
+
+async def async_flush_storage(hass: HomeAssistant) -> None:
+    """Unload all config entries and write pending changes to the storage directory."""
+    for entry in hass.config_entries.async_entries():
+        await hass.config_entries.async_unload(entry.entry_id)
+    # Removed entities leave their last state to be restored
+    await rs.async_get(hass).async_dump_states()
+    # Stores with delayed saves write their data on the final write event
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+
+async def async_use_storage_dir(hass: HomeAssistant, storage_dir: pathlib.Path) -> None:
+    """Point Home Assistant at a new storage directory with empty registries.
+
+    A store keeps the path it was first written to, so the config entries,
+    registries and restore state are recreated with stores in the new
+    directory. Pending changes must be flushed before switching directories.
+    Stores of integrations that are set up once, such as the exposed entity
+    settings of the `homeassistant` integration, stay in the first directory.
+    See `shared_storage` to detect them.
+    """
+    hass.config.config_dir = str(storage_dir)
+    hass.config_entries = _create_config_entries(hass)
+    for registry in REGISTRIES:
+        hass.data.pop(registry.DATA_REGISTRY, None)
+    await async_load_registries(hass)
+    hass.data.pop(rs.DATA_RESTORE_STATE, None)
+    await rs.async_load(hass)
+
+
+def shared_storage(storage_dir: pathlib.Path) -> dict[str, int]:
+    """Return the modification time of stores not recreated for each directory."""
+    storage = storage_dir / STORAGE_DIR
+    if not storage.is_dir():
+        return {}
+    return {
+        path.name: path.stat().st_mtime_ns
+        for path in storage.iterdir()
+        if path.name not in PER_DIRECTORY_STORAGE_KEYS
+    }
+
 
 @asynccontextmanager
 async def async_create_home_assistant(
@@ -49,33 +128,25 @@ async def async_create_home_assistant(
     hass.config.latitude = 32.87336
     hass.config.longitude = -117.22743
     hass.config.elevation = 0
-    hass.config.set_time_zone("US/Pacific")
+    await hass.config.async_set_time_zone("US/Pacific")
     hass.config.units = METRIC_SYSTEM
     hass.config.skip_pip = True
     hass.config.skip_pip_packages = []
 
-    hass.config_entries = config_entries.ConfigEntries(
-        hass,
-        {
-            "_": (
-                "Not empty or else some bad checks for hass config in discovery.py"
-                " breaks"
-            )
-        },
-    )
-    hass.bus.async_listen_once(
-        EVENT_HOMEASSISTANT_STOP, hass.config_entries._async_shutdown
-    )
+    hass.config_entries = _create_config_entries(hass)
+
+    async def async_shutdown_config_entries(event: Any) -> None:
+        """Shut down the config entries of the current storage directory."""
+        await hass.config_entries._async_shutdown(event)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_shutdown_config_entries)
 
     # Load the registries
     entity.async_setup(hass)
 
     loader.async_setup(hass)
 
-    await ar.async_load(hass)
-    await dr.async_load(hass)
-    await er.async_load(hass)
-    await ir.async_load(hass)
+    await async_load_registries(hass)
     await rs.async_load(hass)
 
     hass.set_state(CoreState.running)
@@ -89,13 +160,20 @@ async def async_create_home_assistant(
 class Runner:
     """A runner that invokes Home Assistant.
 
-    You can subclass this class and implement `async_run_in_loop`.
+    You can subclass this class and implement `_async_start` for work done once
+    when Home Assistant starts and `_async_run_in_loop` for the work that
+    populates the storage directory.
     """
 
     def __init__(self, storage_dir: pathlib.Path) -> None:
         """Initialize the driver."""
         self._storage_dir = storage_dir
 
+    @property
+    def storage_dir(self) -> pathlib.Path:
+        """Return the storage directory written by the runner."""
+        return self._storage_dir
+
     @contextmanager
     def _home_assistant(self) -> Generator[HomeAssistant, None, None]:
         """Return a Home Assistant object pointing at test config directory."""
@@ -117,9 +195,7 @@ class Runner:
 
         def start_hass(*mocks: Any) -> None:
             """Start hass."""
-            asyncio.run_coroutine_threadsafe(
-                self._async_run_in_loop(hass), loop
-            ).result()
+            asyncio.run_coroutine_threadsafe(self._async_run(hass), loop).result()
 
         def stop_hass() -> None:
             """Stop hass."""
@@ -135,6 +211,15 @@ class Runner:
         loop.run_until_complete(context_manager.__aexit__(None, None, None))
         loop.close()
 
+    async def _async_run(self, hass: HomeAssistant) -> None:
+        """Start Home Assistant and run the work in the event loop."""
+        await self._async_start(hass)
+        await self._async_run_in_loop(hass)
+
+    async def _async_start(self, hass: HomeAssistant) -> None:
+        """Run once in the Home Assistant event loop before any work."""
+        pass
+
     async def _async_run_in_loop(self, hass: HomeAssistant) -> None:
         """Run in the Home Assistant event loop."""
         pass
@@ -144,3 +229,69 @@ class Runner:
         with self._home_assistant() as hass:
             hass.start()
             hass.stop()
+
+
+class BatchRunner(Runner):
+    """A runner that runs other runners in a single Home Assistant instance.
+
+    Home Assistant is started once. Before each runner the storage directory is
+    switched and the config entries, registries and restore state are reloaded
+    from it, and afterwards its config entries are unloaded and storage is
+    flushed.
+
+    Stores of integrations that are set up during the first runner keep
+    writing to its storage directory. When the first runner wrote such a
+    store that a later runner lacks, or a later runner changed one, the
+    storage of those runners differs from running on their own. They are
+    moved to `unbatched` along with the runners after them, and the caller
+    must run them again in their own Home Assistant instance.
+    """
+
+    def __init__(self, runners: list[Runner]) -> None:
+        """Initialize the batch runner."""
+        super().__init__(runners[0].storage_dir)
+        self._runners = runners
+        self.failures: list[Runner] = []
+        self.unbatched: list[Runner] = []
+
+    async def _async_start(self, hass: HomeAssistant) -> None:
+        """Run the start hook of the first runner, shared by all runners."""
+        await self._runners[0]._async_start(hass)
+
+    async def _async_run_in_loop(self, hass: HomeAssistant) -> None:
+        """Run each runner with its own storage directory."""
+        shared: dict[str, int] = {}
+        for index, runner in enumerate(self._runners):
+            if index > 0:
+                await async_use_storage_dir(hass, runner.storage_dir)
+            try:
+                await runner._async_run_in_loop(hass)
+            except Exception:
+                _LOGGER.exception("Failed to run in %s", runner.storage_dir)
+                self.failures.append(runner)
+            await async_flush_storage(hass)
+
+            if index == 0:
+                shared = await hass.async_add_executor_job(
+                    shared_storage, runner.storage_dir
+                )
+                continue
+            first = await hass.async_add_executor_job(shared_storage, self.storage_dir)
+            if first != shared:
+                # The runner wrote to stores in the first storage directory
+                self._unbatch([self._runners[0], *self._runners[index:]])
+                return
+            own = await hass.async_add_executor_job(shared_storage, runner.storage_dir)
+            if missing := shared.keys() - own.keys():
+                _LOGGER.debug("Stores %s are shared by runners", sorted(missing))
+                self._unbatch(self._runners[index:])
+                return
+
+    def _unbatch(self, runners: list[Runner]) -> None:
+        """Leave the runners to be run on their own."""
+        _LOGGER.info(
+            "Storage of %d runners differs in a batch, they must run on their own",
+            len(runners),
+        )
+        self.unbatched = runners
+        self.failures = [runner for runner in self.failures if runner not in runners]
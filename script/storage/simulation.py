@@ -0,0 +1,210 @@
+"""Simulated time progression for generating synthetic history.
+
+The virtual clock of a synthetic home is stepped over a window of time as
+fast as possible. Activity patterns turn entities on and off as the hours
+pass, and sensors that declare a profile replay a generated series. Home
+Assistant stamps state changes with the virtual time, so the recorder writes
+history as if the time had really passed.
+"""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import datetime
+import logging
+import random
+from unittest import mock
+
+from homeassistant import config_entries, core
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity, entity_registry as er
+from homeassistant.helpers.recorder import get_instance
+from homeassistant.setup import async_setup_component
+
+from custom_components.synthetic_home.clock import VirtualClock, async_get_clock
+from custom_components.synthetic_home.const import CONF_FILENAME
+from custom_components.synthetic_home.model import (
+    async_parse_home_config,
+    config_file_path,
+)
+from custom_components.synthetic_home.scenario import async_config_entry_entities
+from custom_components.synthetic_home.sensor import SyntheticHomeSensor
+from custom_components.synthetic_home.timeseries import (
+    SensorSeries,
+    generate_series,
+    sensor_profiles,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Probability that an entity is on for each hour of the day
+MORNING_AND_EVENING = (
+    (0.05,) * 6 + (0.5, 0.7, 0.4) + (0.1,) * 8 + (0.4, 0.7, 0.8, 0.8, 0.6, 0.3, 0.1)
+)
+DAYTIME = (0.0,) * 7 + (0.8,) + (0.95,) * 11 + (0.6, 0.1) + (0.0,) * 3
+OCCASIONAL = (0.02,) * 7 + (0.2,) * 10 + (0.3,) * 5 + (0.05,) * 2
+
+
+@dataclass(frozen=True)
+class ActivityPattern:
+    """How often entities in the domains are on for each hour of the day."""
+
+    domains: tuple[str, ...]
+    hourly: tuple[float, ...]
+    turn_on: str = "turn_on"
+    turn_off: str = "turn_off"
+
+
+ACTIVITY_PATTERNS = (
+    ActivityPattern(("light",), MORNING_AND_EVENING),
+    ActivityPattern(("switch", "fan"), OCCASIONAL),
+    ActivityPattern(("cover",), DAYTIME, "open_cover", "close_cover"),
+)
+
+
+@dataclass(frozen=True)
+class Simulation:
+    """Settings for simulating a window of time that ends now."""
+
+    window: datetime.timedelta
+    step: datetime.timedelta = datetime.timedelta(minutes=5)
+    seed: int = 0
+    patterns: tuple[ActivityPattern, ...] = ACTIVITY_PATTERNS
+
+
+class _VirtualTime:
+    """Stand-in for the time module that reads the virtual clock."""
+
+    def __init__(self, clock: VirtualClock) -> None:
+        """Initialize _VirtualTime."""
+        self._clock = clock
+
+    def time(self) -> float:
+        """Return the virtual time as a timestamp."""
+        return self._clock.now().timestamp()
+
+
+@contextmanager
+def virtual_time(clock: VirtualClock) -> Generator[None, None, None]:
+    """Stamp state changes and events with the virtual time of the clock."""
+    fake_time = _VirtualTime(clock)
+    with (
+        mock.patch.object(core, "time", fake_time),
+        mock.patch.object(entity, "timer", fake_time.time),
+    ):
+        yield
+
+
+async def async_setup_recorder(hass: HomeAssistant) -> None:
+    """Set up the recorder that writes the simulated history."""
+    # Simulated history is in the past and must not be purged
+    await async_setup_component(hass, "recorder", {"recorder": {"auto_purge": False}})
+    await get_instance(hass).async_db_ready
+
+
+async def _async_apply_activity(
+    hass: HomeAssistant,
+    rng: random.Random,
+    entities: dict[str, ActivityPattern],
+    now: datetime.datetime,
+) -> None:
+    """Turn entities on or off based on the activity pattern for the hour."""
+    for entity_id, pattern in entities.items():
+        if hass.states.get(entity_id) is None:
+            continue
+        on = rng.random() < pattern.hourly[now.hour]
+        try:
+            await hass.services.async_call(
+                entity_id.split(".", maxsplit=1)[0],
+                pattern.turn_on if on else pattern.turn_off,
+                {ATTR_ENTITY_ID: entity_id},
+                blocking=True,
+            )
+        except HomeAssistantError as err:
+            _LOGGER.debug("Unable to change %s: %s", entity_id, err)
+
+
+async def _async_generate_sensor_series(
+    hass: HomeAssistant,
+    entry: config_entries.ConfigEntry,
+    simulation: Simulation,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> tuple[list[SyntheticHomeSensor], SensorSeries] | None:
+    """Generate the series of the sensors in the home that declare a profile."""
+    config_file = config_file_path(hass, entry.data[CONF_FILENAME])
+    home = await async_parse_home_config(hass, config_file)
+    if not (profiles := sensor_profiles(home)):
+        return None
+    entities = async_config_entry_entities(hass, entry)
+    sensors = {
+        entity_id: sensor
+        for entity_id in profiles
+        if isinstance(sensor := entities.get(entity_id), SyntheticHomeSensor)
+    }
+    try:
+        series = await hass.async_add_executor_job(
+            generate_series,
+            [profiles[entity_id] for entity_id in sensors],
+            start,
+            end,
+            simulation.step,
+            simulation.seed,
+        )
+    except ImportError as err:
+        _LOGGER.warning("Not generating series for %d sensors: %s", len(sensors), err)
+        return None
+    return list(sensors.values()), series
+
+
+async def async_run_simulation(
+    hass: HomeAssistant,
+    entry: config_entries.ConfigEntry,
+    simulation: Simulation,
+) -> None:
+    """Set up the config entry at the start of the window and step to now."""
+    rng = random.Random(simulation.seed)
+    clock = async_get_clock(hass, entry.entry_id)
+    end = clock.now()
+    clock.async_set_speed(0)
+    start = end - simulation.window
+    clock.async_set_time(start)
+
+    with virtual_time(clock):
+        await hass.config_entries.async_add(entry)
+        patterns = {
+            domain: pattern
+            for pattern in simulation.patterns
+            for domain in pattern.domains
+        }
+        entities = {
+            entity_entry.entity_id: patterns[entity_entry.domain]
+            for entity_entry in er.async_entries_for_config_entry(
+                er.async_get(hass), entry.entry_id
+            )
+            if entity_entry.domain in patterns
+        }
+        _LOGGER.debug(
+            "Simulating %s of activity for %d entities",
+            simulation.window,
+            len(entities),
+        )
+        sensor_series = await _async_generate_sensor_series(
+            hass, entry, simulation, start, end
+        )
+        hour: int | None = None
+        index = 0
+        while (now := clock.now()) < end:
+            if now.hour != hour:
+                hour = now.hour
+                await _async_apply_activity(hass, rng, entities, now)
+            if sensor_series is not None and index < sensor_series[1].values.shape[1]:
+                sensors, series = sensor_series
+                for sensor, value in zip(sensors, series.values[:, index]):
+                    sensor.async_set_native_value(round(float(value), 2))
+            index += 1
+            clock.async_advance(simulation.step)
+            await hass.async_block_till_done()
+        await get_instance(hass).async_block_till_done()
@@ -2,7 +2,8 @@
 
 import pathlib
 from collections.abc import Generator, AsyncGenerator
-from unittest.mock import patch, mock_open
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 from syrupy import SnapshotAssertion
@@ -14,6 +15,7 @@ from homeassistant.setup import async_setup_component
 from syrupy.extensions.amber import AmberSnapshotExtension
 from syrupy.location import PyTestLocation
 
+from custom_components.synthetic_home.cache import ParsedHomeCache
 from custom_components.synthetic_home.const import (
     DOMAIN,
     CONF_FILENAME,
@@ -54,10 +56,20 @@ def auto_enable_custom_integrations(
     yield
 
 
+@pytest.fixture(name="config_entry_options")
+def mock_config_entry_options() -> dict[str, Any]:
+    """Fixture for the options of the mock configuration entry."""
+    return {}
+
+
 @pytest.fixture(name="config_entry")
-def mock_config_entry() -> MockConfigEntry:
+def mock_config_entry(config_entry_options: dict[str, Any]) -> MockConfigEntry:
     """Fixture for mock configuration entry."""
-    return MockConfigEntry(domain=DOMAIN, data={CONF_FILENAME: TEST_FILENAME})
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_FILENAME: TEST_FILENAME},
+        options=config_entry_options,
+    )
 
 
 @pytest.fixture(name="platforms")
@@ -101,11 +113,22 @@ def mock_config_content(config_yaml: str) -> Generator[None, None, None]:
     """Mock out the yaml config file contents."""
     with patch(
         "synthetic_home.inventory.read_config_content",
-        mock_open(read_data=config_yaml),
+        return_value=config_yaml,
     ):
         yield
 
 
+@pytest.fixture(autouse=True)
+def mock_home_cache(tmp_path: pathlib.Path) -> Generator[ParsedHomeCache, None, None]:
+    """Store the parsed home cache in a temporary directory."""
+    home_cache = ParsedHomeCache(tmp_path / "cache")
+    with patch(
+        "custom_components.synthetic_home.get_home_cache",
+        return_value=home_cache,
+    ):
+        yield home_cache
+
+
 @pytest.fixture
 def mock_api_client(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
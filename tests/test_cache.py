@@ -0,0 +1,42 @@
+"""Tests for the Synthetic Home parsed home cache."""
+
+import pathlib
+
+from custom_components.synthetic_home.cache import ParsedHomeCache, cache_key
+
+CONFIG_FILE = pathlib.Path("example.yaml")
+
+
+def test_cache_key() -> None:
+    """Test that the cache key depends on the config file content."""
+    assert cache_key("areas: []") == cache_key("areas: []")
+    assert cache_key("areas: []") != cache_key("devices: []")
+
+
+def test_load_and_save(tmp_path: pathlib.Path) -> None:
+    """Test storing a value and loading it back from the cache."""
+    home_cache = ParsedHomeCache(tmp_path / "cache")
+    key = cache_key("content")
+
+    assert home_cache.load(CONFIG_FILE, key) is None
+
+    home_cache.save(CONFIG_FILE, key, {"value": 1})
+    assert home_cache.load(CONFIG_FILE, key) == {"value": 1}
+
+    # A changed config file is a cache miss and replaces the existing entry
+    new_key = cache_key("new content")
+    assert home_cache.load(CONFIG_FILE, new_key) is None
+    home_cache.save(CONFIG_FILE, new_key, {"value": 2})
+    assert home_cache.load(CONFIG_FILE, new_key) == {"value": 2}
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+def test_corrupt_cache_file(tmp_path: pathlib.Path) -> None:
+    """Test that an unreadable cache file is treated as a miss."""
+    home_cache = ParsedHomeCache(tmp_path)
+    key = cache_key("content")
+    home_cache.save(CONFIG_FILE, key, {"value": 1})
+    for cache_file in tmp_path.iterdir():
+        cache_file.write_bytes(b"not a pickle")
+
+    assert home_cache.load(CONFIG_FILE, key) is None
@@ -1,5 +1,7 @@
 """Test Synthetic Home calendar."""
 
+import datetime
+
 import pytest
 from typing import Any
 
@@ -9,6 +11,10 @@ from homeassistant.components.calendar import (
 )
 from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
 
 from .conftest import FIXTURES
 
@@ -42,17 +48,12 @@ async def test_calendar(
         )
         return response
 
+    # The only event is in the past so there is no active or upcoming event
     state = hass.states.get(test_entity)
     assert state
     assert state.state == "off"
     assert state.attributes == {
         "friendly_name": "Calendar Personal",
-        "all_day": False,
-        "description": "",
-        "message": "Bastille Day",
-        "location": "",
-        "start_time": "1997-07-14 10:00:00",
-        "end_time": "1997-07-14 21:00:00",
         "supported_features": 7,
     }
 
@@ -106,3 +107,102 @@ async def test_calendar(
             ],
         }
     }
+
+
+@pytest.mark.parametrize(
+    ("config_yaml_fixture", "test_entity"),
+    [(f"{FIXTURES}/calendar-example.yaml", "calendar.personal")],
+)
+async def test_upcoming_event(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+    test_entity: str,
+) -> None:
+    """Test that the state shows the next upcoming event."""
+
+    await hass.services.async_call(
+        CALENDAR_DOMAIN,
+        "create_event",
+        service_data={
+            ATTR_ENTITY_ID: test_entity,
+            "summary": "Future event",
+            "start_date_time": dt_util.now() + datetime.timedelta(hours=1),
+            "end_date_time": dt_util.now() + datetime.timedelta(hours=2),
+        },
+        blocking=True,
+    )
+    state = hass.states.get(test_entity)
+    assert state
+    assert state.state == "off"
+    assert state.attributes["message"] == "Future event"
+
+
+@pytest.mark.parametrize(
+    ("config_yaml_fixture", "test_entity"),
+    [(f"{FIXTURES}/calendar-example.yaml", "calendar.personal")],
+)
+async def test_update_and_delete_event(
+    hass: HomeAssistant,
+    setup_integration: None,
+    hass_ws_client: WebSocketGenerator,
+    test_entity: str,
+) -> None:
+    """Test updating and deleting an event from the config."""
+
+    async def list_events() -> list[str]:
+        response = await hass.services.async_call(
+            CALENDAR_DOMAIN,
+            "get_events",
+            service_data={
+                ATTR_ENTITY_ID: test_entity,
+                "start_date_time": "1997-07-14 00:00:00",
+                "duration": "24:00",
+            },
+            blocking=True,
+            return_response=True,
+        )
+        return [event["summary"] for event in response[test_entity]["events"]]
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {
+            "type": "calendar/event/update",
+            "entity_id": test_entity,
+            "uid": "0",
+            "event": {
+                "summary": "Fête nationale",
+                "dtstart": "1997-07-14T17:00:00+00:00",
+                "dtend": "1997-07-15T04:00:00+00:00",
+            },
+        }
+    )
+    result = await client.receive_json()
+    assert result["success"]
+    assert await list_events() == ["Fête nationale"]
+
+    await client.send_json_auto_id(
+        {
+            "type": "calendar/event/delete",
+            "entity_id": test_entity,
+            "uid": "0",
+            "recurrence_id": "19970714T170000",
+            "recurrence_range": "THISANDFUTURE",
+        }
+    )
+    result = await client.receive_json()
+    assert not result["success"]
+    assert await list_events() == ["Fête nationale"]
+
+    await client.send_json_auto_id(
+        {"type": "calendar/event/delete", "entity_id": test_entity, "uid": "0"}
+    )
+    result = await client.receive_json()
+    assert result["success"]
+    assert await list_events() == []
+
+    await client.send_json_auto_id(
+        {"type": "calendar/event/delete", "entity_id": test_entity, "uid": "0"}
+    )
+    result = await client.receive_json()
+    assert not result["success"]
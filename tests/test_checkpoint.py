@@ -0,0 +1,94 @@
+"""Test Synthetic Home entity state checkpoints."""
+
+import pytest
+
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    Platform,
+)
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+from homeassistant.auth.models import User
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, Unauthorized
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.synthetic_home.const import DOMAIN
+
+from .conftest import FIXTURES
+
+TEST_ENTITY = "switch.smart_feeder"
+
+
+@pytest.fixture(name="platforms")
+def mock_platforms() -> list[Platform]:
+    """Set up switch platform."""
+    return [Platform.SWITCH]
+
+
+@pytest.mark.parametrize(("config_yaml_fixture"), [f"{FIXTURES}/switch-example.yaml"])
+async def test_save_and_restore(
+    hass: HomeAssistant, setup_integration: None, config_entry: MockConfigEntry
+) -> None:
+    """Test restoring the entities that changed since a checkpoint."""
+
+    async def restore() -> list[str]:
+        response = await hass.services.async_call(
+            DOMAIN,
+            "restore_checkpoint",
+            service_data={"config_entry_id": config_entry.entry_id},
+            blocking=True,
+            return_response=True,
+        )
+        return response["changed_entities"]
+
+    with pytest.raises(HomeAssistantError, match="no checkpoint"):
+        await restore()
+
+    await hass.services.async_call(
+        DOMAIN,
+        "save_checkpoint",
+        service_data={"config_entry_id": config_entry.entry_id},
+        blocking=True,
+    )
+    assert await restore() == []
+
+    await hass.services.async_call(
+        SWITCH_DOMAIN,
+        SERVICE_TURN_OFF,
+        service_data={ATTR_ENTITY_ID: TEST_ENTITY},
+        blocking=True,
+    )
+    state = hass.states.get(TEST_ENTITY)
+    assert state
+    assert state.state == "off"
+
+    assert await restore() == [TEST_ENTITY]
+    state = hass.states.get(TEST_ENTITY)
+    assert state
+    assert state.state == "on"
+
+    # Nothing changed since the last restore
+    assert await restore() == []
+
+
+@pytest.mark.parametrize(("config_yaml_fixture"), [f"{FIXTURES}/switch-example.yaml"])
+@pytest.mark.parametrize("service", ["save_checkpoint", "restore_checkpoint"])
+async def test_checkpoint_services_require_admin(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+    hass_read_only_user: User,
+    service: str,
+) -> None:
+    """Test that saving and restoring checkpoints requires an admin user."""
+
+    with pytest.raises(Unauthorized):
+        await hass.services.async_call(
+            DOMAIN,
+            service,
+            service_data={"config_entry_id": config_entry.entry_id},
+            blocking=True,
+            context=Context(user_id=hass_read_only_user.id),
+        )
@@ -0,0 +1,60 @@
+"""Tests for the Synthetic Home virtual clock."""
+
+import datetime
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.synthetic_home.clock import VirtualClock
+
+
+async def test_virtual_time(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that virtual time follows the speed of the clock and steps."""
+    clock = VirtualClock(hass)
+    start = clock.now()
+    assert start == dt_util.now()
+
+    freezer.tick(datetime.timedelta(seconds=10))
+    assert clock.now() - start == datetime.timedelta(seconds=10)
+
+    clock.async_set_speed(60)
+    freezer.tick(datetime.timedelta(seconds=10))
+    assert clock.now() - start == datetime.timedelta(minutes=10, seconds=10)
+
+    clock.async_set_speed(0)
+    freezer.tick(datetime.timedelta(seconds=10))
+    assert clock.now() - start == datetime.timedelta(minutes=10, seconds=10)
+
+    clock.async_advance(datetime.timedelta(hours=1))
+    assert clock.now() - start == datetime.timedelta(hours=1, minutes=10, seconds=10)
+
+    clock.async_set_time(start - datetime.timedelta(days=7))
+    assert clock.now() == start - datetime.timedelta(days=7)
+
+    with pytest.raises(ValueError):
+        clock.async_set_speed(-1)
+
+
+async def test_tick_scheduler(hass: HomeAssistant) -> None:
+    """Test that stepping the clock runs the ticks that elapsed."""
+    clock = VirtualClock(hass)
+    clock.async_set_speed(0)
+    scheduler = clock.async_get_tick_scheduler(datetime.timedelta(seconds=1))
+    ticks: list[datetime.datetime] = []
+    unsub = scheduler.async_subscribe(ticks.append)
+    assert scheduler.active
+
+    clock.async_advance(datetime.timedelta(milliseconds=2500))
+    assert len(ticks) == 2
+    clock.async_advance(datetime.timedelta(milliseconds=500))
+    assert len(ticks) == 3
+
+    unsub()
+    assert not scheduler.active
+    clock.async_advance(datetime.timedelta(seconds=5))
+    assert len(ticks) == 3
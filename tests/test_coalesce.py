@@ -0,0 +1,96 @@
+"""Test Synthetic Home coalesced state writes."""
+
+import datetime
+
+import pytest
+
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_STATE_CHANGED,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    Platform,
+)
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.synthetic_home.const import (
+    CONF_COALESCE_WINDOW,
+    CONF_COALESCE_WRITES,
+)
+
+from .conftest import FIXTURES
+
+TEST_ENTITY = "switch.smart_feeder"
+
+
+@pytest.fixture(name="platforms")
+def mock_platforms() -> list[Platform]:
+    """Set up switch platform."""
+    return [Platform.SWITCH]
+
+
+@pytest.mark.parametrize(
+    ("config_yaml_fixture", "config_entry_options"),
+    [
+        (
+            f"{FIXTURES}/switch-example.yaml",
+            {CONF_COALESCE_WRITES: True, CONF_COALESCE_WINDOW: 5},
+        )
+    ],
+)
+async def test_coalesce_window(hass: HomeAssistant, setup_integration: None) -> None:
+    """Test that writes within the window are merged into a single write."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    for service in (SERVICE_TURN_OFF, SERVICE_TURN_ON, SERVICE_TURN_OFF):
+        await hass.services.async_call(
+            SWITCH_DOMAIN,
+            service,
+            service_data={ATTR_ENTITY_ID: TEST_ENTITY},
+            blocking=True,
+        )
+    await hass.async_block_till_done()
+    state = hass.states.get(TEST_ENTITY)
+    assert state
+    assert state.state == "on"
+    assert not events
+
+    async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(seconds=5))
+    await hass.async_block_till_done()
+    state = hass.states.get(TEST_ENTITY)
+    assert state
+    assert state.state == "off"
+    assert len(events) == 1
+
+
+@pytest.mark.parametrize(
+    ("config_yaml_fixture", "config_entry_options"),
+    [
+        (
+            f"{FIXTURES}/switch-example.yaml",
+            {CONF_COALESCE_WRITES: True, CONF_COALESCE_WINDOW: 0},
+        )
+    ],
+)
+async def test_coalesce_loop_iteration(
+    hass: HomeAssistant, setup_integration: None
+) -> None:
+    """Test that writes are flushed on the next iteration of the event loop."""
+
+    await hass.services.async_call(
+        SWITCH_DOMAIN,
+        SERVICE_TURN_OFF,
+        service_data={ATTR_ENTITY_ID: TEST_ENTITY},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get(TEST_ENTITY)
+    assert state
+    assert state.state == "off"
@@ -8,7 +8,18 @@ from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResultType
 
 
-from custom_components.synthetic_home.const import DOMAIN, CONF_FILENAME
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.synthetic_home.const import (
+    CONF_COALESCE_WINDOW,
+    CONF_COALESCE_WRITES,
+    CONF_COVER_MOTION,
+    CONF_COVER_STEP,
+    CONF_COVER_STEP_TIME,
+    CONF_COVER_TRAVEL_TIME,
+    DOMAIN,
+    CONF_FILENAME,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -57,3 +68,32 @@ async def test_successful_config_flow(hass):
     assert result["title"] == "example.yaml"
     assert result["data"] == {CONF_FILENAME: "example.yaml"}
     assert result["result"]
+
+
+async def test_options_flow(hass):
+    """Test changing the cover motion profile in the options flow."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data={CONF_FILENAME: "example.yaml"})
+    config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_COVER_MOTION: "timed",
+            CONF_COVER_STEP: 20,
+            CONF_COVER_STEP_TIME: 0.5,
+            CONF_COVER_TRAVEL_TIME: 30,
+        },
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert config_entry.options == {
+        CONF_COVER_MOTION: "timed",
+        CONF_COVER_STEP: 20,
+        CONF_COVER_STEP_TIME: 0.5,
+        CONF_COVER_TRAVEL_TIME: 30,
+        CONF_COALESCE_WRITES: False,
+        CONF_COALESCE_WINDOW: 0.0,
+    }
@@ -14,12 +14,22 @@ from homeassistant.components.cover import (
     ATTR_POSITION,
 )
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import HomeAssistant
+from homeassistant.auth.models import User
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.exceptions import Unauthorized
 from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.synthetic_home.clock import async_get_clock
+from custom_components.synthetic_home.const import (
+    CONF_COVER_MOTION,
+    CONF_COVER_TRAVEL_TIME,
+    DEFAULT_COVER_STEP_TIME,
+    DOMAIN,
+)
+
 from .conftest import FIXTURES
 
 
@@ -104,6 +114,44 @@ async def test_smart_blinds(
     }
 
 
+@pytest.mark.parametrize(
+    ("config_yaml_fixture"),
+    [(f"{FIXTURES}/smart-blinds-example.yaml")],
+)
+async def test_covers_share_tick_scheduler(
+    hass: HomeAssistant, setup_integration: None, config_entry: MockConfigEntry
+) -> None:
+    """Test that moving covers are advanced by a single shared timer."""
+    clock = async_get_clock(hass, config_entry.entry_id)
+    scheduler = clock.async_get_tick_scheduler(
+        datetime.timedelta(seconds=DEFAULT_COVER_STEP_TIME)
+    )
+    assert not scheduler.active
+
+    await hass.services.async_call(
+        COVER_DOMAIN,
+        SERVICE_OPEN_COVER,
+        service_data={ATTR_ENTITY_ID: ["cover.left_shade", "cover.right_shade"]},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert scheduler.active
+
+    for _ in range(11):
+        future = dt_util.utcnow() + datetime.timedelta(seconds=1)
+        async_fire_time_changed(hass, future)
+        await hass.async_block_till_done()
+
+    for entity_id in ("cover.left_shade", "cover.right_shade"):
+        state = hass.states.get(entity_id)
+        assert state
+        assert state.state == "open"
+        assert state.attributes["current_position"] == 100
+
+    # The shared timer stops once all covers reached their target
+    assert not scheduler.active
+
+
 @pytest.mark.parametrize(
     ("config_yaml_fixture", "test_entity"),
     [(f"{FIXTURES}/garage-door-example.yaml", "cover.garage_door")],
@@ -218,3 +266,213 @@ async def test_smart_blinds_states(
     state = hass.states.get("cover.left_shade")
     assert state
     assert (state.state, state.attributes) == snapshot
+
+
+@pytest.mark.parametrize(
+    ("config_yaml_fixture", "test_entity"),
+    [(f"{FIXTURES}/garage-door-example.yaml", "cover.garage_door")],
+)
+async def test_advance_clock(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+    test_entity: str,
+) -> None:
+    """Test that a cover moves when the virtual clock is stepped forward."""
+
+    await hass.services.async_call(
+        DOMAIN,
+        "set_clock_speed",
+        service_data={"config_entry_id": config_entry.entry_id, "speed": 0},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        COVER_DOMAIN,
+        SERVICE_OPEN_COVER,
+        service_data={ATTR_ENTITY_ID: test_entity},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    # Real time passing has no effect while the clock is paused
+    async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(seconds=5))
+    await hass.async_block_till_done()
+    state = hass.states.get(test_entity)
+    assert state
+    assert state.state == "opening"
+    assert state.attributes["current_position"] == 0
+
+    await hass.services.async_call(
+        DOMAIN,
+        "advance_clock",
+        service_data={"config_entry_id": config_entry.entry_id, "duration": "00:00:05"},
+        blocking=True,
+    )
+    state = hass.states.get(test_entity)
+    assert state
+    assert state.state == "opening"
+    assert state.attributes["current_position"] == 50
+
+    await hass.services.async_call(
+        DOMAIN,
+        "advance_clock",
+        service_data={"config_entry_id": config_entry.entry_id, "duration": "00:01:00"},
+        blocking=True,
+    )
+    state = hass.states.get(test_entity)
+    assert state
+    assert state.state == "open"
+    assert state.attributes["current_position"] == 100
+
+
+@pytest.mark.parametrize(
+    ("config_yaml_fixture"), [f"{FIXTURES}/garage-door-example.yaml"]
+)
+async def test_clock_services_require_admin(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+    hass_read_only_user: User,
+) -> None:
+    """Test that changing the virtual clock requires an admin user."""
+
+    clock = async_get_clock(hass, config_entry.entry_id)
+    context = Context(user_id=hass_read_only_user.id)
+    with pytest.raises(Unauthorized):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_clock_speed",
+            service_data={"config_entry_id": config_entry.entry_id, "speed": 0},
+            blocking=True,
+            context=context,
+        )
+    with pytest.raises(Unauthorized):
+        await hass.services.async_call(
+            DOMAIN,
+            "advance_clock",
+            service_data={
+                "config_entry_id": config_entry.entry_id,
+                "duration": "01:00:00",
+            },
+            blocking=True,
+            context=context,
+        )
+    assert abs(clock.now() - dt_util.now()) < datetime.timedelta(minutes=1)
+
+
+@pytest.mark.parametrize(
+    ("config_yaml_fixture", "test_entity"),
+    [(f"{FIXTURES}/garage-door-example.yaml", "cover.garage_door")],
+)
+async def test_clock_speed(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+    test_entity: str,
+) -> None:
+    """Test that a cover moves faster when the virtual clock runs faster."""
+
+    await hass.services.async_call(
+        DOMAIN,
+        "set_clock_speed",
+        service_data={"config_entry_id": config_entry.entry_id, "speed": 10},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        COVER_DOMAIN,
+        SERVICE_OPEN_COVER,
+        service_data={ATTR_ENTITY_ID: test_entity},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    for _ in range(11):
+        future = dt_util.utcnow() + datetime.timedelta(milliseconds=100)
+        async_fire_time_changed(hass, future)
+        await hass.async_block_till_done()
+
+    state = hass.states.get(test_entity)
+    assert state
+    assert state.state == "open"
+
+
+@pytest.mark.parametrize(
+    ("config_yaml_fixture", "test_entity", "config_entry_options"),
+    [
+        (
+            f"{FIXTURES}/garage-door-example.yaml",
+            "cover.garage_door",
+            {CONF_COVER_MOTION: "instant"},
+        )
+    ],
+)
+async def test_instant_motion(
+    hass: HomeAssistant, setup_integration: None, test_entity: str
+) -> None:
+    """Test a cover configured to move instantly."""
+
+    await hass.services.async_call(
+        COVER_DOMAIN,
+        SERVICE_OPEN_COVER,
+        service_data={ATTR_ENTITY_ID: test_entity},
+        blocking=True,
+    )
+    state = hass.states.get(test_entity)
+    assert state
+    assert state.state == "open"
+    assert state.attributes["current_position"] == 100
+
+
+@pytest.mark.parametrize(
+    ("config_yaml_fixture", "test_entity", "config_entry_options"),
+    [
+        (
+            f"{FIXTURES}/garage-door-example.yaml",
+            "cover.garage_door",
+            {CONF_COVER_MOTION: "timed", CONF_COVER_TRAVEL_TIME: 4},
+        )
+    ],
+)
+async def test_timed_motion(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+    test_entity: str,
+) -> None:
+    """Test a cover whose position follows the time spent moving."""
+
+    await hass.services.async_call(
+        DOMAIN,
+        "set_clock_speed",
+        service_data={"config_entry_id": config_entry.entry_id, "speed": 0},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        COVER_DOMAIN,
+        SERVICE_OPEN_COVER,
+        service_data={ATTR_ENTITY_ID: test_entity},
+        blocking=True,
+    )
+
+    positions = []
+    for _ in range(5):
+        await hass.services.async_call(
+            DOMAIN,
+            "advance_clock",
+            service_data={
+                "config_entry_id": config_entry.entry_id,
+                "duration": "00:00:01",
+            },
+            blocking=True,
+        )
+        state = hass.states.get(test_entity)
+        assert state
+        positions.append((state.state, state.attributes["current_position"]))
+
+    assert positions == [
+        ("opening", 25),
+        ("opening", 50),
+        ("opening", 75),
+        ("opening", 100),
+        ("open", 100),
+    ]
@@ -0,0 +1,47 @@
+"""Test Synthetic Home diagnostics."""
+
+import pytest
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.components.diagnostics import (
+    get_diagnostics_for_config_entry,
+)
+from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
+
+from custom_components.synthetic_home.const import DOMAIN
+
+from .conftest import FIXTURES
+
+
+@pytest.fixture(name="platforms")
+def mock_platforms() -> list[Platform]:
+    """Set up platform."""
+    return [Platform.LIGHT]
+
+
+@pytest.mark.parametrize(
+    ("config_yaml_fixture"),
+    [(f"{FIXTURES}/light-example.yaml")],
+)
+async def test_diagnostics(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test diagnostics load the inventory released after setup."""
+
+    synthetic_home = hass.data[DOMAIN][config_entry.entry_id]
+    assert synthetic_home.parsed_inventory is None
+    assert all(not entity.attributes for entity in synthetic_home.entities)
+
+    diagnostics = await get_diagnostics_for_config_entry(
+        hass, hass_client, config_entry
+    )
+    assert diagnostics["platform_entities"] == {"light": 1}
+    assert [entity["id"] for entity in diagnostics["inventory"]["entities"]] == [
+        "light.family_room"
+    ]
@@ -0,0 +1,106 @@
+"""Tests for the Synthetic Home calendar event store."""
+
+import datetime
+
+import pytest
+
+from homeassistant.components.calendar import CalendarEvent
+
+from custom_components.synthetic_home.event_store import EventStore
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+
+def make_event(uid: str, start_hours: int, duration_hours: int = 1) -> CalendarEvent:
+    """Create an event that starts a number of hours after START."""
+    start = START + datetime.timedelta(hours=start_hours)
+    return CalendarEvent(
+        uid=uid,
+        summary=f"Event {uid}",
+        start=start,
+        end=start + datetime.timedelta(hours=duration_hours),
+    )
+
+
+def uids(events: list[CalendarEvent]) -> list[str | None]:
+    """Return the uids of the events."""
+    return [event.uid for event in events]
+
+
+def test_range() -> None:
+    """Test querying events that overlap a range."""
+    store = EventStore(
+        [
+            make_event("c", 10),
+            make_event("a", 0),
+            make_event("long", 1, duration_hours=24),
+            make_event("b", 5),
+        ]
+    )
+    assert len(store) == 4
+    assert uids(list(store)) == ["a", "long", "b", "c"]
+
+    def query(start_hours: int, end_hours: int) -> list[str | None]:
+        return uids(
+            store.range(
+                START + datetime.timedelta(hours=start_hours),
+                START + datetime.timedelta(hours=end_hours),
+            )
+        )
+
+    assert query(4, 6) == ["long", "b"]
+    assert query(20, 30) == ["long"]
+    assert query(30, 40) == []
+
+
+def test_active_or_next() -> None:
+    """Test finding the active or next upcoming event."""
+    store = EventStore([make_event("a", 0), make_event("b", 5)])
+
+    assert store.active_or_next(START) == store.get("a")
+    assert store.active_or_next(START + datetime.timedelta(hours=2)) == store.get("b")
+    assert store.active_or_next(START + datetime.timedelta(hours=10)) is None
+
+
+def test_update_and_delete() -> None:
+    """Test updating and deleting events."""
+    store = EventStore([make_event("a", 0), make_event("b", 5)])
+
+    store.update("a", make_event("ignored", 8))
+    assert uids(list(store)) == ["b", "a"]
+    assert store.range(START, START + datetime.timedelta(hours=1)) == []
+
+    assert store.delete("b").uid == "b"
+    assert uids(list(store)) == ["a"]
+    with pytest.raises(KeyError):
+        store.delete("b")
+
+    with pytest.raises(ValueError, match="already exists"):
+        store.add(make_event("a", 1))
+
+
+def test_recurring_events() -> None:
+    """Test that a recurring event is stored once and expanded for a range."""
+    standup = make_event("standup", 9, duration_hours=1)
+    standup.rrule = "FREQ=DAILY;COUNT=1800"
+    store = EventStore([make_event("a", 0), standup, make_event("b", 33)])
+    assert len(store) == 3
+
+    # Events that start at the same time are ordered by uid
+    assert uids(store.range(START, START + datetime.timedelta(hours=40))) == [
+        "a",
+        "standup",
+        "b",
+        "standup",
+    ]
+    assert (
+        store.active_or_next(START + datetime.timedelta(hours=34))
+        == store.range(
+            START + datetime.timedelta(hours=57), START + datetime.timedelta(hours=58)
+        )[0]
+    )
+
+    store.delete("standup", recurrence_id="20240101T090000")
+    assert uids(store.range(START, START + datetime.timedelta(hours=12))) == ["a"]
+    store.delete("standup")
+    assert uids(list(store)) == ["a", "b"]
@@ -1,15 +1,27 @@
 """Test Synthetic Home initialization."""
 
+from unittest.mock import patch
+
 import pytest
 
+from homeassistant.components.conversation import DOMAIN as CONVERSATION_DOMAIN
+from homeassistant.components.homeassistant.exposed_entities import (
+    async_should_expose,
+)
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import (
     area_registry as ar,
+    device_registry as dr,
     floor_registry as fr,
     entity_registry as er,
 )
 from homeassistant.const import Platform
 
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.synthetic_home.const import DOMAIN
+
 INVENTORY = """
 ---
 areas:
@@ -79,3 +91,221 @@ async def test_entities(
     area_entry = area_registry.async_get_or_create("Garage")
     entity_entries = er.async_entries_for_area(entity_registry, area_entry.id)
     assert {entry.entity_id for entry in entity_entries} == {"light.garage_door"}
+
+
+@pytest.mark.parametrize(("config_yaml"), [INVENTORY], ids=["yaml"])
+@pytest.mark.parametrize(("platforms"), [[Platform.COVER, Platform.LIGHT]])
+async def test_skip_unused_platforms(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test that only platforms with entities in the inventory are set up."""
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert hass.states.get("light.garage_door")
+    assert Platform.LIGHT in hass.config.components
+    assert Platform.COVER not in hass.config.components
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.NOT_LOADED
+
+
+@pytest.mark.parametrize(("config_yaml"), [INVENTORY], ids=["yaml"])
+@pytest.mark.parametrize(("platforms"), [[Platform.LIGHT]])
+async def test_reload_from_cache(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test that reloading an unchanged home reuses the parsed home cache."""
+
+    with patch(
+        "custom_components.synthetic_home.model.parse_inventory",
+    ) as mock_parse_inventory:
+        assert await hass.config_entries.async_reload(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert not mock_parse_inventory.called
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert hass.states.get("light.garage_door")
+
+
+RELOAD_INVENTORY = """
+---
+areas:
+- name: Kitchen
+  id: kitchen
+devices:
+- name: Kitchen Light
+  id: kitchen_light
+  area: kitchen
+entities:
+- name: Kitchen Light
+  id: light.kitchen_light
+  device: kitchen_light
+  state: "off"
+  attributes:
+    supported_color_modes:
+    - onoff
+    color_mode: onoff
+- name: Porch Light
+  id: light.porch_light
+  state: "off"
+  attributes:
+    supported_color_modes:
+    - onoff
+    color_mode: onoff
+- name: Garage Light
+  id: light.garage_light
+  state: "off"
+  attributes:
+    supported_color_modes:
+    - onoff
+    color_mode: onoff
+"""
+
+UPDATED_RELOAD_INVENTORY = """
+---
+areas:
+- name: Kitchen
+  id: kitchen
+devices:
+- name: Kitchen Light
+  id: kitchen_light
+  area: kitchen
+entities:
+- name: Kitchen Light
+  id: light.kitchen_light
+  device: kitchen_light
+  state: "off"
+  attributes:
+    supported_color_modes:
+    - onoff
+    color_mode: onoff
+- name: Front Porch Light
+  id: light.porch_light
+  state: "off"
+  attributes:
+    supported_color_modes:
+    - onoff
+    color_mode: onoff
+- name: Hallway Light
+  id: light.hallway_light
+  state: "on"
+  attributes:
+    supported_color_modes:
+    - onoff
+    color_mode: onoff
+"""
+
+
+@pytest.mark.parametrize(("config_yaml"), [RELOAD_INVENTORY], ids=["yaml"])
+@pytest.mark.parametrize(("platforms"), [[Platform.LIGHT]])
+async def test_incremental_reload(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test that reloading only replaces the entities that changed."""
+
+    await hass.services.async_call(
+        "light",
+        "turn_on",
+        service_data={"entity_id": "light.kitchen_light"},
+        blocking=True,
+    )
+    state = hass.states.get("light.kitchen_light")
+    assert state
+    assert state.state == "on"
+
+    with patch(
+        "synthetic_home.inventory.read_config_content",
+        return_value=UPDATED_RELOAD_INVENTORY,
+    ):
+        await hass.services.async_call(DOMAIN, "reload", blocking=True)
+        await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+
+    # Unchanged entity keeps its current state
+    state = hass.states.get("light.kitchen_light")
+    assert state
+    assert state.state == "on"
+
+    # Changed entity was replaced
+    state = hass.states.get("light.porch_light")
+    assert state
+    assert state.attributes["friendly_name"] == "Front Porch Light"
+
+    # Added entity
+    state = hass.states.get("light.hallway_light")
+    assert state
+    assert state.state == "on"
+
+    # Removed entity
+    assert hass.states.get("light.garage_light") is None
+    assert entity_registry.async_get("light.garage_light") is None
+
+
+@pytest.mark.parametrize(("config_yaml"), [RELOAD_INVENTORY], ids=["yaml"])
+async def test_device_areas(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test that devices are created in their area and setup is repeatable."""
+
+    area_entry = area_registry.async_get_area_by_name("Kitchen")
+    assert area_entry
+    device_entry = device_registry.async_get_device(
+        identifiers={(DOMAIN, "kitchen_light")}
+    )
+    assert device_entry
+    assert device_entry.name == "Kitchen Light"
+    assert device_entry.area_id == area_entry.id
+
+    assert await hass.config_entries.async_reload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert (
+        len(dr.async_entries_for_config_entry(device_registry, config_entry.entry_id))
+        == 1
+    )
+    assert len(area_registry.async_list_areas()) == 1
+
+
+EXPOSED_INVENTORY = """
+---
+areas:
+- name: Garage
+  id: garage
+entities:
+- name: Garage Power
+  id: sensor.garage_power
+  area: garage
+  state: "10"
+"""
+
+
+@pytest.mark.parametrize(("config_yaml"), [EXPOSED_INVENTORY], ids=["yaml"])
+@pytest.mark.parametrize(("platforms"), [[Platform.SENSOR]])
+async def test_exposed_entities(
+    hass: HomeAssistant,
+    setup_integration: None,
+    entity_registry: er.EntityRegistry,
+    area_registry: ar.AreaRegistry,
+) -> None:
+    """Test that entities are exposed to conversation and assigned to areas."""
+
+    assert async_should_expose(hass, CONVERSATION_DOMAIN, "sensor.garage_power")
+
+    area_entry = area_registry.async_get_area_by_name("Garage")
+    assert area_entry
+    registry_entry = entity_registry.async_get("sensor.garage_power")
+    assert registry_entry
+    assert registry_entry.area_id == area_entry.id
@@ -0,0 +1,171 @@
+"""Tests for the Synthetic Home recurring calendar events."""
+
+import datetime
+
+import pytest
+
+from homeassistant.components.calendar import CalendarEvent
+
+from custom_components.synthetic_home.recurrence import RecurrenceRule, RecurringEvent
+
+START = datetime.datetime(2024, 1, 1, 9, 0, tzinfo=datetime.UTC)
+
+
+def make_recurring(rrule: str) -> RecurringEvent:
+    """Create a recurring half hour event that starts at START."""
+    return RecurringEvent(
+        CalendarEvent(
+            uid="standup",
+            summary="Standup",
+            start=START,
+            end=START + datetime.timedelta(minutes=30),
+            rrule=rrule,
+        )
+    )
+
+
+def starts(events: list[CalendarEvent]) -> list[datetime.date]:
+    """Return the start of each event."""
+    return [event.start for event in events]
+
+
+@pytest.mark.parametrize(
+    ("rrule", "expected"),
+    [
+        ("FREQ=DAILY", RecurrenceRule(freq="DAILY")),
+        (
+            "RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=FR,MO",
+            RecurrenceRule(freq="WEEKLY", interval=2, by_weekday=(0, 4)),
+        ),
+        (
+            "FREQ=MONTHLY;COUNT=3",
+            RecurrenceRule(freq="MONTHLY", count=3),
+        ),
+        (
+            "FREQ=YEARLY;UNTIL=20300101T000000Z",
+            RecurrenceRule(
+                freq="YEARLY",
+                until=datetime.datetime(2030, 1, 1, tzinfo=datetime.UTC),
+            ),
+        ),
+    ],
+)
+def test_parse_rule(rrule: str, expected: RecurrenceRule) -> None:
+    """Test parsing supported recurrence rules."""
+    assert RecurrenceRule.parse(rrule) == expected
+
+
+@pytest.mark.parametrize(
+    "rrule",
+    ["", "FREQ=HOURLY", "FREQ=DAILY;BYDAY=MO", "FREQ=DAILY;BYMONTH=1", "FREQ"],
+)
+def test_parse_invalid_rule(rrule: str) -> None:
+    """Test parsing unsupported recurrence rules."""
+    with pytest.raises(ValueError):
+        RecurrenceRule.parse(rrule)
+
+
+def test_daily_range() -> None:
+    """Test that a long running series is expanded only for the range."""
+    recurring = make_recurring("FREQ=DAILY;UNTIL=20281231")
+
+    start = datetime.datetime(2027, 6, 1, tzinfo=datetime.UTC)
+    events = recurring.range(start, start + datetime.timedelta(days=3))
+    assert starts(events) == [
+        datetime.datetime(2027, 6, day, 9, 0, tzinfo=datetime.UTC) for day in (1, 2, 3)
+    ]
+    assert events[0].uid == "standup"
+    assert events[0].recurrence_id == "20270601T090000"
+    # The same range is served from the cache
+    assert recurring.range(start, start + datetime.timedelta(days=3)) is events
+
+    assert (
+        recurring.range(
+            datetime.datetime(2029, 1, 1, tzinfo=datetime.UTC),
+            datetime.datetime(2029, 2, 1, tzinfo=datetime.UTC),
+        )
+        == []
+    )
+
+
+def test_date_until_is_inclusive() -> None:
+    """Test that a series with a date UNTIL includes that day."""
+    recurring = make_recurring("FREQ=DAILY;UNTIL=20281231")
+
+    events = recurring.range(
+        datetime.datetime(2028, 12, 30, tzinfo=datetime.UTC),
+        datetime.datetime(2029, 1, 5, tzinfo=datetime.UTC),
+    )
+    assert starts(events) == [
+        datetime.datetime(2028, 12, 30, 9, 0, tzinfo=datetime.UTC),
+        datetime.datetime(2028, 12, 31, 9, 0, tzinfo=datetime.UTC),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("rrule", "last"),
+    [
+        ("FREQ=DAILY;COUNT=1800", datetime.datetime(2028, 12, 4, 9, 0)),
+        ("FREQ=WEEKLY;INTERVAL=2;COUNT=100", datetime.datetime(2027, 10, 18, 9, 0)),
+        ("FREQ=WEEKLY;BYDAY=SU,TU;COUNT=100", datetime.datetime(2024, 12, 15, 9, 0)),
+        ("FREQ=MONTHLY;COUNT=60", datetime.datetime(2028, 12, 1, 9, 0)),
+    ],
+)
+def test_count_far_from_start(rrule: str, last: datetime.datetime) -> None:
+    """Test the end of a counted series is found when queried near the end."""
+    recurring = make_recurring(rrule)
+    last = last.replace(tzinfo=datetime.UTC)
+
+    events = recurring.range(
+        last - datetime.timedelta(hours=1), last + datetime.timedelta(days=400)
+    )
+    assert starts(events) == [last]
+    assert recurring.active_or_next(last).start == last
+    assert recurring.active_or_next(last + datetime.timedelta(hours=1)) is None
+
+
+def test_weekly_count() -> None:
+    """Test a weekly series limited by a count of occurrences."""
+    recurring = make_recurring("FREQ=WEEKLY;BYDAY=MO,WE;COUNT=3")
+
+    events = recurring.range(START, START + datetime.timedelta(days=30))
+    assert starts(events) == [
+        START,
+        START + datetime.timedelta(days=2),
+        START + datetime.timedelta(days=7),
+    ]
+
+
+def test_monthly_skips_missing_days() -> None:
+    """Test that monthly occurrences on days missing in a month are skipped."""
+    start = datetime.date(2024, 1, 31)
+    recurring = RecurringEvent(
+        CalendarEvent(
+            summary="Rent",
+            start=start,
+            end=start + datetime.timedelta(days=1),
+            uid="rent",
+            rrule="FREQ=MONTHLY;COUNT=3",
+        )
+    )
+
+    events = recurring.range(
+        datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC),
+        datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC),
+    )
+    assert starts(events) == [
+        datetime.date(2024, 1, 31),
+        datetime.date(2024, 3, 31),
+        datetime.date(2024, 5, 31),
+    ]
+
+
+def test_active_or_next_and_exclude() -> None:
+    """Test finding the next occurrence and excluding occurrences."""
+    recurring = make_recurring("FREQ=DAILY")
+
+    now = START + datetime.timedelta(days=100, minutes=10)
+    assert recurring.active_or_next(now).start == START + datetime.timedelta(days=100)
+
+    recurring.exclude("20240410T090000")
+    assert recurring.active_or_next(now).start == START + datetime.timedelta(days=101)
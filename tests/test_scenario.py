@@ -0,0 +1,172 @@
+"""Test applying device states and scenarios to a Synthetic Home."""
+
+import pathlib
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.const import Platform
+from homeassistant.auth.models import User
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, Unauthorized
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.synthetic_home.const import DOMAIN
+
+from .conftest import FIXTURES
+
+TEST_ENTITY = "fan.counter_fan"
+
+
+@pytest.fixture(name="platforms")
+def mock_platforms() -> list[Platform]:
+    """Set up fan platform."""
+    return [Platform.FAN]
+
+
+@pytest.mark.parametrize(("config_yaml_fixture"), [f"{FIXTURES}/fan-off.yaml"])
+async def test_set_device_state(
+    hass: HomeAssistant, setup_integration: None, config_entry: MockConfigEntry
+) -> None:
+    """Test applying a named device state to a device."""
+
+    state = hass.states.get(TEST_ENTITY)
+    assert state
+    assert state.state == "off"
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "set_device_state",
+        service_data={
+            "config_entry_id": config_entry.entry_id,
+            "device": "counter_fan",
+            "device_type": "fan-oscilating",
+            "device_state": "oscillating",
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {"changed_entities": [TEST_ENTITY]}
+    state = hass.states.get(TEST_ENTITY)
+    assert state
+    assert state.state == "on"
+    assert state.attributes["oscillating"]
+
+    with pytest.raises(HomeAssistantError, match="no devices"):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_device_state",
+            service_data={
+                "config_entry_id": config_entry.entry_id,
+                "device": "unknown_device",
+                "device_type": "fan-oscilating",
+                "device_state": "on",
+            },
+            blocking=True,
+        )
+
+
+@pytest.mark.parametrize(("config_yaml_fixture"), [f"{FIXTURES}/fan-off.yaml"])
+async def test_load_scenario(
+    hass: HomeAssistant, setup_integration: None, config_entry: MockConfigEntry
+) -> None:
+    """Test applying the entity states of an inventory file."""
+
+    scenario = pathlib.Path(f"{FIXTURES}/fan-on.yaml").read_text()
+    with patch("synthetic_home.inventory.read_config_content", return_value=scenario):
+        response = await hass.services.async_call(
+            DOMAIN,
+            "load_scenario",
+            service_data={
+                "config_entry_id": config_entry.entry_id,
+                "config_filename": "scenario.yaml",
+            },
+            blocking=True,
+            return_response=True,
+        )
+    assert response == {"changed_entities": [TEST_ENTITY]}
+    state = hass.states.get(TEST_ENTITY)
+    assert state
+    assert state.state == "on"
+
+    # Applying the same scenario again does not write any state
+    with patch("synthetic_home.inventory.read_config_content", return_value=scenario):
+        response = await hass.services.async_call(
+            DOMAIN,
+            "load_scenario",
+            service_data={
+                "config_entry_id": config_entry.entry_id,
+                "config_filename": "scenario.yaml",
+            },
+            blocking=True,
+            return_response=True,
+        )
+    assert response == {"changed_entities": []}
+
+
+@pytest.mark.parametrize(("config_yaml_fixture"), [f"{FIXTURES}/fan-off.yaml"])
+@pytest.mark.parametrize(
+    "config_filename", ["/etc/passwd", "../secrets.yaml", "scenarios/../../x.yaml"]
+)
+async def test_load_scenario_outside_config_dir(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+    config_filename: str,
+) -> None:
+    """Test that scenarios outside of the config directory are rejected."""
+
+    with (
+        patch("synthetic_home.inventory.read_config_content") as mock_read,
+        pytest.raises(HomeAssistantError, match="not in the config directory"),
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            "load_scenario",
+            service_data={
+                "config_entry_id": config_entry.entry_id,
+                "config_filename": config_filename,
+            },
+            blocking=True,
+        )
+    assert not mock_read.called
+
+
+@pytest.mark.parametrize(("config_yaml_fixture"), [f"{FIXTURES}/fan-off.yaml"])
+async def test_services_require_admin(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+    hass_read_only_user: User,
+) -> None:
+    """Test that services which change the home require an admin user."""
+
+    context = Context(user_id=hass_read_only_user.id)
+    with pytest.raises(Unauthorized):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_device_state",
+            service_data={
+                "config_entry_id": config_entry.entry_id,
+                "device": "counter_fan",
+                "device_type": "fan-oscilating",
+                "device_state": "oscillating",
+            },
+            blocking=True,
+            context=context,
+        )
+    with pytest.raises(Unauthorized):
+        await hass.services.async_call(
+            DOMAIN,
+            "load_scenario",
+            service_data={
+                "config_entry_id": config_entry.entry_id,
+                "config_filename": "scenario.yaml",
+            },
+            blocking=True,
+            context=context,
+        )
+    state = hass.states.get(TEST_ENTITY)
+    assert state
+    assert state.state == "off"
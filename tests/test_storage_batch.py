@@ -0,0 +1,38 @@
+"""Tests for generating storage directories for many homes."""
+
+import json
+import pathlib
+
+from script.storage.batch import generate_all
+from script.storage.runner import shared_storage
+
+from .conftest import FIXTURES
+
+HOMES = {
+    "light-example": "light.family_room",
+    "fan-example": "fan.counter_fan",
+}
+
+
+def test_generate_all(tmp_path: pathlib.Path) -> None:
+    """Test that each home is written to its own storage directory."""
+    home_configs = [pathlib.Path(f"{FIXTURES}/{name}.yaml") for name in HOMES]
+
+    assert generate_all(home_configs, tmp_path, workers=1) == 0
+
+    for name, entity_id in HOMES.items():
+        storage = tmp_path / name / ".storage"
+        config_entries = json.loads((storage / "core.config_entries").read_text())
+        assert [entry["domain"] for entry in config_entries["data"]["entries"]] == [
+            "synthetic_home"
+        ]
+        entity_registry = json.loads((storage / "core.entity_registry").read_text())
+        entity_ids = {
+            entity["entity_id"] for entity in entity_registry["data"]["entities"]
+        }
+        # Homes in a batch do not share registries
+        assert entity_ids & set(HOMES.values()) == {entity_id}
+
+    # Stores of integrations set up once are written for every home
+    layouts = [shared_storage(tmp_path / name).keys() for name in HOMES]
+    assert layouts[0] == layouts[1]
@@ -0,0 +1,77 @@
+"""Tests for the Synthetic Home sensor time series generator."""
+
+import datetime
+import zoneinfo
+
+import pytest
+
+from custom_components.synthetic_home.timeseries import (
+    PRESETS,
+    SensorProfile,
+    generate_series,
+)
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("humidity", PRESETS["humidity"]),
+        ({"preset": "temperature", "mean": 18}, SensorProfile(18, 2.0, 16, 0.2)),
+        ({"mean": 5, "cumulative": True}, SensorProfile(mean=5, cumulative=True)),
+    ],
+)
+def test_parse_profile(value: str | dict, expected: SensorProfile) -> None:
+    """Test parsing profiles from presets and fields."""
+    assert SensorProfile.parse(value) == expected
+
+
+@pytest.mark.parametrize("value", ["unknown", {"mean": 1, "unknown": 2}])
+def test_parse_invalid_profile(value: str | dict) -> None:
+    """Test parsing invalid profiles."""
+    with pytest.raises(ValueError):
+        SensorProfile.parse(value)
+
+
+@pytest.mark.parametrize(
+    "tzinfo", [datetime.UTC, zoneinfo.ZoneInfo("US/Pacific")], ids=["utc", "pacific"]
+)
+def test_generate_series(tzinfo: datetime.tzinfo) -> None:
+    """Test generating a daily cycle and a counter for many sensors at once."""
+    pytest.importorskip("numpy")
+
+    # The daily cycle follows the time zone of the start
+    start = START.replace(tzinfo=tzinfo)
+    cycle = SensorProfile(mean=10, amplitude=2, peak_hour=15)
+    counter = SensorProfile(mean=1, cumulative=True, initial=100)
+    series = generate_series(
+        [cycle, counter] * 50,
+        start,
+        start + datetime.timedelta(days=7),
+        datetime.timedelta(hours=1),
+    )
+    assert series.values.shape == (100, 7 * 24)
+    assert series.timestamps[1] - series.timestamps[0] == 3600
+
+    assert series.values[0, 15] == pytest.approx(12)
+    assert series.values[0, 3] == pytest.approx(8)
+    assert series.values[1, :3] == pytest.approx([101, 102, 103])
+
+
+def test_noise_and_limits() -> None:
+    """Test that noise is reproducible and values stay within the limits."""
+    np = pytest.importorskip("numpy")
+
+    profiles = [PRESETS["humidity"], PRESETS["energy"]]
+    end = START + datetime.timedelta(days=30)
+    step = datetime.timedelta(minutes=5)
+    series = generate_series(profiles, START, end, step, seed=1)
+
+    humidity, energy = series.values
+    assert humidity.min() >= 0
+    assert humidity.max() <= 100
+    assert (np.diff(energy) >= 0).all()
+    assert generate_series(profiles, START, end, step, seed=1).values == pytest.approx(
+        series.values
+    )
@@ -2,6 +2,7 @@
 
 import pytest
 from typing import Any
+from unittest.mock import ANY
 
 from homeassistant.const import Platform
 from homeassistant.components.todo import (
@@ -10,6 +11,8 @@ from homeassistant.components.todo import (
 from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import HomeAssistant
 
+from custom_components.synthetic_home.const import DOMAIN
+
 from .conftest import FIXTURES
 
 
@@ -53,15 +56,18 @@ async def test_todo_list(
         "todo.tasks": {
             "items": [
                 {
+                    "uid": "0",
                     "summary": "Repair the garage door",
                     "status": "needs_action",
                 },
                 {
+                    "uid": "1",
                     "summary": "Homework",
                     "description": "Chemistry and English assignments",
                     "status": "needs_action",
                 },
                 {
+                    "uid": "2",
                     "summary": "Buy gift for Liza",
                     "status": "completed",
                 },
@@ -89,22 +95,90 @@ async def test_todo_list(
         "todo.tasks": {
             "items": [
                 {
+                    "uid": "0",
                     "summary": "Repair the garage door",
                     "status": "needs_action",
                 },
                 {
+                    "uid": "1",
                     "summary": "Homework",
                     "description": "Chemistry and English assignments",
                     "status": "needs_action",
                 },
                 {
+                    "uid": "2",
                     "summary": "Buy gift for Liza",
                     "status": "completed",
                 },
                 {
+                    "uid": ANY,
                     "summary": "New item",
                     "status": "needs_action",
                 },
             ]
         }
     }
+
+    await hass.services.async_call(
+        TODO_DOMAIN,
+        "remove_item",
+        service_data={
+            ATTR_ENTITY_ID: test_entity,
+            "item": ["Homework", "New item"],
+        },
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(test_entity)
+    assert state
+    assert state.state == "1"
+
+    response = await get_tasks()
+    assert response == {
+        "todo.tasks": {
+            "items": [
+                {
+                    "uid": "0",
+                    "summary": "Repair the garage door",
+                    "status": "needs_action",
+                },
+                {
+                    "uid": "2",
+                    "summary": "Buy gift for Liza",
+                    "status": "completed",
+                },
+            ]
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    ("config_yaml_fixture", "test_entity"),
+    [(f"{FIXTURES}/todo-list-example.yaml", "todo.tasks")],
+)
+async def test_reload_keeps_items(
+    hass: HomeAssistant, setup_integration: None, test_entity: str
+) -> None:
+    """Test that an unchanged todo list keeps its items when reloaded."""
+
+    await hass.services.async_call(
+        TODO_DOMAIN,
+        "add_item",
+        service_data={
+            ATTR_ENTITY_ID: test_entity,
+            "item": "New item",
+        },
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get(test_entity)
+    assert state
+    assert state.state == "3"
+
+    await hass.services.async_call(DOMAIN, "reload", blocking=True)
+    await hass.async_block_till_done()
+
+    state = hass.states.get(test_entity)
+    assert state
+    assert state.state == "3"
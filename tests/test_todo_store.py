@@ -0,0 +1,73 @@
+"""Tests for the Synthetic Home to-do item store."""
+
+import pytest
+
+from homeassistant.components.todo import TodoItem, TodoItemStatus
+
+from custom_components.synthetic_home.todo_store import TodoStore
+
+
+def make_item(uid: str) -> TodoItem:
+    """Create a to-do item with the uid."""
+    return TodoItem(uid=uid, summary=f"Item {uid}", status=TodoItemStatus.NEEDS_ACTION)
+
+
+def uids(store: TodoStore) -> list[str | None]:
+    """Return the uids of the items in list order."""
+    return [item.uid for item in store]
+
+
+def test_add_and_update() -> None:
+    """Test adding and updating items."""
+    store = TodoStore([make_item("a"), make_item("b")])
+    store.add(TodoItem(summary="New item"))
+    assert len(store) == 3
+    assert uids(store)[:2] == ["a", "b"]
+    assert uids(store)[2] is not None
+
+    with pytest.raises(ValueError, match="already exists"):
+        store.add(make_item("a"))
+
+    items = store.items()
+    assert store.items() is items
+    store.update(TodoItem(uid="a", summary="Changed"))
+    assert store.items() is not items
+    assert [item.summary for item in store][:2] == ["Changed", "Item b"]
+
+    with pytest.raises(KeyError):
+        store.update(make_item("missing"))
+
+
+def test_delete() -> None:
+    """Test deleting a batch of items."""
+    store = TodoStore(make_item(uid) for uid in "abcde")
+
+    store.delete(["a", "c", "e"])
+    assert uids(store) == ["b", "d"]
+
+    with pytest.raises(KeyError):
+        store.delete(["b", "missing"])
+    assert uids(store) == ["b", "d"]
+
+    store.delete(["b", "d"])
+    assert uids(store) == []
+    store.add(make_item("f"))
+    assert uids(store) == ["f"]
+
+
+def test_move() -> None:
+    """Test moving items after another item or to the start of the list."""
+    store = TodoStore(make_item(uid) for uid in "abcd")
+
+    store.move("d")
+    assert uids(store) == ["d", "a", "b", "c"]
+    store.move("d", "c")
+    assert uids(store) == ["a", "b", "c", "d"]
+    store.move("a", "b")
+    assert uids(store) == ["b", "a", "c", "d"]
+    store.move("a", "a")
+    assert uids(store) == ["b", "a", "c", "d"]
+
+    with pytest.raises(KeyError):
+        store.move("a", "missing")
+    assert store == TodoStore(make_item(uid) for uid in "bacd")
@@ -8,6 +8,11 @@ from homeassistant.components.weather import (
 )
 from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import async_get_platforms
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.synthetic_home.const import DOMAIN
 
 from .conftest import FIXTURES
 
@@ -101,3 +106,41 @@ async def test_weather_entity(
         ("rainy", 10.0, True),
         ("cloudy", 15.6, False),
     ]
+
+
+@pytest.mark.parametrize(
+    ("config_yaml_fixture", "test_entity"),
+    [(f"{FIXTURES}/weather-example.yaml", TEST_ENTITY)],
+)
+async def test_forecast_cache(
+    hass: HomeAssistant,
+    setup_integration: None,
+    config_entry: MockConfigEntry,
+    test_entity: str,
+) -> None:
+    """Test that forecasts are reused until the clock moves to another day."""
+    await hass.services.async_call(
+        DOMAIN,
+        "set_clock_speed",
+        service_data={"config_entry_id": config_entry.entry_id, "speed": 0},
+        blocking=True,
+    )
+    (platform,) = [
+        platform
+        for platform in async_get_platforms(hass, DOMAIN)
+        if platform.domain == WEATHER_DOMAIN
+    ]
+    entity = platform.entities[test_entity]
+
+    forecast = await entity.async_forecast_daily()
+    assert await entity.async_forecast_daily() is forecast
+
+    await hass.services.async_call(
+        DOMAIN,
+        "advance_clock",
+        service_data={"config_entry_id": config_entry.entry_id, "duration": "24:00"},
+        blocking=True,
+    )
+    next_forecast = await entity.async_forecast_daily()
+    assert next_forecast is not forecast
+    assert next_forecast[0]["datetime"] == forecast[1]["datetime"]